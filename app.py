@@ -1,45 +1,144 @@
 import os
-from flask import Flask, redirect, url_for
+import tempfile
+from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
-from flask_login import LoginManager, current_user
-
-app = Flask(__name__)
-app.secret_key = os.environ.get("FLASK_SECRET_KEY")
-app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-    "pool_recycle": 300,
-    "pool_pre_ping": True,
-}
-
-# Set the environment based on the FLASK_ENV variable
-app.config['ENV'] = os.environ.get('FLASK_ENV', 'production')
-app.config['DEBUG'] = app.config['ENV'] == 'development'
-
-db = SQLAlchemy(app)
-migrate = Migrate(app, db)
-login_manager = LoginManager(app)
-login_manager.login_view = 'login'
+from flask_login import LoginManager
+from flask_wtf.csrf import CSRFProtect
+
+db = SQLAlchemy()
+migrate = Migrate()
+csrf = CSRFProtect()
+login_manager = LoginManager()
+login_manager.login_view = 'main.login'
 login_manager.login_message_category = 'info'
 
-@login_manager.user_loader
-def load_user(user_id):
-    from models import User
-    return User.query.get(int(user_id))
+def load_config(app):
+    app.secret_key = os.environ.get("FLASK_SECRET_KEY")
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_recycle": 300,
+        "pool_pre_ping": True,
+    }
+    app.config["STATS_CACHE_TTL"] = int(os.environ.get("STATS_CACHE_TTL", 30))
+    app.config["PDF_CACHE_DIR"] = os.environ.get("PDF_CACHE_DIR", os.path.join(tempfile.gettempdir(), "bmm_pdf_cache"))
+    app.config["PDF_CACHE_MAX_BYTES"] = int(os.environ.get("PDF_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+    app.config["PDF_WORKERS"] = int(os.environ.get("PDF_WORKERS", 2))
+    app.config["PDF_BATCH_PROCESSES"] = int(os.environ.get("PDF_BATCH_PROCESSES", os.cpu_count() or 1))
+    app.config["PDF_BATCH_MAX_ORDERS"] = int(os.environ.get("PDF_BATCH_MAX_ORDERS", 5000))
+    app.config["NOTIFICATION_BACKEND"] = os.environ.get("NOTIFICATION_BACKEND", "local")
+    # "poll" has dashboards re-check /api/notifications, which answers 304
+    # until something changes. "stream" pushes over SSE, but every open tab
+    # then holds a request thread, so only use it with an async worker class
+    # (e.g. GUNICORN_WORKER_CLASS=gevent) serving /notifications/stream
+    app.config["NOTIFICATION_TRANSPORT"] = os.environ.get("NOTIFICATION_TRANSPORT", "poll")
+    app.config["NOTIFICATION_POLL_INTERVAL"] = int(os.environ.get("NOTIFICATION_POLL_INTERVAL", 15))
+    app.config["NOTIFICATION_STREAM_TIMEOUT"] = int(os.environ.get("NOTIFICATION_STREAM_TIMEOUT", 300))
+    app.config["USER_CACHE_TTL"] = int(os.environ.get("USER_CACHE_TTL", 60))
+    app.config["PASSWORD_HASH_METHOD"] = os.environ.get("PASSWORD_HASH_METHOD", "scrypt")
+    app.config["PASSWORD_HASH_WORKERS"] = int(os.environ.get("PASSWORD_HASH_WORKERS", 2))
+    app.config["PASSWORD_HASH_MAX_PENDING"] = int(os.environ.get("PASSWORD_HASH_MAX_PENDING", 32))
+    app.config["PASSWORD_HASH_TIMEOUT"] = float(os.environ.get("PASSWORD_HASH_TIMEOUT", 10))
+    app.config["LOG_LEVEL"] = os.environ.get("LOG_LEVEL", "INFO").upper()
+    # Per-logger overrides, e.g. "sqlalchemy.engine=INFO,pdf_jobs=DEBUG"
+    app.config["LOG_LEVELS"] = os.environ.get("LOG_LEVELS", "")
+    app.config["LOG_FORMAT"] = os.environ.get("LOG_FORMAT", "json")
+    app.config["LOG_QUEUE_SIZE"] = int(os.environ.get("LOG_QUEUE_SIZE", 10000))
+    app.config["LOG_SAMPLE_RATE"] = float(os.environ.get("LOG_SAMPLE_RATE", 0.1))
+    app.config["LOG_SAMPLE_LEVEL"] = os.environ.get("LOG_SAMPLE_LEVEL", "DEBUG").upper()
+    app.config["METRICS_ENABLED"] = os.environ.get("METRICS_ENABLED", "true").lower() in ("1", "true")
+    app.config["METRICS_DIR"] = os.environ.get("METRICS_DIR", os.path.join(tempfile.gettempdir(), "bmm_metrics"))
+    app.config["METRICS_FLUSH_INTERVAL"] = float(os.environ.get("METRICS_FLUSH_INTERVAL", 5))
+    # /metrics answers 404 until a token is set; scrapers send it as a bearer token
+    app.config["METRICS_TOKEN"] = os.environ.get("METRICS_TOKEN")
+    app.config["PROFILING_ENABLED"] = os.environ.get("PROFILING_ENABLED", "").lower() in ("1", "true")
+    app.config["PROFILE_DIR"] = os.environ.get("PROFILE_DIR", os.path.join(tempfile.gettempdir(), "bmm_profiles"))
+    app.config["ADMIN_USERNAMES"] = [u.strip() for u in os.environ.get("ADMIN_USERNAMES", "").split(",") if u.strip()]
+    # "memory" keeps fragments per worker; "disk" shares them through FRAGMENT_CACHE_DIR
+    app.config["FRAGMENT_CACHE_BACKEND"] = os.environ.get("FRAGMENT_CACHE_BACKEND", "memory")
+    app.config["FRAGMENT_CACHE_DIR"] = os.environ.get("FRAGMENT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "bmm_fragments"))
+    app.config["FRAGMENT_CACHE_TTL"] = int(os.environ.get("FRAGMENT_CACHE_TTL", 300))
+    app.config["FRAGMENT_CACHE_MAX_ENTRIES"] = int(os.environ.get("FRAGMENT_CACHE_MAX_ENTRIES", 256))
+    app.config["COMPRESS_ENABLED"] = os.environ.get("COMPRESS_ENABLED", "true").lower() in ("1", "true")
+    app.config["COMPRESS_MIN_SIZE"] = int(os.environ.get("COMPRESS_MIN_SIZE", 1024))
+    app.config["COMPRESS_LEVEL"] = int(os.environ.get("COMPRESS_LEVEL", 6))
+    # Closed maintenance logs and work orders older than this move to the
+    # archive tables when `flask archive` runs
+    app.config["ARCHIVE_AFTER_DAYS"] = int(os.environ.get("ARCHIVE_AFTER_DAYS", 365))
+    app.config["ARCHIVE_BATCH_SIZE"] = int(os.environ.get("ARCHIVE_BATCH_SIZE", 1000))
+    app.config["SQL_QUERY_COUNTER"] = os.environ.get("SQL_QUERY_COUNTER", "").lower() in ("1", "true")
+    # FlaskForms check their own token; views without a form opt in with
+    # auth.csrf_required
+    app.config["WTF_CSRF_CHECK_DEFAULT"] = False
+
+    # Set the environment based on the FLASK_ENV variable
+    app.config['ENV'] = os.environ.get('FLASK_ENV', 'production')
+    app.config['DEBUG'] = app.config['ENV'] == 'development'
+
+def create_app(config=None):
+    """Build the application.
+
+    The schema is owned by Alembic (``flask db upgrade``, or ``flask init-db``
+    for a fresh database), so nothing here touches the database. PDF, export
+    and import modules are imported by the views that need them.
+    """
+    app = Flask(__name__)
+    load_config(app)
+    if config:
+        app.config.update(config)
+
+    from json_provider import FastJSONProvider
+    app.json = FastJSONProvider(app)
+
+    from log_config import configure_logging
+    configure_logging(app)
+
+    from metrics import configure_pool_timing
+    configure_pool_timing(app)
 
-@app.route('/')
-def root():
-    if current_user.is_authenticated:
-        return redirect(url_for('dashboard'))
-    return redirect(url_for('login'))
+    db.init_app(app)
+    migrate.init_app(app, db)
+    csrf.init_app(app)
+    login_manager.init_app(app)
+
+    from query_counter import init_query_counter
+    init_query_counter(app)
+
+    from metrics import init_metrics
+    init_metrics(app)
+
+    from profiler import init_profiler
+    init_profiler(app)
 
-with app.app_context():
     import models
-    db.create_all()
+    import tenancy
+    from http_cache import init_http_cache
+    init_http_cache(app)
+
+    from assets import init_assets
+    init_assets(app)
+
+    from routes import bp
+    app.register_blueprint(bp)
 
-from routes import *
+    from commands import register_commands
+    register_commands(app)
+
+    return app
+
+@login_manager.user_loader
+def load_user(user_id):
+    # Served from a short-lived per-process snapshot so authenticated requests
+    # don't pay a users SELECT each time
+    from auth import load_user as load_cached_user
+    from tenancy import set_current_company
+    user = load_cached_user(user_id)
+    if user is not None:
+        # Every query for the rest of the request is scoped to this company
+        set_current_company(user.company_id)
+    return user
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port)
+    create_app().run(host="0.0.0.0", port=port)
@@ -0,0 +1,96 @@
+import logging
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import and_, delete, func, insert, literal, or_, select
+from app import db
+from models import ArchivedMaintenanceLog, ArchivedWorkOrder, MaintenanceLog, Notification, WorkOrder
+
+logger = logging.getLogger(__name__)
+
+LOG_COLUMNS = ('id', 'company_id', 'date', 'lot_number', 'contact_details', 'maintenance_class', 'description',
+               'allocation', 'created_at')
+ORDER_COLUMNS = ('id', 'company_id', 'maintenance_log_id', 'status', 'assigned_to', 'scheduled_date',
+                 'completed_date', 'notes', 'priority', 'is_critical', 'created_at', 'version')
+
+def archive_cutoff(older_than_days):
+    return datetime.utcnow().date() - timedelta(days=older_than_days)
+
+def closed_before(cutoff):
+    # Closed means the work order was completed before the cutoff, or the log
+    # never got one and is itself older than the cutoff. Orders completed
+    # before completed_date was stamped fall back to their scheduled date.
+    return or_(
+        and_(WorkOrder.status == 'Completed',
+             func.coalesce(WorkOrder.completed_date, WorkOrder.scheduled_date) < cutoff),
+        and_(WorkOrder.id.is_(None), MaintenanceLog.date < cutoff),
+    )
+
+def archivable_log_ids(cutoff, limit, after_id=0):
+    return db.session.scalars(
+        select(MaintenanceLog.id).outerjoin(WorkOrder)
+        .where(MaintenanceLog.id > after_id, closed_before(cutoff))
+        .order_by(MaintenanceLog.id).limit(limit)
+    ).all()
+
+def count_archivable(cutoff):
+    return db.session.scalar(
+        select(func.count()).select_from(MaintenanceLog).outerjoin(WorkOrder).where(closed_before(cutoff))
+    )
+
+def _copy(source, target, columns, criteria, archived_at):
+    # Python-side column defaults don't apply to INSERT ... SELECT
+    db.session.execute(insert(target).from_select(
+        columns + ('archived_at',),
+        select(*[getattr(source, column) for column in columns], literal(archived_at)).where(criteria)
+    ))
+
+def archive_batch(log_ids):
+    """Move the given logs, their work orders and notifications in one transaction.
+
+    Either the whole batch moves or none of it, so an interrupted run leaves
+    every record in exactly one place.
+    """
+    archived_at = datetime.utcnow()
+    order_ids = select(WorkOrder.id).where(WorkOrder.maintenance_log_id.in_(log_ids)).scalar_subquery()
+    _copy(MaintenanceLog, ArchivedMaintenanceLog, LOG_COLUMNS, MaintenanceLog.id.in_(log_ids), archived_at)
+    _copy(WorkOrder, ArchivedWorkOrder, ORDER_COLUMNS, WorkOrder.maintenance_log_id.in_(log_ids), archived_at)
+
+    # Notifications only flag open work, so they are dropped rather than kept
+    options = {'synchronize_session': False}
+    notifications = db.session.execute(
+        delete(Notification).where(Notification.work_order_id.in_(order_ids)).execution_options(**options)
+    ).rowcount
+    orders = db.session.execute(
+        delete(WorkOrder).where(WorkOrder.maintenance_log_id.in_(log_ids)).execution_options(**options)
+    ).rowcount
+    logs = db.session.execute(
+        delete(MaintenanceLog).where(MaintenanceLog.id.in_(log_ids)).execution_options(**options)
+    ).rowcount
+    db.session.commit()
+    return {'maintenance_logs': logs, 'work_orders': orders, 'notifications': notifications}
+
+def archive_closed_records(older_than_days, batch_size, max_batches=None, pause=0, progress=None):
+    """Move closed records older than ``older_than_days`` into the archive tables.
+
+    Works through the logs in id order, one transaction per batch. Each batch
+    re-checks what is still live, so a stopped run can simply be started again.
+    The work_order_daily_stats rollup keeps counting archived orders.
+    """
+    cutoff = archive_cutoff(older_than_days)
+    totals = {'batches': 0, 'maintenance_logs': 0, 'work_orders': 0, 'notifications': 0}
+    after_id = 0
+    while max_batches is None or totals['batches'] < max_batches:
+        log_ids = archivable_log_ids(cutoff, batch_size, after_id)
+        if not log_ids:
+            break
+        counts = archive_batch(log_ids)
+        after_id = log_ids[-1]
+        totals['batches'] += 1
+        for key, value in counts.items():
+            totals[key] += value
+        logger.info("Archived batch %d up to log %d: %s", totals['batches'], after_id, counts)
+        if progress:
+            progress(totals)
+        if pause:
+            time.sleep(pause)
+    return totals
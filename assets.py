@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import re
+import urllib.request
+from flask import current_app, request, url_for
+
+DIST_DIR = 'dist'
+MANIFEST_PATH = 'dist/manifest.json'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+SOURCE_MAP_COMMENT = re.compile(r'^\s*(//# sourceMappingURL=.*|/\*# sourceMappingURL=.*\*/)\s*$', re.MULTILINE)
+
+# Third-party files committed under static/vendor, so pages never load
+# anything from a CDN. `flask assets vendor --force` refreshes them from these
+# pinned upstream URLs after the version in the name is bumped.
+VENDOR = {
+    'vendor/bootstrap-5.3.0.min.css': 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css',
+    'vendor/jquery-3.6.0.min.js': 'https://code.jquery.com/jquery-3.6.0.min.js',
+    'vendor/popper-2.11.8.min.js': 'https://cdn.jsdelivr.net/npm/@popperjs/core@2.11.8/dist/umd/popper.min.js',
+    'vendor/bootstrap-5.3.0.min.js': 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.min.js',
+    'vendor/chart-4.4.0.umd.min.js': 'https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js',
+    'vendor/select2-4.1.0-rc.0.min.css': 'https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/dist/css/select2.min.css',
+    'vendor/select2-4.1.0-rc.0.min.js': 'https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/dist/js/select2.min.js',
+}
+
+# Bundle name -> files under static/, concatenated in order. Libraries and
+# our own code are bundled apart so a change to one keeps the other cached.
+BUNDLES = {
+    'vendor.css': ['vendor/bootstrap-5.3.0.min.css'],
+    'app.css': ['css/custom.css'],
+    'vendor.js': ['vendor/jquery-3.6.0.min.js', 'vendor/popper-2.11.8.min.js', 'vendor/bootstrap-5.3.0.min.js'],
+    'app.js': ['js/forms.js'],
+    'chart.js': ['vendor/chart-4.4.0.umd.min.js'],
+    'select2.css': ['vendor/select2-4.1.0-rc.0.min.css'],
+    'select2.js': ['vendor/select2-4.1.0-rc.0.min.js'],
+    'dashboard.js': ['js/dashboard.js'],
+    'work_order.js': ['js/work_order.js'],
+    'maintenance_log.js': ['js/maintenance_log.js'],
+    'company_setup.js': ['js/company_setup.js'],
+    'search.js': ['js/search.js'],
+}
+
+def fetch_vendor_files(static_folder, force=False, timeout=30):
+    fetched = []
+    for path, url in VENDOR.items():
+        target = os.path.join(static_folder, path)
+        if os.path.exists(target) and not force:
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            content = response.read()
+        with open(target, 'wb') as f:
+            f.write(content)
+        fetched.append(path)
+    return fetched
+
+def _minify(source, text):
+    if source.endswith(('.min.js', '.min.css')):
+        # Source maps aren't shipped, and the comment would point next to the bundle
+        return SOURCE_MAP_COMMENT.sub('', text)
+    if source.endswith('.css'):
+        import rcssmin
+        return rcssmin.cssmin(text)
+    import rjsmin
+    return rjsmin.jsmin(text)
+
+def build_bundles(static_folder):
+    """Write minified, content-hashed bundles and their manifest to static/dist."""
+    missing = sorted({source for sources in BUNDLES.values() for source in sources
+                      if not os.path.exists(os.path.join(static_folder, source))})
+    if missing:
+        raise FileNotFoundError(f"Missing bundle sources: {', '.join(missing)}")
+
+    dist = os.path.join(static_folder, DIST_DIR)
+    os.makedirs(dist, exist_ok=True)
+    manifest = {}
+
+    for name, sources in BUNDLES.items():
+        parts = []
+        for source in sources:
+            with open(os.path.join(static_folder, source), encoding='utf-8') as f:
+                parts.append(_minify(source, f.read()).strip())
+        # A separator keeps files without a trailing semicolon from running together
+        content = (';\n' if name.endswith('.js') else '\n').join(parts).encode('utf-8')
+
+        stem, ext = os.path.splitext(name)
+        filename = f'{stem}.{hashlib.sha256(content).hexdigest()[:12]}{ext}'
+        with open(os.path.join(dist, filename), 'wb') as f:
+            f.write(content)
+        manifest[name] = f'{DIST_DIR}/{filename}'
+
+    current = {os.path.basename(path) for path in manifest.values()} | {os.path.basename(MANIFEST_PATH)}
+    for filename in os.listdir(dist):
+        if filename not in current:
+            os.remove(os.path.join(dist, filename))
+
+    with open(os.path.join(static_folder, MANIFEST_PATH), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return manifest
+
+def load_manifest(app):
+    try:
+        with open(os.path.join(app.static_folder, MANIFEST_PATH)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def asset_urls(*bundles):
+    """URLs to include for ``bundles``, in order.
+
+    Built bundles resolve through the manifest to one fingerprinted file each;
+    otherwise the sources are linked one by one. In debug mode the sources are
+    always linked so edits show up without a rebuild.
+    """
+    app = current_app
+    manifest = {} if app.debug else app.extensions['asset_manifest']
+    urls = []
+    for bundle in bundles:
+        if bundle in manifest:
+            urls.append(url_for('static', filename=manifest[bundle]))
+            continue
+        urls.extend(url_for('static', filename=source) for source in BUNDLES[bundle])
+    return urls
+
+def init_assets(app):
+    app.extensions['asset_manifest'] = load_manifest(app)
+    app.jinja_env.globals['asset_urls'] = asset_urls
+
+    @app.after_request
+    def cache_fingerprinted_assets(response):
+        # Fingerprinted names change with their content, so browsers can keep
+        # them without revalidating
+        if (request.endpoint == 'static' and response.status_code in (200, 304)
+                and request.view_args.get('filename', '').startswith(f'{DIST_DIR}/')):
+            response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,115 @@
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
+from werkzeug.security import generate_password_hash, check_password_hash
+from app import csrf, db
+from cache import TTLCache
+
+def csrf_required(view):
+    """Check the CSRF token of a view that doesn't validate a FlaskForm.
+
+    The token comes from the ``csrf_token`` form field or the ``X-CSRFToken``
+    header; a missing or bad one fails the request with ``CSRFError``.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_app.config['WTF_CSRF_ENABLED']:
+            csrf.protect()
+        return view(*args, **kwargs)
+    return wrapper
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password hashes are already queued."""
+
+# Column snapshots of recently seen users, keyed by id. password_hash is left
+# out, so it is only loaded when a request actually checks a password.
+user_cache = TTLCache(max_entries=1024)
+
+USER_CACHE_COLUMNS = ('id', 'company_id', 'username', 'email', 'created_at')
+
+def load_user(user_id):
+    from models import User
+
+    user_id = int(user_id)
+    state = user_cache.get(user_id)
+    if state is not None:
+        user = User(**state)
+        make_transient_to_detached(user)
+        # load=False attaches the snapshot to the session without a SELECT
+        return db.session.merge(user, load=False)
+
+    user = db.session.get(User, user_id)
+    if user is not None:
+        cache_user(user)
+    return user
+
+def cache_user(user):
+    state = {column: getattr(user, column) for column in USER_CACHE_COLUMNS}
+    user_cache.set(user.id, state, ttl=current_app.config['USER_CACHE_TTL'])
+
+def invalidate_user(user_id=None):
+    user_cache.invalidate(user_id)
+
+def _invalidate_changed_user(mapper, connection, target):
+    invalidate_user(target.id)
+
+def register_user_cache_events(user_model):
+    event.listen(user_model, 'after_update', _invalidate_changed_user)
+    event.listen(user_model, 'after_delete', _invalidate_changed_user)
+
+class PasswordHasher:
+    """Runs password hashing on a small fixed pool.
+
+    Hashing is CPU bound, so when a crew logs in at once the pool caps how many
+    hashes run in parallel and ``max_pending`` caps how many wait behind them;
+    beyond that callers get ``PasswordHasherBusy`` instead of tying up a worker.
+    """
+
+    def __init__(self, workers, max_pending, timeout):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password')
+        self.slots = threading.BoundedSemaphore(workers + max_pending)
+        self.timeout = timeout
+
+    def run(self, func, *args):
+        if not self.slots.acquire(timeout=self.timeout):
+            raise PasswordHasherBusy()
+        try:
+            future = self.executor.submit(func, *args)
+        except Exception:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        return future.result()
+
+    def hash(self, password, method):
+        return self.run(generate_password_hash, password, method)
+
+    def check(self, password_hash, password):
+        return self.run(check_password_hash, password_hash, password)
+
+_hasher = None
+_hasher_lock = threading.Lock()
+
+def get_password_hasher():
+    # Created on first use so each gunicorn worker gets its own threads after fork
+    global _hasher
+    with _hasher_lock:
+        if _hasher is None:
+            config = current_app.config
+            _hasher = PasswordHasher(
+                config['PASSWORD_HASH_WORKERS'],
+                config['PASSWORD_HASH_MAX_PENDING'],
+                config['PASSWORD_HASH_TIMEOUT']
+            )
+    return _hasher
+
+def hash_password(password):
+    return get_password_hasher().hash(password, current_app.config['PASSWORD_HASH_METHOD'])
+
+def verify_password(password_hash, password):
+    if not password_hash:
+        return False
+    return get_password_hasher().check(password_hash, password)
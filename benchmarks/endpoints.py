@@ -0,0 +1,216 @@
+"""Benchmark the app's real routes in-process through the Flask test client.
+
+Two phases run against the database in DATABASE_URL:
+  * sequential: each endpoint is requested --requests times on its own;
+  * concurrent: --concurrency threads, each with its own logged-in client,
+    drive a weighted mix of the endpoints for --duration seconds.
+
+Results (p50/p95/p99 latency and throughput) are printed and can be saved as
+JSON; pass an earlier file with --compare to see the change between commits.
+
+Usage:
+    DATABASE_URL=sqlite:////tmp/bench.db FLASK_SECRET_KEY=x \\
+        python benchmarks/endpoints.py --seed 100k --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import create_app, db
+from models import Company, User, WorkOrder
+from seed import parse_scale, seed_database
+
+USERNAME = 'benchmark'
+PASSWORD = 'benchmark-password'
+
+# name -> (weight in the concurrent mix, path); {id} is a random work order id
+ENDPOINTS = {
+    'dashboard': (3, '/dashboard'),
+    'work_order_form': (1, '/work_order'),
+    'filtered_work_orders': (3, '/filtered_work_orders?status=Pending'),
+    'filtered_work_orders_assignee': (1, '/filtered_work_orders?assigned_to=Crew+1'),
+    'work_order_pdf': (1, '/work_order_pdf/{id}'),
+    'work_order_stats': (4, '/api/work_order_stats'),
+    'work_order_trend': (2, '/api/work_order_trend?days=30'),
+}
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies, elapsed):
+    return {
+        'requests': len(latencies),
+        'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+    }
+
+
+def prepare(app, seed_logs):
+    with app.app_context():
+        if seed_logs:
+            db.drop_all()
+            db.create_all()
+            seed_database(seed_logs)
+        user = User.query.filter_by(username=USERNAME).first()
+        if not user:
+            # The benchmark user sees the first seeded company's data
+            company = Company.query.order_by(Company.id).first() or Company(name='Benchmark')
+            user = User(username=USERNAME, email='benchmark@example.com', company=company)
+            user.set_password(PASSWORD)
+            db.session.add(user)
+            db.session.commit()
+        return [row.id for row in db.session.query(WorkOrder.id).filter_by(company_id=user.company_id).limit(10000)]
+
+
+def logged_in_client(app):
+    client = app.test_client()
+    response = client.post('/login', data={'username': USERNAME, 'password': PASSWORD})
+    if response.status_code != 302:
+        raise RuntimeError(f'login failed with status {response.status_code}')
+    return client
+
+
+def timed_get(client, path):
+    started = time.perf_counter()
+    response = client.get(path)
+    response.close()
+    return (time.perf_counter() - started) * 1000, response.status_code
+
+
+def run_sequential(app, work_order_ids, requests, warmup):
+    client = logged_in_client(app)
+    rng = random.Random(1)
+    results = {}
+    for name, (_, template) in ENDPOINTS.items():
+        latencies, errors = [], 0
+        for n in range(warmup + requests):
+            elapsed, status = timed_get(client, template.format(id=rng.choice(work_order_ids)))
+            if n < warmup:
+                continue
+            latencies.append(elapsed)
+            errors += status >= 400
+        results[name] = dict(summarize(latencies, sum(latencies) / 1000), errors=errors)
+    return results
+
+
+def run_concurrent(app, work_order_ids, concurrency, duration):
+    names = [name for name, (weight, _) in ENDPOINTS.items() for _ in range(weight)]
+    latencies = {name: [] for name in ENDPOINTS}
+    errors = []
+    lock = threading.Lock()
+    clients = [logged_in_client(app) for _ in range(concurrency)]
+    start = time.monotonic()
+    deadline = start + duration
+
+    def worker(client, seed):
+        rng = random.Random(seed)
+        while time.monotonic() < deadline:
+            name = rng.choice(names)
+            elapsed, status = timed_get(client, ENDPOINTS[name][1].format(id=rng.choice(work_order_ids)))
+            with lock:
+                latencies[name].append(elapsed)
+                if status >= 400:
+                    errors.append(f'{name}: {status}')
+
+    threads = [threading.Thread(target=worker, args=(client, n)) for n, client in enumerate(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    everything = [value for values in latencies.values() for value in values]
+    return dict(
+        summarize(everything, elapsed),
+        errors=len(errors),
+        concurrency=concurrency,
+        endpoints={name: summarize(values, elapsed) for name, values in latencies.items()},
+    )
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(results, baseline):
+    print(f"\nChange vs {baseline.get('revision') or 'baseline'} (p50 / p95):")
+    for name, current in results['sequential'].items():
+        previous = baseline.get('sequential', {}).get(name)
+        if not previous:
+            continue
+        deltas = [
+            f"{(current[key] - previous[key]) / previous[key] * 100:+.1f}%" if previous[key] else 'n/a'
+            for key in ('p50_ms', 'p95_ms')
+        ]
+        print(f"  {name:<30} {deltas[0]:>8} / {deltas[1]:>8}")
+    previous = baseline.get('concurrent', {}).get('throughput_rps')
+    if previous:
+        current = results['concurrent']['throughput_rps']
+        print(f"  {'concurrent throughput':<30} {(current - previous) / previous * 100:+.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', help='wipe and seed this many maintenance logs first, e.g. 10k')
+    parser.add_argument('--requests', type=int, default=200, help='sequential requests per endpoint')
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=15)
+    parser.add_argument('--output', help='write results as JSON to this path')
+    parser.add_argument('--compare', help='earlier JSON results to compare against')
+    args = parser.parse_args()
+
+    app = create_app({'WTF_CSRF_ENABLED': False})
+    work_order_ids = prepare(app, parse_scale(args.seed) if args.seed else 0)
+    with app.app_context():
+        dialect = db.engine.dialect.name
+    if not work_order_ids:
+        sys.exit('The database has no work orders; pass --seed to generate some.')
+
+    results = {
+        'revision': git_revision(),
+        'timestamp': datetime.utcnow().isoformat(),
+        'database': dialect,
+        'sequential': run_sequential(app, work_order_ids, args.requests, args.warmup),
+        'concurrent': run_concurrent(app, work_order_ids, args.concurrency, args.duration),
+    }
+
+    print(f"{'endpoint':<30} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8}")
+    for name, r in results['sequential'].items():
+        print(f"{name:<30} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} {r['throughput_rps']:>8}")
+    c = results['concurrent']
+    print(f"\nconcurrent x{c['concurrency']}: {c['throughput_rps']} req/s  p50 {c['p50_ms']} ms  "
+          f"p95 {c['p95_ms']} ms  p99 {c['p99_ms']} ms  errors {c['errors']}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Compare query plans and timings for the hot query shapes with and without
+the secondary indexes declared in models.py.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/query_indexes.py --rows 100000
+
+The target database is wiped and reseeded, so point it at a scratch database.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.datastructures import MultiDict
+
+from app import create_app, db
+from models import Company, MaintenanceLog, WorkOrder, Notification
+from seed import seed_database
+from tenancy import scope_to_company, set_current_company
+from utils import filter_work_orders
+
+
+def seed(rows, companies=1):
+    db.drop_all()
+    db.create_all()
+    seed_database(rows, companies=companies)
+
+
+def query_shapes():
+    today = date.today()
+    return {
+        'dashboard_recent_logs': MaintenanceLog.query.order_by(MaintenanceLog.date.desc()).limit(5),
+        'dashboard_upcoming_orders': WorkOrder.query.order_by(WorkOrder.scheduled_date).limit(5),
+        'dashboard_unread_notifications': Notification.query.filter_by(is_read=False)
+            .order_by(Notification.created_at.desc(), Notification.id.desc()).limit(20),
+        'filtered_work_orders_status': filter_work_orders(WorkOrder.query, MultiDict([('status', 'Pending')]))
+            .order_by(WorkOrder.scheduled_date, WorkOrder.id).limit(51),
+        'filtered_work_orders_assignee': filter_work_orders(WorkOrder.query, MultiDict([('assigned_to', 'Crew 7')]))
+            .order_by(WorkOrder.scheduled_date, WorkOrder.id).limit(51),
+        'filtered_work_orders_critical': filter_work_orders(WorkOrder.query, MultiDict([('critical_only', 'true')]))
+            .order_by(WorkOrder.scheduled_date, WorkOrder.id).limit(51),
+        'completion_trend_30d': WorkOrder.query.filter(
+            WorkOrder.status == 'Completed',
+            WorkOrder.completed_date >= today - timedelta(days=30),
+            WorkOrder.completed_date <= today
+        ).with_entities(WorkOrder.completed_date, db.func.count()).group_by(WorkOrder.completed_date),
+        'logs_by_class': MaintenanceLog.query.filter(MaintenanceLog.maintenance_class == 'IAS')
+            .order_by(MaintenanceLog.date.desc()).limit(50),
+        'lot_number_prefix': MaintenanceLog.query.filter(db.func.lower(MaintenanceLog.lot_number).like('lot-0042%')).limit(20),
+    }
+
+
+def explain(statement, company_id):
+    dialect = db.engine.dialect
+    # Add the company filter the request would get from tenancy
+    sql = str(scope_to_company(statement, company_id).compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    prefix = 'EXPLAIN QUERY PLAN ' if dialect.name == 'sqlite' else 'EXPLAIN '
+    rows = db.session.execute(db.text(prefix + sql)).all()
+    return [str(row[-1] if dialect.name == 'sqlite' else row[0]) for row in rows]
+
+
+def time_query(query, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query.all()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def run_shapes(repeat, company_id):
+    results = {}
+    for name, query in query_shapes().items():
+        results[name] = {'plan': explain(query.statement, company_id), 'median_ms': time_query(query, repeat)}
+    return results
+
+
+def set_indexes(enabled):
+    with db.engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(db.text(f'DROP INDEX IF EXISTS {index.name}'))
+                if enabled:
+                    index.create(connection)
+    # Start from fresh connections so no cached statement plans survive
+    db.session.remove()
+    db.engine.dispose()
+    if db.engine.dialect.name == 'postgresql':
+        db.session.execute(db.text('ANALYZE'))
+        db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--companies', type=int, default=1, help='spread the rows across this many companies')
+    parser.add_argument('--output', help='write results as JSON to this path')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        seed(args.rows, args.companies)
+        # Queries run as the first company, like a signed-in request
+        company_id = db.session.query(db.func.min(Company.id)).scalar()
+        set_current_company(company_id)
+        set_indexes(False)
+        before = run_shapes(args.repeat, company_id)
+        set_indexes(True)
+        after = run_shapes(args.repeat, company_id)
+        dialect = db.engine.dialect.name
+
+    results = {'rows': args.rows, 'companies': args.companies, 'dialect': dialect, 'before': before, 'after': after}
+    for name in before:
+        print(f"{name}: {before[name]['median_ms']} ms -> {after[name]['median_ms']} ms")
+        for line in before[name]['plan']:
+            print(f"    before | {line}")
+        for line in after[name]['plan']:
+            print(f"    after  | {line}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
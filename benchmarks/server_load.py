@@ -0,0 +1,202 @@
+"""Compare gunicorn worker settings under the app's real endpoint mix.
+
+Each configuration is started as a separate gunicorn process against the
+database in DATABASE_URL, then driven by concurrent keep-alive clients for a
+fixed duration.
+
+Usage:
+    DATABASE_URL=postgresql://... FLASK_SECRET_KEY=... \
+        python benchmarks/server_load.py --seed 20000 \
+        --config sync:4:1 --config gthread:4:4 --config gthread:2:8
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+USERNAME = 'loadtest'
+PASSWORD = 'loadtest-password'
+
+# (weight, path) pairs; {id} is replaced with a random work order id
+ENDPOINT_MIX = [
+    (3, '/dashboard'),
+    (3, '/filtered_work_orders?status=Pending'),
+    (4, '/api/work_order_stats'),
+    (2, '/api/maintenance_logs/search?q=LOT-00'),
+    (2, '/filtered_reports?maintenance_class=IAS'),
+    (1, '/work_order_pdf/{id}'),
+]
+
+
+def seed_database(rows):
+    from app import create_app, db
+    from models import Company, User
+    from benchmarks.query_indexes import seed
+    with create_app().app_context():
+        seed(rows)
+        user = User(username=USERNAME, email='loadtest@example.com', company=Company.query.first())
+        user.set_password(PASSWORD)
+        db.session.add(user)
+        db.session.commit()
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+class Client:
+    def __init__(self, port):
+        self.connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        self.cookie = ''
+
+    def request(self, method, path, body=None):
+        headers = {'Cookie': self.cookie}
+        if body is not None:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        data = response.read()
+        cookie = response.getheader('Set-Cookie')
+        if cookie:
+            self.cookie = cookie.split(';', 1)[0]
+        return response.status, data
+
+    def login(self):
+        _, page = self.request('GET', '/login')
+        token = re.search(rb'name="csrf_token" type="hidden" value="([^"]+)"', page).group(1).decode()
+        body = urllib.parse.urlencode({'csrf_token': token, 'username': USERNAME, 'password': PASSWORD})
+        status, _ = self.request('POST', '/login', body)
+        if status != 302:
+            raise RuntimeError(f'login failed with status {status}')
+
+
+def drive(port, duration, concurrency, max_id):
+    paths = [path for weight, path in ENDPOINT_MIX for _ in range(weight)]
+    latencies = {path: [] for _, path in ENDPOINT_MIX}
+    errors = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def worker(seed):
+        rng = random.Random(seed)
+        client = Client(port)
+        client.login()
+        while time.monotonic() < deadline:
+            template = rng.choice(paths)
+            path = template.format(id=rng.randint(1, max_id))
+            started = time.perf_counter()
+            try:
+                status, _ = client.request('GET', path)
+            except (OSError, http.client.HTTPException) as e:
+                with lock:
+                    errors.append(str(e))
+                client = Client(port)
+                client.login()
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                if status >= 400:
+                    errors.append(f'{path}: {status}')
+                latencies[template].append(elapsed)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    everything = [value for values in latencies.values() for value in values]
+    return {
+        'requests': len(everything),
+        'errors': len(errors),
+        'throughput_rps': round(len(everything) / duration, 1),
+        'p50_ms': round(percentile(everything, 50), 1),
+        'p95_ms': round(percentile(everything, 95), 1),
+        'p99_ms': round(percentile(everything, 99), 1),
+        'endpoints': {
+            path: {'p50_ms': round(percentile(values, 50), 1), 'p95_ms': round(percentile(values, 95), 1)}
+            for path, values in latencies.items()
+        },
+    }
+
+
+def wait_for_port(port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('gunicorn exited during startup')
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection.request('GET', '/login')
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('gunicorn did not start in time')
+
+
+def run_config(config, args):
+    worker_class, workers, threads = config.split(':')
+    env = dict(os.environ,
+               PORT=str(args.port),
+               GUNICORN_WORKER_CLASS=worker_class,
+               WEB_CONCURRENCY=workers,
+               GUNICORN_THREADS=threads,
+               GUNICORN_PRELOAD='true' if args.preload else 'false')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'main:app'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_port(args.port, process)
+        return drive(args.port, args.duration, args.concurrency, args.max_id)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--config', action='append', dest='configs',
+                        help='worker_class:workers:threads, may be repeated')
+    parser.add_argument('--seed', type=int, help='wipe and seed the database with this many rows first')
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--max-id', type=int, default=1000, help='highest work order id used for PDF requests')
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--no-preload', dest='preload', action='store_false')
+    parser.add_argument('--output', help='write results as JSON to this path')
+    args = parser.parse_args()
+    configs = args.configs or ['sync:4:1', 'gthread:4:4', 'gthread:2:8']
+
+    if args.seed:
+        seed_database(args.seed)
+
+    results = {}
+    for config in configs:
+        results[config] = run_config(config, args)
+        r = results[config]
+        print(f"{config:>14}: {r['throughput_rps']:>7} req/s  p50 {r['p50_ms']} ms  "
+              f"p95 {r['p95_ms']} ms  p99 {r['p99_ms']} ms  errors {r['errors']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Measure worker start-up cost: time to import the WSGI module and time to
+serve the first request, each in a fresh interpreter.
+
+Usage:
+    DATABASE_URL=sqlite:////tmp/startup.db python benchmarks/startup.py --runs 10 --output startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the child interpreter and prints one JSON line.
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from main import app
+imported = time.perf_counter()
+with app.test_client() as client:
+    status = client.get('/login').status_code
+served = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'first_request_ms': (served - start) * 1000,
+    'status': status,
+    'heavy_modules': [m for m in ('fpdf', 'pdf_render', 'exports', 'importer') if m in sys.modules],
+}))
+"""
+
+
+def probe():
+    env = dict(os.environ)
+    env.setdefault('FLASK_SECRET_KEY', 'startup-benchmark')
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--output', help='Write results as JSON to this path.')
+    args = parser.parse_args()
+
+    samples = [probe() for _ in range(args.runs)]
+    results = {
+        'runs': args.runs,
+        'import_ms_median': statistics.median(s['import_ms'] for s in samples),
+        'first_request_ms_median': statistics.median(s['first_request_ms'] for s in samples),
+        'statuses': sorted({s['status'] for s in samples}),
+        'heavy_modules_loaded': sorted({m for s in samples for m in s['heavy_modules']}),
+    }
+
+    print(f"import:        {results['import_ms_median']:8.1f} ms (median of {args.runs})")
+    print(f"first request: {results['first_request_ms_median']:8.1f} ms")
+    print(f"heavy modules loaded at start-up: {results['heavy_modules_loaded'] or 'none'}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Check that per-tenant latency stays flat as more companies share the database.
+
+For each tenant count the database in DATABASE_URL is wiped and seeded with
+--logs-per-tenant maintenance logs per company, then a user of the first
+company requests each endpoint --requests times. With the company-leading
+indexes the p50/p95 should barely move between rounds, even though the
+tables grow with every tenant added.
+
+Usage:
+    DATABASE_URL=postgresql://... FLASK_SECRET_KEY=x \\
+        python benchmarks/tenants.py --tenants 1,10,50 --logs-per-tenant 1000
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import create_app, db
+from benchmarks.endpoints import logged_in_client, summarize, timed_get, PASSWORD, USERNAME
+from fragment_cache import invalidate_fragments
+from models import Company, User
+from seed import seed_database
+from utils import invalidate_work_order_stats
+
+ENDPOINTS = {
+    'dashboard': '/dashboard',
+    'filtered_work_orders': '/filtered_work_orders?status=Pending',
+    'filtered_reports': '/filtered_reports?maintenance_class=IAS',
+    'work_order_stats': '/api/work_order_stats',
+    'log_search': '/api/maintenance_logs/search?q=LOT-00',
+}
+
+
+def prepare(app, tenants, logs_per_tenant):
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed_database(tenants * logs_per_tenant, companies=tenants)
+        user = User(username=USERNAME, email='benchmark@example.com',
+                    company=Company.query.order_by(Company.id).first())
+        user.set_password(PASSWORD)
+        db.session.add(user)
+        db.session.commit()
+        # The previous round's cached panels and stats could match the new
+        # generations by chance
+        invalidate_fragments()
+        invalidate_work_order_stats()
+
+
+def run_round(app, requests, warmup):
+    client = logged_in_client(app)
+    results = {}
+    for name, path in ENDPOINTS.items():
+        latencies, errors = [], 0
+        for n in range(warmup + requests):
+            elapsed, status = timed_get(client, path)
+            if n < warmup:
+                continue
+            latencies.append(elapsed)
+            errors += status >= 400
+        results[name] = dict(summarize(latencies, sum(latencies) / 1000), errors=errors)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tenants', default='1,10,50', help='comma-separated tenant counts, one round each')
+    parser.add_argument('--logs-per-tenant', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=100, help='requests per endpoint and round')
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--output', help='write results as JSON to this path')
+    args = parser.parse_args()
+
+    app = create_app({'WTF_CSRF_ENABLED': False})
+    rounds = {}
+    for tenants in [int(n) for n in args.tenants.split(',')]:
+        prepare(app, tenants, args.logs_per_tenant)
+        rounds[tenants] = run_round(app, args.requests, args.warmup)
+
+    print(f"{'endpoint':<24} {'tenants':>8} {'total logs':>11} {'p50 ms':>8} {'p95 ms':>8} {'errors':>7}")
+    for name in ENDPOINTS:
+        for tenants, results in rounds.items():
+            r = results[name]
+            print(f"{name:<24} {tenants:>8} {tenants * args.logs_per_tenant:>11} "
+                  f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['errors']:>7}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'logs_per_tenant': args.logs_per_tenant, 'rounds': rounds}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+import os
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+# Command bodies import their modules lazily so registering them costs nothing
+# at app start-up.
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create all tables on an empty database and stamp it at the Alembic head."""
+    from flask_migrate import stamp
+    from app import db
+
+    db.create_all()
+    stamp(directory=os.path.join(current_app.root_path, 'migrations'))
+    click.echo('Database initialised.')
+
+@click.command('import-logs')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--batch-size', default=500, show_default=True, help='Rows per INSERT batch.')
+@click.option('--errors', 'errors_path', type=click.Path(dir_okay=False), help='Write rejected rows to this CSV file.')
+@click.option('--company-id', type=int, required=True, help='Company the imported rows belong to.')
+@with_appcontext
+def import_logs_command(path, batch_size, errors_path, company_id):
+    """Import maintenance logs and their work orders from a CSV file."""
+    import csv
+    from app import db
+    from importer import import_rows, write_error_report
+    from models import Company
+
+    if db.session.get(Company, company_id) is None:
+        raise click.ClickException(f'No company with id {company_id}.')
+
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        imported, errors = import_rows(csv.DictReader(f), batch_size, company_id)
+
+    if errors_path:
+        with open(errors_path, 'w', newline='') as f:
+            write_error_report(f, errors)
+    else:
+        for row_number, row_errors in errors:
+            click.echo(f"Row {row_number}: {row_errors}", err=True)
+
+    click.echo(f"Imported {imported} rows, rejected {len(errors)}.")
+
+@click.command('seed')
+@click.option('--logs', default='10k', show_default=True, help='Maintenance logs to generate, e.g. 10000, 100k or 1M.')
+@click.option('--batch-size', default=5000, show_default=True, help='Rows per INSERT batch.')
+@click.option('--random-seed', default=42, show_default=True, help='Seed for repeatable data.')
+@click.option('--lots', default=5000, show_default=True, help='Distinct lot numbers.')
+@click.option('--crews', default=25, show_default=True, help='Distinct assignees.')
+@click.option('--companies', default=1, show_default=True, help='Companies to spread the logs across.')
+@click.option('--reset', is_flag=True, help='Drop and recreate all tables first.')
+@with_appcontext
+def seed_command(logs, batch_size, random_seed, lots, crews, companies, reset):
+    """Fill the database with synthetic maintenance logs, work orders and notifications."""
+    import time
+    from app import db
+    from seed import parse_scale, seed_database
+
+    if reset:
+        db.drop_all()
+        db.create_all()
+
+    started = time.perf_counter()
+    counts = seed_database(parse_scale(logs), batch_size, random_seed, lots, crews, companies=companies)
+    elapsed = time.perf_counter() - started
+    click.echo(
+        f"Inserted {counts['maintenance_logs']} logs for {counts['companies']} companies, {counts['work_orders']} work orders and "
+        f"{counts['notifications']} notifications in {elapsed:.1f}s."
+    )
+
+@click.command('rebuild-daily-stats')
+@click.option('--since', type=click.DateTime(formats=['%Y-%m-%d']), help='Only rebuild days from this date on.')
+@with_appcontext
+def rebuild_daily_stats_command(since):
+    """Recompute the work_order_daily_stats rollup from live and archived work orders."""
+    from daily_stats import rebuild_daily_stats
+
+    rows = rebuild_daily_stats(since.date() if since else None)
+    click.echo(f"Rollup rebuilt; it now holds {rows} rows.")
+
+@click.command('archive')
+@click.option('--older-than', type=int, help='Age in days after which closed records move. [default: ARCHIVE_AFTER_DAYS]')
+@click.option('--batch-size', type=int, help='Logs moved per transaction. [default: ARCHIVE_BATCH_SIZE]')
+@click.option('--max-batches', type=int, help='Stop after this many batches; run again to continue.')
+@click.option('--pause', default=0.0, show_default=True, help='Seconds to wait between batches.')
+@click.option('--dry-run', is_flag=True, help='Only count the records that would move.')
+@with_appcontext
+def archive_command(older_than, batch_size, max_batches, pause, dry_run):
+    """Move completed work orders and old closed logs into the archive tables."""
+    from archive import archive_closed_records, archive_cutoff, count_archivable
+    from fragment_cache import invalidate_fragments
+    from utils import invalidate_work_order_stats
+
+    older_than = older_than if older_than is not None else current_app.config['ARCHIVE_AFTER_DAYS']
+    batch_size = batch_size or current_app.config['ARCHIVE_BATCH_SIZE']
+    if dry_run:
+        cutoff = archive_cutoff(older_than)
+        click.echo(f"{count_archivable(cutoff)} maintenance logs closed before {cutoff} would be archived.")
+        return
+
+    def progress(totals):
+        click.echo(f"Batch {totals['batches']}: {totals['maintenance_logs']} logs archived so far.")
+
+    totals = archive_closed_records(older_than, batch_size, max_batches, pause, progress)
+    if totals['batches']:
+        invalidate_work_order_stats()
+        invalidate_fragments()
+    click.echo(
+        f"Archived {totals['maintenance_logs']} logs and {totals['work_orders']} work orders "
+        f"(dropped {totals['notifications']} notifications) in {totals['batches']} batches."
+    )
+
+@click.group('assets')
+def assets_command():
+    """Vendor third-party files and build the static bundles."""
+
+@assets_command.command('vendor')
+@click.option('--force', is_flag=True, help='Download files that are already present again.')
+@with_appcontext
+def vendor_assets_command(force):
+    """Download the pinned third-party CSS and JS into static/vendor (already committed)."""
+    from assets import fetch_vendor_files
+
+    try:
+        fetched = fetch_vendor_files(current_app.static_folder, force=force)
+    except OSError as e:
+        raise click.ClickException(f"Could not download vendor files: {e}")
+    for path in fetched:
+        click.echo(f"Fetched {path}")
+    click.echo(f"{len(fetched)} vendor files downloaded.")
+
+@assets_command.command('build')
+@with_appcontext
+def build_assets_command():
+    """Minify and fingerprint the bundles into static/dist and write the manifest."""
+    from assets import build_bundles
+
+    try:
+        manifest = build_bundles(current_app.static_folder)
+    except FileNotFoundError as e:
+        raise click.ClickException(str(e))
+    for name, path in sorted(manifest.items()):
+        click.echo(f"{name} -> {path}")
+
+def register_commands(app):
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(import_logs_command)
+    app.cli.add_command(seed_command)
+    app.cli.add_command(rebuild_daily_stats_command)
+    app.cli.add_command(archive_command)
+    app.cli.add_command(assets_command)
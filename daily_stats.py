@@ -0,0 +1,197 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from app import db
+from models import ArchivedMaintenanceLog, ArchivedWorkOrder, MaintenanceLog, WorkOrder, WorkOrderDailyStat
+
+TREND_WINDOWS = (30, 90, 365)
+TREND_DIMENSIONS = {
+    'priority': WorkOrderDailyStat.priority,
+    'assigned_to': WorkOrderDailyStat.assigned_to,
+    'maintenance_class': WorkOrderDailyStat.maintenance_class,
+}
+
+def completed_date_for(status, completed_date=None):
+    # Orders entered as already completed are stamped with today's date so
+    # they show up in completion trends; UTC, like the rollup and the trend
+    if status == 'Completed':
+        return completed_date or datetime.utcnow().date()
+    return None
+
+def _upsert(rows):
+    table = WorkOrderDailyStat.__table__
+    dialect = db.session.get_bind().dialect.name
+    insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.company_id, table.c.day, table.c.priority, table.c.assigned_to,
+                        table.c.maintenance_class],
+        set_={
+            'created_count': table.c.created_count + stmt.excluded.created_count,
+            'completed_count': table.c.completed_count + stmt.excluded.completed_count,
+        }
+    )
+    db.session.execute(stmt, rows)
+
+def apply_deltas(deltas):
+    """Add ``{(company_id, day, priority, assigned_to, class): (created, completed)}``
+    to the rollup.
+
+    Runs in the caller's transaction so the rollup commits with the write.
+    """
+    rows = [
+        {'company_id': company_id, 'day': day, 'priority': priority, 'assigned_to': assigned_to,
+         'maintenance_class': maintenance_class, 'created_count': created, 'completed_count': completed}
+        for (company_id, day, priority, assigned_to, maintenance_class), (created, completed) in deltas.items()
+        if created or completed
+    ]
+    if rows:
+        _upsert(rows)
+
+def record_work_orders_created(orders):
+    """Count new orders; each is a mapping with company_id, created_at, status,
+    completed_date, priority, assigned_to and maintenance_class."""
+    created = Counter()
+    completed = Counter()
+    for order in orders:
+        dims = (order['priority'], order['assigned_to'], order['maintenance_class'])
+        created[(order['company_id'], order['created_at'].date()) + dims] += 1
+        if order['status'] == 'Completed' and order['completed_date']:
+            completed[(order['company_id'], order['completed_date']) + dims] += 1
+    apply_deltas({key: (created[key], completed[key]) for key in created.keys() | completed.keys()})
+
+def record_work_order_created(work_order, maintenance_class):
+    record_work_orders_created([work_order_fields(work_order, maintenance_class)])
+
+def record_status_changes(changes):
+    """Move completion counts for ``(company_id, old_completed_date, new_completed_date,
+    priority, assigned_to, maintenance_class)`` tuples; either date may be None."""
+    deltas = Counter()
+    for company_id, old_date, new_date, priority, assigned_to, maintenance_class in changes:
+        if old_date == new_date:
+            continue
+        if old_date:
+            deltas[(company_id, old_date, priority, assigned_to, maintenance_class)] -= 1
+        if new_date:
+            deltas[(company_id, new_date, priority, assigned_to, maintenance_class)] += 1
+    apply_deltas({key: (0, count) for key, count in deltas.items()})
+
+def work_order_fields(work_order, maintenance_class):
+    return {
+        'company_id': work_order.company_id,
+        'created_at': work_order.created_at or datetime.utcnow(),
+        'status': work_order.status,
+        'completed_date': work_order.completed_date,
+        'priority': work_order.priority,
+        'assigned_to': work_order.assigned_to,
+        'maintenance_class': maintenance_class,
+    }
+
+def _rollup_events(order, log, since):
+    dims = [order.company_id, order.priority, order.assigned_to, log.maintenance_class]
+    created = select(
+        func.date(order.created_at).label('day'), *dims,
+        literal(1).label('created_count'), literal(0).label('completed_count')
+    ).join(log, order.maintenance_log_id == log.id)
+    completed = select(
+        order.completed_date.label('day'), *dims, literal(0), literal(1)
+    ).join(log, order.maintenance_log_id == log.id).where(
+        order.status == 'Completed', order.completed_date.isnot(None)
+    )
+    if since:
+        created = created.where(order.created_at >= datetime.combine(since, datetime.min.time()))
+        completed = completed.where(order.completed_date >= since)
+    return [created, completed]
+
+def rebuild_daily_stats(since=None):
+    """Recompute the rollup from work_orders and archived_work_orders, for
+    every day or from ``since`` on."""
+    table = WorkOrderDailyStat.__table__
+    events = union_all(
+        *_rollup_events(WorkOrder, MaintenanceLog, since),
+        *_rollup_events(ArchivedWorkOrder, ArchivedMaintenanceLog, since)
+    ).subquery()
+    group = [events.c.company_id, events.c.day, events.c.priority, events.c.assigned_to, events.c.maintenance_class]
+    aggregated = select(
+        *group, func.sum(events.c.created_count), func.sum(events.c.completed_count)
+    ).group_by(*group)
+
+    delete = table.delete()
+    if since:
+        delete = delete.where(table.c.day >= since)
+    db.session.execute(delete)
+    db.session.execute(table.insert().from_select(
+        ['company_id', 'day', 'priority', 'assigned_to', 'maintenance_class', 'created_count', 'completed_count'],
+        aggregated
+    ))
+    db.session.commit()
+    return db.session.query(func.count()).select_from(table).scalar()
+
+def parse_trend_window(value, default=30):
+    try:
+        days = int(value)
+    except (TypeError, ValueError):
+        return default
+    return days if days in TREND_WINDOWS else default
+
+def _filtered_rollup(query, start_date, end_date, filters):
+    query = query.filter(WorkOrderDailyStat.day >= start_date, WorkOrderDailyStat.day <= end_date)
+    for name, column in TREND_DIMENSIONS.items():
+        values = [v for v in filters.getlist(name) if v] if filters else []
+        if values:
+            query = query.filter(column.in_(values))
+    return query
+
+def get_work_order_trend(days=30, group_by=None, filters=None):
+    """Daily created/completed counts over the last ``days`` days from the rollup.
+
+    With ``group_by`` set to one of TREND_DIMENSIONS the counts are split into
+    one series per value.
+    """
+    end_date = datetime.utcnow().date()
+    start_date = end_date - timedelta(days=days - 1)
+    dates = [start_date + timedelta(days=i) for i in range(days)]
+    dimension = TREND_DIMENSIONS.get(group_by)
+
+    columns = [WorkOrderDailyStat.day]
+    if dimension is not None:
+        columns.append(dimension.label('slice'))
+    query = _filtered_rollup(
+        db.session.query(
+            *columns,
+            func.sum(WorkOrderDailyStat.created_count).label('created'),
+            func.sum(WorkOrderDailyStat.completed_count).label('completed')
+        ),
+        start_date, end_date, filters
+    ).group_by(*columns)
+
+    series = {}
+    for row in query.all():
+        key = row.slice if dimension is not None else None
+        day_counts = series.setdefault(key, {})
+        day_counts[row.day] = (int(row.created or 0), int(row.completed or 0))
+
+    def points(day_counts):
+        return [
+            {'date': day.strftime('%Y-%m-%d'),
+             'created': day_counts.get(day, (0, 0))[0],
+             'completed': day_counts.get(day, (0, 0))[1]}
+            for day in dates
+        ]
+
+    result = {'days': days, 'start_date': start_date.isoformat(), 'end_date': end_date.isoformat()}
+    if dimension is None:
+        result['points'] = points(series.get(None, {}))
+    else:
+        result['group_by'] = group_by
+        result['series'] = {key: points(day_counts) for key, day_counts in sorted(series.items())}
+
+    created = sum(c for day_counts in series.values() for c, _ in day_counts.values())
+    completed = sum(c for day_counts in series.values() for _, c in day_counts.values())
+    result['totals'] = {
+        'created': created,
+        'completed': completed,
+        'completion_ratio': round(completed / created, 3) if created else None,
+    }
+    return result
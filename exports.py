@@ -0,0 +1,144 @@
+import csv
+import io
+from datetime import datetime
+from fpdf import FPDF
+from app import db
+from models import ArchivedMaintenanceLog, ArchivedWorkOrder, MaintenanceLog, WorkOrder
+from utils import filter_reports, include_archived
+
+EXPORT_BATCH_SIZE = 1000
+CSV_CHUNK_SIZE = 64 * 1024
+
+# (header, column, PDF column width in mm)
+REPORT_COLUMNS = {
+    'maintenance_logs': [
+        ('ID', MaintenanceLog.id, 15),
+        ('Date', MaintenanceLog.date, 25),
+        ('Lot Number', MaintenanceLog.lot_number, 30),
+        ('Contact Details', MaintenanceLog.contact_details, 45),
+        ('Maintenance Class', MaintenanceLog.maintenance_class, 32),
+        ('Description', MaintenanceLog.description, 95),
+        ('Allocation', MaintenanceLog.allocation, 35),
+    ],
+    'work_orders': [
+        ('ID', WorkOrder.id, 15),
+        ('Log ID', WorkOrder.maintenance_log_id, 15),
+        ('Status', WorkOrder.status, 25),
+        ('Priority', WorkOrder.priority, 20),
+        ('Assigned To', WorkOrder.assigned_to, 40),
+        ('Scheduled Date', WorkOrder.scheduled_date, 28),
+        ('Completed Date', WorkOrder.completed_date, 28),
+        ('Critical', WorkOrder.is_critical, 17),
+        ('Notes', WorkOrder.notes, 89),
+    ],
+}
+
+REPORT_TITLES = {
+    'maintenance_logs': 'Maintenance Logs',
+    'work_orders': 'Work Orders',
+}
+
+def _report_query(report_type, args, log, order):
+    models = {MaintenanceLog: log, WorkOrder: order}
+    # Archived tables share the live column names
+    columns = [getattr(models[column.class_], column.key) for _, column, _ in REPORT_COLUMNS[report_type]]
+    if report_type == 'maintenance_logs':
+        query = db.session.query(*columns).select_from(log).outerjoin(order, order.maintenance_log_id == log.id)
+    else:
+        query = db.session.query(*columns).select_from(order).join(log, order.maintenance_log_id == log.id)
+    return filter_reports(query, args, log, order)
+
+def build_report_query(report_type, args):
+    query = _report_query(report_type, args, MaintenanceLog, WorkOrder)
+    if include_archived(args):
+        query = query.union_all(_report_query(report_type, args, ArchivedMaintenanceLog, ArchivedWorkOrder))
+
+    if report_type == 'maintenance_logs':
+        order_by = (MaintenanceLog.date.desc(), MaintenanceLog.id.desc())
+    else:
+        order_by = (WorkOrder.scheduled_date.desc(), WorkOrder.id.desc())
+    # yield_per streams rows through a server-side cursor in fixed-size batches
+    return query.order_by(*order_by).yield_per(EXPORT_BATCH_SIZE)
+
+def format_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'Yes' if value else 'No'
+    return str(value)
+
+def generate_csv(report_type, args):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow([header for header, _, _ in REPORT_COLUMNS[report_type]])
+    yield flush()
+
+    for row in build_report_query(report_type, args):
+        writer.writerow([format_value(value) for value in row])
+        if buffer.tell() >= CSV_CHUNK_SIZE:
+            yield flush()
+
+    yield flush()
+
+class ReportPDF(FPDF):
+    def __init__(self, title, columns):
+        super().__init__(orientation='L')
+        self.title = title
+        self.columns = columns
+        self.set_auto_page_break(True, margin=15)
+
+    def header(self):
+        self.set_font("Arial", "B", 14)
+        self.cell(0, 10, self.title, ln=True, align="C")
+        self.set_font("Arial", "B", 9)
+        for header, _, width in self.columns:
+            self.cell(width, 7, header, border=1)
+        self.ln()
+        self.set_font("Arial", "", 8)
+
+    def footer(self):
+        self.set_y(-12)
+        self.set_font("Arial", "I", 8)
+        self.cell(0, 8, f"Page {self.page_no()}", align="C")
+
+    def fit_text(self, text, width):
+        text = text.replace('\n', ' ').encode('latin-1', 'replace').decode('latin-1')
+        limit = width - 2
+        if self.get_string_width(text) <= limit:
+            return text
+        # No more characters than this fit even if all were the narrowest
+        # glyph, so the search below only ever measures a cell's worth of text
+        narrowest = min(self.current_font['cw'].values()) * self.font_size / 1000.0
+        text = text[:int(limit / narrowest) + 1]
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.get_string_width(text[:middle] + '...') <= limit:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low] + '...'
+
+    def add_row(self, values):
+        for (_, _, width), value in zip(self.columns, values):
+            self.cell(width, 6, self.fit_text(format_value(value), width), border=1)
+        self.ln()
+
+def generate_pdf(report_type, args):
+    columns = REPORT_COLUMNS[report_type]
+    title = f"{REPORT_TITLES[report_type]} - {datetime.utcnow().strftime('%Y-%m-%d')}"
+    pdf = ReportPDF(title, columns)
+    pdf.add_page()
+
+    # Rows are drawn as they stream in; only the PDF buffer itself is kept
+    for row in build_report_query(report_type, args):
+        pdf.add_row(row)
+
+    return pdf.output(dest='S').encode('latin-1')
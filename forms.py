@@ -1,39 +1,41 @@
 from flask_wtf import FlaskForm
-from wtforms import StringField, TextAreaField, DateField, SelectField, BooleanField, PasswordField, SubmitField
+from wtforms import StringField, TextAreaField, DateField, SelectField, BooleanField, PasswordField, SubmitField, IntegerField
+from wtforms.widgets import HiddenInput
 from wtforms.validators import DataRequired, Length, Email, EqualTo, ValidationError
+from sqlalchemy import or_
+from app import db
 from models import MaintenanceLog, User
-import logging
+
+MAINTENANCE_CLASS_CHOICES = [('3MTR', '3MTR'), ('IAS', 'IAS'), ('Supplier', 'Supplier')]
+STATUS_CHOICES = [('Pending', 'Pending'), ('In Progress', 'In Progress'), ('Completed', 'Completed')]
+PRIORITY_CHOICES = [('Low', 'Low'), ('Medium', 'Medium'), ('High', 'High')]
 
 class MaintenanceLogForm(FlaskForm):
     date = DateField('Date', validators=[DataRequired()])
     lot_number = StringField('Lot Number', validators=[DataRequired(), Length(max=50)])
     contact_details = StringField('Contact Details', validators=[DataRequired(), Length(max=255)])
-    maintenance_class = SelectField('Maintenance Class', choices=[('3MTR', '3MTR'), ('IAS', 'IAS'), ('Supplier', 'Supplier')], validators=[DataRequired()])
+    maintenance_class = SelectField('Maintenance Class', choices=MAINTENANCE_CLASS_CHOICES, validators=[DataRequired()])
     description = TextAreaField('Description', validators=[DataRequired()])
     allocation = StringField('Allocation', validators=[DataRequired(), Length(max=100)])
 
-class WorkOrderForm(FlaskForm):
-    maintenance_log_id = SelectField('Maintenance Log', coerce=int, validators=[DataRequired()])
-    status = SelectField('Status', choices=[('Pending', 'Pending'), ('In Progress', 'In Progress'), ('Completed', 'Completed')], validators=[DataRequired()])
+class WorkOrderDetailsForm(FlaskForm):
+    status = SelectField('Status', choices=STATUS_CHOICES, validators=[DataRequired()])
     assigned_to = StringField('Assigned To', validators=[DataRequired(), Length(max=100)])
     scheduled_date = DateField('Scheduled Date', validators=[DataRequired()])
-    priority = SelectField('Priority', choices=[('Low', 'Low'), ('Medium', 'Medium'), ('High', 'High')], validators=[DataRequired()])
+    priority = SelectField('Priority', choices=PRIORITY_CHOICES, validators=[DataRequired()])
     notes = TextAreaField('Notes')
     is_critical = BooleanField('Critical')
 
-    def __init__(self, *args, **kwargs):
-        super(WorkOrderForm, self).__init__(*args, **kwargs)
-        logging.info("Initializing WorkOrderForm")
-        try:
-            maintenance_logs = MaintenanceLog.query.order_by(MaintenanceLog.date.desc()).all()
-            logging.info(f"Number of maintenance logs retrieved: {len(maintenance_logs)}")
-            self.maintenance_log_id.choices = [(log.id, f"{log.date} - {log.lot_number} - {log.description[:50]}...") for log in maintenance_logs]
-            logging.info(f"Final maintenance log choices: {self.maintenance_log_id.choices}")
-            if not self.maintenance_log_id.choices:
-                logging.warning("No maintenance log choices available")
-        except Exception as e:
-            logging.error(f"Error while setting maintenance_log_id choices: {str(e)}")
-            self.maintenance_log_id.choices = []
+class WorkOrderForm(WorkOrderDetailsForm):
+    maintenance_log_id = IntegerField('Maintenance Log', widget=HiddenInput(), validators=[DataRequired()])
+
+    def validate_maintenance_log_id(self, maintenance_log_id):
+        self.maintenance_log = db.session.get(MaintenanceLog, maintenance_log_id.data)
+        if self.maintenance_log is None:
+            raise ValidationError('Please select an existing maintenance log.')
+
+class MaintenanceLogWorkOrderForm(MaintenanceLogForm, WorkOrderDetailsForm):
+    """A maintenance log together with the work order raised for it."""
 
 class CompanySetupForm(FlaskForm):
     name = StringField('Company Name', validators=[DataRequired(), Length(max=100)])
@@ -46,18 +48,26 @@ class LoginForm(FlaskForm):
     submit = SubmitField('Sign In')
 
 class RegistrationForm(FlaskForm):
+    company_name = StringField('Company Name', validators=[DataRequired(), Length(max=100)])
     username = StringField('Username', validators=[DataRequired(), Length(min=2, max=20)])
     email = StringField('Email', validators=[DataRequired(), Email()])
     password = PasswordField('Password', validators=[DataRequired()])
     confirm_password = PasswordField('Confirm Password', validators=[DataRequired(), EqualTo('password')])
     submit = SubmitField('Sign Up')
 
-    def validate_username(self, username):
-        user = User.query.filter_by(username=username.data).first()
-        if user:
-            raise ValidationError('That username is taken. Please choose a different one.')
+    def validate(self, extra_validators=None):
+        valid = super().validate(extra_validators)
+        if self.username.errors or self.email.errors:
+            return False
 
-    def validate_email(self, email):
-        user = User.query.filter_by(email=email.data).first()
-        if user:
-            raise ValidationError('That email is taken. Please choose a different one.')
+        # One round trip covers both uniqueness checks
+        taken = db.session.query(User.username, User.email).filter(
+            or_(User.username == self.username.data, User.email == self.email.data)
+        ).all()
+        if any(row.username == self.username.data for row in taken):
+            self.username.errors.append('That username is taken. Please choose a different one.')
+            valid = False
+        if any(row.email == self.email.data for row in taken):
+            self.email.errors.append('That email is taken. Please choose a different one.')
+            valid = False
+        return valid
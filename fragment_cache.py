@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from flask import current_app, g
+from markupsafe import Markup
+from cache import TTLCache
+from http_cache import get_generations
+from metrics import registry
+from tenancy import current_company_id
+
+logger = logging.getLogger(__name__)
+
+RECENT_LOGS = 'recent_logs'
+UPCOMING_WORK_ORDERS = 'upcoming_work_orders'
+DASHBOARD_FRAGMENTS = (RECENT_LOGS, UPCOMING_WORK_ORDERS)
+
+class MemoryFragmentBackend:
+    """Rendered fragments in a per-process LRU, one per fragment name.
+
+    Entries are keyed by ``(scope, version)``; the scope is the company.
+    """
+
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.caches = {}
+        self.lock = threading.Lock()
+
+    def _cache(self, name):
+        with self.lock:
+            cache = self.caches.get(name)
+            if cache is None:
+                cache = self.caches[name] = TTLCache(self.ttl, self.max_entries)
+            return cache
+
+    def get(self, name, scope, version):
+        return self._cache(name).get((scope, version))
+
+    def set(self, name, scope, version, html):
+        self._cache(name).set((scope, version), html)
+
+    def invalidate(self, name, scope=None):
+        if scope is None:
+            self._cache(name).invalidate()
+        else:
+            self._cache(name).invalidate_where(lambda key: key[0] == scope)
+
+class DiskFragmentBackend:
+    """Rendered fragments in a directory shared by every gunicorn worker.
+
+    Each fragment keeps only its latest version per scope; files are
+    replaced atomically so readers never see a partial write.
+    """
+
+    def __init__(self, directory, ttl):
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, name, scope, version):
+        return os.path.join(self.directory, f'{name}-{scope}-{version}.html')
+
+    def get(self, name, scope, version):
+        path = self.path(name, scope, version)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def set(self, name, scope, version, html):
+        path = self.path(name, scope, version)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        os.replace(tmp_path, path)
+        self._remove(f'{name}-{scope}-', keep=os.path.basename(path))
+
+    def invalidate(self, name, scope=None):
+        self._remove(f'{name}-' if scope is None else f'{name}-{scope}-')
+
+    def _remove(self, prefix, keep=None):
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(prefix) and entry.name.endswith('.html') and entry.name != keep:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_fragment_cache():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            config = current_app.config
+            if config['FRAGMENT_CACHE_BACKEND'] == 'disk':
+                _backend = DiskFragmentBackend(config['FRAGMENT_CACHE_DIR'], config['FRAGMENT_CACHE_TTL'])
+            else:
+                _backend = MemoryFragmentBackend(config['FRAGMENT_CACHE_TTL'], config['FRAGMENT_CACHE_MAX_ENTRIES'])
+    return _backend
+
+def cached_fragment(name, tables, render):
+    """Return the HTML ``render()`` produces, cached per company and version
+    of ``tables``.
+
+    The key includes the tables' write generations, so a write through any
+    path or worker retires the old fragment even before it is invalidated.
+    """
+    versions = g.setdefault('resource_versions', {})
+    missing = [table for table in tables if table not in versions]
+    if missing:
+        # Kept on g so the request's other fragments don't fetch them again
+        versions.update(zip(missing, get_generations(missing)))
+    version = hashlib.sha256(repr([versions[table] for table in tables]).encode('utf-8')).hexdigest()[:16]
+    scope = current_company_id()
+
+    backend = get_fragment_cache()
+    html = backend.get(name, scope, version)
+    registry.inc('bmm_fragment_cache_requests_total',
+                 {'fragment': name, 'result': 'miss' if html is None else 'hit'})
+    if html is None:
+        html = render()
+        backend.set(name, scope, version, html)
+    return Markup(html)
+
+def invalidate_fragments(*names):
+    """Drop the current company's cached fragments (every company's outside a request)."""
+    backend = get_fragment_cache()
+    scope = current_company_id()
+    for name in names or DASHBOARD_FRAGMENTS:
+        try:
+            backend.invalidate(name, scope)
+        except OSError as e:
+            logger.warning("Error invalidating fragment %s: %s", name, e)
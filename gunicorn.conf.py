@@ -0,0 +1,5 @@
+# Picked up automatically by `gunicorn main:app`; see server_config.py for the
+# environment variables that tune it.
+from server_config import gunicorn_options
+
+globals().update(gunicorn_options())
@@ -0,0 +1,193 @@
+import functools
+import hashlib
+import itertools
+import time
+import zlib
+from datetime import datetime
+from flask import current_app, g, request, session
+from flask_login import current_user
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app import db
+from models import WriteGeneration
+from tenancy import current_company_id
+
+try:
+    import brotli
+except ImportError:
+    # Optional: without it responses are gzip-compressed only
+    brotli = None
+
+# Bump when a response format changes so clients drop bodies cached under
+# the old ETags
+ETAG_VERSION = 1
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/csv'}
+BROTLI_QUALITY = 4
+WRITTEN_TABLES_KEY = 'written_tables'
+
+def _written_tables(session):
+    return session.info.setdefault(WRITTEN_TABLES_KEY, set())
+
+def _track_flush(session, flush_context, instances):
+    tables = _written_tables(session)
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        tables.add(obj.__table__.name)
+
+def _track_execute(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    name = getattr(orm_execute_state.statement.table, 'name', None)
+    if name and name != WriteGeneration.__tablename__:
+        _written_tables(orm_execute_state.session).add(name)
+
+def _bump_on_commit(session):
+    # Flush first so pending objects are counted, then bump in the same
+    # transaction as the write
+    session.flush()
+    tables = session.info.pop(WRITTEN_TABLES_KEY, None)
+    if tables:
+        bump_generations(session, tables)
+
+def _forget_writes(session, previous_transaction=None):
+    session.info.pop(WRITTEN_TABLES_KEY, None)
+
+event.listen(Session, 'before_flush', _track_flush)
+event.listen(Session, 'do_orm_execute', _track_execute)
+event.listen(Session, 'before_commit', _bump_on_commit)
+event.listen(Session, 'after_rollback', _forget_writes)
+
+def bump_generations(session, tables):
+    table = WriteGeneration.__table__
+    dialect = session.get_bind().dialect.name
+    insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.table_name, table.c.company_id],
+        set_={'generation': table.c.generation + 1}
+    )
+    # Writes inside a request only touch its company's rows; anything else
+    # (CLI commands, seeding) counts against every company
+    company_id = current_company_id() or 0
+    # Sorted so concurrent transactions lock the rows in the same order
+    session.execute(stmt, [
+        {'table_name': name, 'company_id': company_id, 'generation': 1} for name in sorted(tables)
+    ])
+
+def get_generations(tables):
+    """Per-table version of the current company's data: its own counter plus
+    the counter for writes made outside any company."""
+    company_ids = {0, current_company_id() or 0}
+    generations = dict(db.session.execute(
+        select(WriteGeneration.table_name, func.sum(WriteGeneration.generation))
+        .where(WriteGeneration.table_name.in_(tables), WriteGeneration.company_id.in_(company_ids))
+        .group_by(WriteGeneration.table_name)
+    ).all())
+    return tuple(int(generations.get(name) or 0) for name in tables)
+
+def resource_etag(generations, daily=False, csrf=False):
+    parts = [
+        ETAG_VERSION,
+        request.endpoint,
+        sorted((request.view_args or {}).items()),
+        sorted(request.args.items(multi=True)),
+        current_user.get_id(),
+        generations,
+    ]
+    if daily:
+        parts.append(datetime.utcnow().date().isoformat())
+    if csrf:
+        # A cached page must not outlive its token: tie it to the session's
+        # CSRF secret and revalidate within half the token's lifetime
+        parts.append(session.get(current_app.config['WTF_CSRF_FIELD_NAME']))
+        time_limit = current_app.config['WTF_CSRF_TIME_LIMIT']
+        if time_limit:
+            parts.append(int(time.time() // (time_limit / 2)))
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+def conditional(*tables, daily=False, csrf=False):
+    """Answer ``If-None-Match`` from the write generations of ``tables``.
+
+    The ETag covers the endpoint, its arguments, the user and the generations
+    (plus the date with ``daily``, and the CSRF token's validity with ``csrf``
+    for pages that embed one), so a match returns 304 without running the
+    view. The generations are left in ``g.resource_versions``, by table, for
+    views that key their own caches on them.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            # Fetched even when the response can't be conditional, so views
+            # keying caches on them never query them again
+            generations = get_generations(tables)
+            g.resource_versions = dict(zip(tables, generations))
+            # Pending flashed messages would be lost on a 304
+            if request.method not in ('GET', 'HEAD') or '_flashes' in session:
+                return view(*args, **kwargs)
+
+            etag = resource_etag(generations, daily, csrf)
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
+
+def _gzip_stream(chunks, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def _brotli_stream(chunks):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+def compress_response(response):
+    if (response.status_code != 200 or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(['br', 'gzip'] if brotli else ['gzip'])
+    if encoding is None:
+        return response
+
+    level = current_app.config['COMPRESS_LEVEL']
+    if response.is_streamed:
+        # CSV exports stream; compress chunk by chunk instead of buffering
+        chunks = response.response
+        response.response = _brotli_stream(chunks) if encoding == 'br' else _gzip_stream(chunks, level)
+        response.headers.pop('Content-Length', None)
+    else:
+        body = response.get_data()
+        if len(body) < current_app.config['COMPRESS_MIN_SIZE']:
+            return response
+        if encoding == 'br':
+            body = brotli.compress(body, quality=BROTLI_QUALITY)
+        else:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            body = compressor.compress(body) + compressor.flush()
+        response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+def init_http_cache(app):
+    if app.config['COMPRESS_ENABLED']:
+        app.after_request(compress_response)
@@ -0,0 +1,132 @@
+import csv
+import io
+import logging
+from datetime import datetime
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.datastructures import MultiDict
+from app import db
+from daily_stats import completed_date_for, record_work_orders_created
+from forms import MaintenanceLogWorkOrderForm
+from models import MaintenanceLog, WorkOrder, Notification
+from notifier import publish_notifications
+from tenancy import current_company_id
+from utils import notification_payload
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 500
+TRUE_VALUES = ('1', 'true', 'yes', 'y', 'on')
+
+LOG_FIELDS = ('date', 'lot_number', 'contact_details', 'maintenance_class', 'description', 'allocation')
+ORDER_FIELDS = ('status', 'assigned_to', 'scheduled_date', 'priority', 'notes', 'is_critical')
+
+def validate_row(row):
+    row = {key.strip(): (value or '').strip() for key, value in row.items() if key}
+    # BooleanField treats any non-empty value as checked, so normalise first
+    row['is_critical'] = 'y' if row.get('is_critical', '').lower() in TRUE_VALUES else ''
+
+    form = MaintenanceLogWorkOrderForm(formdata=MultiDict(row), meta={'csrf': False})
+    if not form.validate():
+        return None, form.errors
+    return form, None
+
+def insert_batch(forms, company_id):
+    # Bulk INSERTs skip the session's before_flush hook, so the company is
+    # set on every row here
+    log_ids = db.session.execute(
+        insert(MaintenanceLog).returning(MaintenanceLog.id, sort_by_parameter_order=True),
+        [dict({field: getattr(form, field).data for field in LOG_FIELDS}, company_id=company_id) for form in forms]
+    ).scalars().all()
+
+    order_rows = []
+    for form, log_id in zip(forms, log_ids):
+        order = {field: getattr(form, field).data for field in ORDER_FIELDS}
+        order['notes'] = order['notes'] or None
+        order['maintenance_log_id'] = log_id
+        order['company_id'] = company_id
+        order['completed_date'] = completed_date_for(order['status'])
+        order['created_at'] = datetime.utcnow()
+        order_rows.append(order)
+    order_ids = db.session.execute(
+        insert(WorkOrder).returning(WorkOrder.id, sort_by_parameter_order=True),
+        order_rows
+    ).scalars().all()
+    record_work_orders_created(
+        dict(order, maintenance_class=form.maintenance_class.data)
+        for order, form in zip(order_rows, forms)
+    )
+
+    critical = [(form, order_id) for form, order_id in zip(forms, order_ids) if form.is_critical.data]
+    notifications = []
+    if critical:
+        notifications = db.session.execute(
+            insert(Notification).returning(Notification, sort_by_parameter_order=True),
+            [{
+                'company_id': company_id,
+                'work_order_id': order_id,
+                'message': f"Critical work order created: {form.description.data[:50]}..."
+            } for form, order_id in critical]
+        ).scalars().all()
+
+    payloads = [
+        notification_payload(notification, form.lot_number.data)
+        for (form, _), notification in zip(critical, notifications)
+    ]
+    db.session.commit()
+    publish_notifications(payloads)
+
+def import_rows(rows, batch_size=IMPORT_BATCH_SIZE, company_id=None):
+    """Validate and insert maintenance log rows, one batch per transaction.
+
+    Rows belong to ``company_id``, by default the signed-in user's company.
+    Returns the number of imported rows and a list of ``(row_number, errors)``
+    for every rejected row.
+    """
+    company_id = company_id or current_company_id()
+    if company_id is None:
+        raise ValueError('A company is required to import maintenance logs')
+    imported = 0
+    errors = []
+    batch = []
+
+    def flush():
+        # A failed batch is reported against each of its rows; earlier
+        # batches stay committed.
+        try:
+            insert_batch([form for _, form in batch], company_id)
+            return len(batch)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error("Error importing batch: %s", e)
+            errors.extend((number, {'database': [str(getattr(e, 'orig', None) or e)]}) for number, _ in batch)
+            return 0
+
+    # Row 1 is the header line
+    for row_number, row in enumerate(rows, start=2):
+        form, row_errors = validate_row(row)
+        if row_errors:
+            errors.append((row_number, row_errors))
+            continue
+
+        batch.append((row_number, form))
+        if len(batch) >= batch_size:
+            imported += flush()
+            batch = []
+
+    if batch:
+        imported += flush()
+
+    return imported, errors
+
+def write_error_report(f, errors):
+    writer = csv.writer(f)
+    writer.writerow(['row', 'field', 'error'])
+    for row_number, row_errors in errors:
+        for field, messages in row_errors.items():
+            for message in messages:
+                writer.writerow([row_number, field, message])
+
+def import_upload(file_storage, batch_size=IMPORT_BATCH_SIZE):
+    stream = io.TextIOWrapper(file_storage.stream, encoding='utf-8-sig', newline='')
+    return import_rows(csv.DictReader(stream), batch_size)
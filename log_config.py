@@ -0,0 +1,135 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from flask import has_request_context, request
+
+# Attributes every LogRecord carries; anything else was passed via ``extra``
+# and is emitted as a structured field.
+STANDARD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'pid': record.process,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in STANDARD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the request they came from while still on the request thread."""
+
+    def filter(self, record):
+        if has_request_context():
+            record.method = request.method
+            record.path = request.path
+        return True
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of records at or below ``level``."""
+
+    def __init__(self, rate, level=logging.DEBUG):
+        super().__init__()
+        self.rate = rate
+        self.level = level
+
+    def filter(self, record):
+        if record.levelno > self.level or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue records without running the formatter on the request thread.
+
+    The message is still interpolated here (args may be ORM objects that must
+    not be touched from another thread), but JSON encoding and I/O happen in
+    the listener.
+    """
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # The queue is bounded; under a log storm drop records rather than block requests
+            pass
+
+_listener = None
+_handler = None
+_lock = threading.Lock()
+
+def parse_levels(value):
+    """Parse ``"sqlalchemy.engine=WARNING,pdf_jobs=DEBUG"`` into a dict."""
+    levels = {}
+    for item in (value or '').split(','):
+        name, sep, level = item.partition('=')
+        if sep and name.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+def _output_handler(log_format):
+    handler = logging.StreamHandler(sys.stderr)
+    if log_format == 'json':
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    return handler
+
+def configure_logging(app):
+    global _listener, _handler
+    config = app.config
+    with _lock:
+        root = logging.getLogger()
+        root.setLevel(config['LOG_LEVEL'])
+        for name, level in parse_levels(config['LOG_LEVELS']).items():
+            logging.getLogger(name).setLevel(level)
+
+        # create_app can run more than once per process; install the handler once
+        if _handler is not None:
+            return
+
+        _handler = DeferredQueueHandler(queue.Queue(config['LOG_QUEUE_SIZE']))
+        _handler.addFilter(SamplingFilter(config['LOG_SAMPLE_RATE'], logging.getLevelName(config['LOG_SAMPLE_LEVEL'])))
+        _handler.addFilter(RequestContextFilter())
+        root.addHandler(_handler)
+
+        _listener = logging.handlers.QueueListener(_handler.queue, _output_handler(config['LOG_FORMAT']))
+        _listener.start()
+        atexit.register(stop_log_listener)
+
+def restart_log_listener():
+    # The listener thread does not survive fork; gunicorn workers start their own
+    global _listener
+    with _lock:
+        if _listener is None:
+            return
+        handlers = _listener.handlers
+        _handler.queue = queue.Queue(_handler.queue.maxsize)
+        _listener = logging.handlers.QueueListener(_handler.queue, *handlers)
+        _listener.start()
+
+def stop_log_listener():
+    with _lock:
+        if _listener is not None and _listener._thread is not None:
+            _listener.stop()
@@ -1,13 +1,11 @@
 import os
-from app import app, db
+from app import create_app
+
+app = create_app()
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     
-    # Ensure database tables are created
-    with app.app_context():
-        db.create_all()
-    
     # Use Gunicorn for production
     if os.environ.get('FLASK_ENV') == 'production':
         import gunicorn.app.base
@@ -27,11 +25,7 @@ if __name__ == "__main__":
             def load(self):
                 return self.application
 
-        options = {
-            'bind': f'0.0.0.0:{port}',
-            'workers': 4,
-            'worker_class': 'sync',
-        }
-        StandaloneApplication(app, options).run()
+        from server_config import gunicorn_options
+        StandaloneApplication(app, gunicorn_options(port)).run()
     else:
         app.run(host="0.0.0.0", port=port)
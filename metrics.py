@@ -0,0 +1,243 @@
+import atexit
+import glob
+import hmac
+import json
+import os
+import threading
+import time
+from flask import Response, abort, current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 * 1024, 10 * 1024 * 1024)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+# name -> (type, help, buckets)
+METRICS = {
+    'bmm_http_request_duration_seconds': ('histogram', 'Request latency by endpoint.', LATENCY_BUCKETS),
+    'bmm_http_response_size_bytes': ('histogram', 'Response body size by endpoint.', SIZE_BUCKETS),
+    'bmm_db_queries_per_request': ('histogram', 'SQL statements issued per request.', QUERY_COUNT_BUCKETS),
+    'bmm_db_query_duration_seconds_total': ('counter', 'Time spent executing SQL.', None),
+    'bmm_db_pool_checkout_wait_seconds': ('histogram', 'Time spent waiting for a pooled connection.', POOL_WAIT_BUCKETS),
+    'bmm_fragment_cache_requests_total': ('counter', 'Template fragment cache lookups by result (hit or miss).', None),
+}
+
+class MetricsRegistry:
+    """Per-process counters and histograms keyed by metric name and labels."""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, labels, value):
+        buckets = METRICS[name][2]
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = {'buckets': [0] * len(buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    entry['buckets'][i] += 1
+            entry['sum'] += value
+            entry['count'] += 1
+
+    def inc(self, name, labels, value=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def snapshot(self):
+        with self._lock:
+            return [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in self._values.items()
+            ]
+
+registry = MetricsRegistry()
+
+def merge_snapshots(snapshots):
+    merged = {}
+    for snapshot in snapshots:
+        for item in snapshot:
+            key = (item['name'], tuple(sorted(item['labels'].items())))
+            value = item['value']
+            current = merged.get(key)
+            if current is None:
+                merged[key] = json.loads(json.dumps(value))
+            elif isinstance(value, dict):
+                current['buckets'] = [a + b for a, b in zip(current['buckets'], value['buckets'])]
+                current['sum'] += value['sum']
+                current['count'] += value['count']
+            else:
+                merged[key] = current + value
+    return merged
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def format_labels(labels, **extra):
+    items = list(labels) + list(extra.items())
+    if not items:
+        return ''
+    return '{' + ','.join(f'{key}="{escape_label(value)}"' for key, value in items) + '}'
+
+def render_prometheus(merged):
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        series = sorted((labels, value) for (metric, labels), value in merged.items() if metric == name)
+        if not series:
+            continue
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in series:
+            if kind == 'counter':
+                lines.append(f'{name}{format_labels(labels)} {value}')
+                continue
+            for bound, count in zip(buckets, value['buckets']):
+                lines.append(f'{name}_bucket{format_labels(labels, le=bound)} {count}')
+            lines.append(f'{name}_bucket{format_labels(labels, le="+Inf")} {value["count"]}')
+            lines.append(f'{name}_sum{format_labels(labels)} {value["sum"]}')
+            lines.append(f'{name}_count{format_labels(labels)} {value["count"]}')
+    return '\n'.join(lines) + '\n'
+
+class MetricsStore:
+    """Shares per-worker snapshots through a directory so any worker can serve
+    the aggregate. Each process owns one file and replaces it atomically.
+
+    Files from exited workers are kept so counters never go backwards; the
+    gunicorn master clears the directory when it starts.
+    """
+
+    def __init__(self, directory, flush_interval):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.last_flush = 0.0
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self):
+        return os.path.join(self.directory, f'metrics-{os.getpid()}.json')
+
+    def flush(self, force=False):
+        now = time.monotonic()
+        with self.lock:
+            if not force and now - self.last_flush < self.flush_interval:
+                return
+            self.last_flush = now
+        path = self.path()
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(registry.snapshot(), f)
+        os.replace(tmp_path, path)
+
+    def collect(self):
+        snapshots = []
+        for path in glob.glob(os.path.join(self.directory, 'metrics-*.json')):
+            try:
+                with open(path) as f:
+                    snapshots.append(json.load(f))
+            except (FileNotFoundError, ValueError):
+                continue
+        return merge_snapshots(snapshots)
+
+    def clear(self):
+        for path in glob.glob(os.path.join(self.directory, 'metrics-*')):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+def record_pool_wait(seconds):
+    if has_request_context() and 'metrics_start' in g:
+        g.metrics_pool_wait += seconds
+    else:
+        registry.observe('bmm_db_pool_checkout_wait_seconds', {'endpoint': 'background'}, seconds)
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            record_pool_wait(time.perf_counter() - start)
+
+def configure_pool_timing(app):
+    # Must run before db.init_app builds the engine. In-memory SQLite keeps
+    # its single-connection pool.
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI')
+    if not app.config['METRICS_ENABLED'] or not uri:
+        return
+    url = make_url(uri)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].setdefault('poolclass', TimedQueuePool)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('metrics_query_start', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('metrics_query_start')
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    if has_request_context() and 'metrics_start' in g:
+        g.metrics_queries += 1
+        g.metrics_sql_time += elapsed
+
+_store = None
+
+def init_metrics(app):
+    global _store
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    if _store is None:
+        _store = MetricsStore(app.config['METRICS_DIR'], app.config['METRICS_FLUSH_INTERVAL'])
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        atexit.register(lambda: _store.flush(force=True))
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_start = time.perf_counter()
+        g.metrics_queries = 0
+        g.metrics_sql_time = 0.0
+        g.metrics_pool_wait = 0.0
+
+    @app.after_request
+    def record_request_metrics(response):
+        if 'metrics_start' not in g:
+            return response
+        # Unmatched URLs share one label so 404 scans can't blow up cardinality
+        endpoint = request.endpoint or 'unmatched'
+        labels = {'endpoint': endpoint}
+        registry.observe('bmm_http_request_duration_seconds',
+                         {'endpoint': endpoint, 'method': request.method, 'status': str(response.status_code)},
+                         time.perf_counter() - g.metrics_start)
+        if response.content_length is not None:
+            registry.observe('bmm_http_response_size_bytes', labels, response.content_length)
+        registry.observe('bmm_db_queries_per_request', labels, g.metrics_queries)
+        registry.inc('bmm_db_query_duration_seconds_total', labels, g.metrics_sql_time)
+        if g.metrics_pool_wait:
+            registry.observe('bmm_db_pool_checkout_wait_seconds', labels, g.metrics_pool_wait)
+        _store.flush()
+        return response
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+
+def metrics_view():
+    # Traffic and latency per endpoint are not public; without a token to
+    # scrape with, the endpoint doesn't exist
+    token = current_app.config['METRICS_TOKEN']
+    if not token:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        abort(401)
+    _store.flush(force=True)
+    return Response(render_prometheus(_store.collect()), mimetype='text/plain; version=0.0.4')
@@ -0,0 +1,178 @@
+"""scope maintenance data to companies
+
+Revision ID: a9d4e7b3c512
+Revises: f5c1d8e2a963
+Create Date: 2026-10-18 17:05:32.481926
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d4e7b3c512'
+down_revision = 'f5c1d8e2a963'
+branch_labels = None
+depends_on = None
+
+SCOPED_TABLES = ('maintenance_logs', 'work_orders', 'notifications', 'users')
+
+OLD_INDEXES = {
+    'maintenance_logs': ['ix_maintenance_logs_date_id', 'ix_maintenance_logs_class_date',
+                         'ix_maintenance_logs_lot_number_lower'],
+    'work_orders': ['ix_work_orders_scheduled_date_id', 'ix_work_orders_status_scheduled_date',
+                    'ix_work_orders_assigned_to_scheduled_date', 'ix_work_orders_critical_scheduled_date',
+                    'ix_work_orders_status_completed_date'],
+    'notifications': ['ix_notifications_unread_created_at'],
+}
+
+
+def default_company_id(connection):
+    # Existing rows all belonged to the single company the app served so far
+    company_id = connection.execute(sa.text('SELECT min(id) FROM companies')).scalar()
+    if company_id is None:
+        company_id = connection.execute(
+            sa.text("INSERT INTO companies (name) VALUES ('Default Company') RETURNING id")
+        ).scalar()
+    return company_id
+
+
+def lot_number_lower(dialect):
+    # The operator class lets LIKE 'prefix%' use the index under any collation
+    if dialect == 'postgresql':
+        return sa.text('lower(lot_number) varchar_pattern_ops')
+    return sa.text('lower(lot_number)')
+
+
+def create_company_indexes(dialect):
+    op.create_index('ix_maintenance_logs_company_date_id', 'maintenance_logs', ['company_id', 'date', 'id'])
+    op.create_index('ix_maintenance_logs_company_class_date', 'maintenance_logs',
+                    ['company_id', 'maintenance_class', 'date'])
+    op.create_index('ix_maintenance_logs_company_lot_number_lower', 'maintenance_logs',
+                    ['company_id', lot_number_lower(dialect)])
+
+    op.create_index('ix_work_orders_company_scheduled_date_id', 'work_orders', ['company_id', 'scheduled_date', 'id'])
+    op.create_index('ix_work_orders_company_status_scheduled_date', 'work_orders',
+                    ['company_id', 'status', 'scheduled_date', 'id'])
+    op.create_index('ix_work_orders_company_status_completed_date', 'work_orders',
+                    ['company_id', 'status', 'completed_date'])
+    op.create_index('ix_work_orders_company_assigned_to_scheduled_date', 'work_orders',
+                    ['company_id', 'assigned_to', 'scheduled_date', 'id'])
+    op.create_index('ix_work_orders_company_critical_scheduled_date', 'work_orders',
+                    ['company_id', 'scheduled_date', 'id'], postgresql_where=sa.text('is_critical IS true'),
+                    sqlite_where=sa.text('is_critical IS 1'))
+
+    op.create_index('ix_notifications_company_unread_created_at', 'notifications', ['company_id', 'created_at', 'id'],
+                    postgresql_where=sa.text('is_read = false'), sqlite_where=sa.text('is_read = 0'))
+    op.create_index('ix_users_company_id', 'users', ['company_id'])
+
+
+def upgrade():
+    connection = op.get_bind()
+    dialect = connection.dialect.name
+    company_id = default_company_id(connection)
+
+    for table in SCOPED_TABLES:
+        if dialect == 'postgresql':
+            # Add, backfill, then constrain, so the column never needs a default
+            op.add_column(table, sa.Column('company_id', sa.Integer(), nullable=True))
+            op.execute(sa.text(f'UPDATE {table} SET company_id = :company_id').bindparams(company_id=company_id))
+            op.alter_column(table, 'company_id', nullable=False)
+            op.create_foreign_key(f'{table}_company_id_fkey', table, 'companies', ['company_id'], ['id'])
+        else:
+            # SQLite can't add a constraint without recreating the table, which
+            # would drop the full-text search triggers; the app sets company_id
+            op.add_column(table, sa.Column('company_id', sa.Integer(), nullable=False,
+                                           server_default=str(company_id)))
+
+    for table, indexes in OLD_INDEXES.items():
+        for name in indexes:
+            op.drop_index(name, table_name=table)
+    create_company_indexes(dialect)
+
+    op.rename_table('work_order_daily_stats', 'work_order_daily_stats_old')
+    op.create_table('work_order_daily_stats',
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('assigned_to', sa.String(length=100), nullable=False),
+    sa.Column('maintenance_class', sa.String(length=20), nullable=False),
+    sa.Column('created_count', sa.Integer(), nullable=False),
+    sa.Column('completed_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id']),
+    sa.PrimaryKeyConstraint('company_id', 'day', 'priority', 'assigned_to', 'maintenance_class')
+    )
+    op.execute(sa.text("""INSERT INTO work_order_daily_stats
+        SELECT :company_id, day, priority, assigned_to, maintenance_class, created_count, completed_count
+        FROM work_order_daily_stats_old""").bindparams(company_id=company_id))
+    op.drop_table('work_order_daily_stats_old')
+
+    # Current generations move to company 0 (writes outside any company), so
+    # ETags issued before the upgrade can't match again
+    op.rename_table('write_generations', 'write_generations_old')
+    op.create_table('write_generations',
+    sa.Column('table_name', sa.String(length=64), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('generation', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name', 'company_id')
+    )
+    op.execute("""INSERT INTO write_generations
+        SELECT table_name, 0, generation FROM write_generations_old""")
+    op.drop_table('write_generations_old')
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    op.rename_table('write_generations', 'write_generations_new')
+    op.create_table('write_generations',
+    sa.Column('table_name', sa.String(length=64), nullable=False),
+    sa.Column('generation', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+    op.execute("""INSERT INTO write_generations
+        SELECT table_name, sum(generation) FROM write_generations_new GROUP BY table_name""")
+    op.drop_table('write_generations_new')
+
+    op.rename_table('work_order_daily_stats', 'work_order_daily_stats_new')
+    op.create_table('work_order_daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('assigned_to', sa.String(length=100), nullable=False),
+    sa.Column('maintenance_class', sa.String(length=20), nullable=False),
+    sa.Column('created_count', sa.Integer(), nullable=False),
+    sa.Column('completed_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'priority', 'assigned_to', 'maintenance_class')
+    )
+    op.execute("""INSERT INTO work_order_daily_stats
+        SELECT day, priority, assigned_to, maintenance_class, sum(created_count), sum(completed_count)
+        FROM work_order_daily_stats_new GROUP BY day, priority, assigned_to, maintenance_class""")
+    op.drop_table('work_order_daily_stats_new')
+
+    op.drop_index('ix_users_company_id', table_name='users')
+    op.drop_index('ix_notifications_company_unread_created_at', table_name='notifications')
+    op.drop_index('ix_work_orders_company_critical_scheduled_date', table_name='work_orders')
+    op.drop_index('ix_work_orders_company_assigned_to_scheduled_date', table_name='work_orders')
+    op.drop_index('ix_work_orders_company_status_completed_date', table_name='work_orders')
+    op.drop_index('ix_work_orders_company_status_scheduled_date', table_name='work_orders')
+    op.drop_index('ix_work_orders_company_scheduled_date_id', table_name='work_orders')
+    op.drop_index('ix_maintenance_logs_company_lot_number_lower', table_name='maintenance_logs')
+    op.drop_index('ix_maintenance_logs_company_class_date', table_name='maintenance_logs')
+    op.drop_index('ix_maintenance_logs_company_date_id', table_name='maintenance_logs')
+
+    op.create_index('ix_maintenance_logs_date_id', 'maintenance_logs', ['date', 'id'])
+    op.create_index('ix_maintenance_logs_class_date', 'maintenance_logs', ['maintenance_class', 'date'])
+    op.create_index('ix_maintenance_logs_lot_number_lower', 'maintenance_logs', [lot_number_lower(dialect)])
+    op.create_index('ix_work_orders_scheduled_date_id', 'work_orders', ['scheduled_date', 'id'])
+    op.create_index('ix_work_orders_status_scheduled_date', 'work_orders', ['status', 'scheduled_date', 'id'])
+    op.create_index('ix_work_orders_assigned_to_scheduled_date', 'work_orders', ['assigned_to', 'scheduled_date', 'id'])
+    op.create_index('ix_work_orders_critical_scheduled_date', 'work_orders', ['scheduled_date', 'id'],
+                    postgresql_where=sa.text('is_critical IS true'))
+    op.create_index('ix_work_orders_status_completed_date', 'work_orders', ['status', 'completed_date'])
+    op.create_index('ix_notifications_unread_created_at', 'notifications', ['created_at', 'id'],
+                    postgresql_where=sa.text('is_read = false'))
+
+    for table in reversed(SCOPED_TABLES):
+        if dialect == 'postgresql':
+            op.drop_constraint(f'{table}_company_id_fkey', table, type_='foreignkey')
+        op.drop_column(table, 'company_id')
@@ -0,0 +1,62 @@
+"""add indexes for hot query columns
+
+Revision ID: b3e1f7c2d9a4
+Revises: 7dd87e3dfc02
+Create Date: 2026-10-18 09:12:44.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e1f7c2d9a4'
+down_revision = '7dd87e3dfc02'
+branch_labels = None
+depends_on = None
+
+
+def lot_number_lower(dialect):
+    # The operator class lets LIKE 'prefix%' use the index under any collation
+    if dialect == 'postgresql':
+        return sa.text('lower(lot_number) varchar_pattern_ops')
+    return sa.text('lower(lot_number)')
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    # Dashboard "recent logs" and report date-range scans
+    op.create_index('ix_maintenance_logs_date_id', 'maintenance_logs', ['date', 'id'])
+    op.create_index('ix_maintenance_logs_class_date', 'maintenance_logs', ['maintenance_class', 'date'])
+    # Prefix search over lot numbers in /api/maintenance_logs/search
+    op.create_index('ix_maintenance_logs_lot_number_lower', 'maintenance_logs',
+                    [lot_number_lower(dialect)])
+
+    # Keyset pagination of /filtered_work_orders and the dashboard upcoming list
+    op.create_index('ix_work_orders_scheduled_date_id', 'work_orders', ['scheduled_date', 'id'])
+    op.create_index('ix_work_orders_status_scheduled_date', 'work_orders', ['status', 'scheduled_date', 'id'])
+    op.create_index('ix_work_orders_assigned_to_scheduled_date', 'work_orders', ['assigned_to', 'scheduled_date', 'id'])
+    op.create_index('ix_work_orders_critical_scheduled_date', 'work_orders', ['scheduled_date', 'id'],
+                    postgresql_where=sa.text('is_critical IS true'), sqlite_where=sa.text('is_critical IS 1'))
+    # Completion trend by completed_date
+    op.create_index('ix_work_orders_status_completed_date', 'work_orders', ['status', 'completed_date'])
+
+    op.create_index('ix_notifications_work_order_id', 'notifications', ['work_order_id'])
+    op.create_index('ix_notifications_unread_created_at', 'notifications', ['created_at', 'id'],
+                    postgresql_where=sa.text('is_read = false'), sqlite_where=sa.text('is_read = 0'))
+
+
+def downgrade():
+    op.drop_index('ix_notifications_unread_created_at', table_name='notifications')
+    op.drop_index('ix_notifications_work_order_id', table_name='notifications')
+
+    op.drop_index('ix_work_orders_status_completed_date', table_name='work_orders')
+    op.drop_index('ix_work_orders_critical_scheduled_date', table_name='work_orders')
+    op.drop_index('ix_work_orders_assigned_to_scheduled_date', table_name='work_orders')
+    op.drop_index('ix_work_orders_status_scheduled_date', table_name='work_orders')
+    op.drop_index('ix_work_orders_scheduled_date_id', table_name='work_orders')
+
+    op.drop_index('ix_maintenance_logs_lot_number_lower', table_name='maintenance_logs')
+    op.drop_index('ix_maintenance_logs_class_date', table_name='maintenance_logs')
+    op.drop_index('ix_maintenance_logs_date_id', table_name='maintenance_logs')
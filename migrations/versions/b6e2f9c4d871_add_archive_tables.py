@@ -0,0 +1,65 @@
+"""add archive tables for closed logs and work orders
+
+Revision ID: b6e2f9c4d871
+Revises: a9d4e7b3c512
+Create Date: 2026-10-18 19:23:06.917354
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e2f9c4d871'
+down_revision = 'a9d4e7b3c512'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Filled by `flask archive`
+    op.create_table('archived_maintenance_logs',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('lot_number', sa.String(length=50), nullable=False),
+    sa.Column('contact_details', sa.String(length=255), nullable=False),
+    sa.Column('maintenance_class', sa.String(length=20), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('allocation', sa.String(length=100), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id']),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_archived_maintenance_logs_company_date_id', 'archived_maintenance_logs',
+                    ['company_id', 'date', 'id'])
+
+    op.create_table('archived_work_orders',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('maintenance_log_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('assigned_to', sa.String(length=100), nullable=False),
+    sa.Column('scheduled_date', sa.Date(), nullable=False),
+    sa.Column('completed_date', sa.Date(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('is_critical', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id']),
+    sa.ForeignKeyConstraint(['maintenance_log_id'], ['archived_maintenance_logs.id']),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('maintenance_log_id')
+    )
+    op.create_index('ix_archived_work_orders_company_scheduled_date_id', 'archived_work_orders',
+                    ['company_id', 'scheduled_date', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_archived_work_orders_company_scheduled_date_id', table_name='archived_work_orders')
+    op.drop_table('archived_work_orders')
+    op.drop_index('ix_archived_maintenance_logs_company_date_id', table_name='archived_maintenance_logs')
+    op.drop_table('archived_maintenance_logs')
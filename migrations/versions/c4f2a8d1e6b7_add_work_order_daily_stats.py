@@ -0,0 +1,33 @@
+"""add work_order_daily_stats rollup
+
+Revision ID: c4f2a8d1e6b7
+Revises: b3e1f7c2d9a4
+Create Date: 2026-10-18 11:02:17.634190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4f2a8d1e6b7'
+down_revision = 'b3e1f7c2d9a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Populate afterwards with `flask rebuild-daily-stats`
+    op.create_table('work_order_daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('assigned_to', sa.String(length=100), nullable=False),
+    sa.Column('maintenance_class', sa.String(length=20), nullable=False),
+    sa.Column('created_count', sa.Integer(), nullable=False),
+    sa.Column('completed_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'priority', 'assigned_to', 'maintenance_class')
+    )
+
+
+def downgrade():
+    op.drop_table('work_order_daily_stats')
@@ -0,0 +1,56 @@
+"""backfill completed_date for completed work orders
+
+Revision ID: c8d4a1f7e209
+Revises: b6e2f9c4d871
+Create Date: 2026-10-18 21:14:52.306118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d4a1f7e209'
+down_revision = 'b6e2f9c4d871'
+branch_labels = None
+depends_on = None
+
+
+def completion_estimate(dialect):
+    # Orders completed before completed_date was stamped have no record of
+    # when; the scheduled date is the closest estimate, capped at today (UTC)
+    today = "(now() AT TIME ZONE 'utc')::date" if dialect == 'postgresql' else "date('now')"
+    return f'CASE WHEN scheduled_date <= {today} THEN scheduled_date ELSE {today} END'
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    completed_on = completion_estimate(dialect)
+
+    # Count the backfilled completions into the rollup, as daily_stats would
+    # have when they happened; created counts are already there. WHERE true
+    # keeps SQLite from reading ON CONFLICT as part of the SELECT.
+    op.execute(f"""INSERT INTO work_order_daily_stats
+            (company_id, day, priority, assigned_to, maintenance_class, created_count, completed_count)
+        SELECT company_id, day, priority, assigned_to, maintenance_class, 0, count(*) FROM (
+            SELECT w.company_id, {completed_on} AS day, w.priority, w.assigned_to, l.maintenance_class
+            FROM work_orders w JOIN maintenance_logs l ON l.id = w.maintenance_log_id
+            WHERE w.status = 'Completed' AND w.completed_date IS NULL
+            UNION ALL
+            SELECT w.company_id, {completed_on}, w.priority, w.assigned_to, l.maintenance_class
+            FROM archived_work_orders w JOIN archived_maintenance_logs l ON l.id = w.maintenance_log_id
+            WHERE w.status = 'Completed' AND w.completed_date IS NULL
+        ) AS completions
+        WHERE true
+        GROUP BY company_id, day, priority, assigned_to, maintenance_class
+        ON CONFLICT (company_id, day, priority, assigned_to, maintenance_class)
+        DO UPDATE SET completed_count = work_order_daily_stats.completed_count + excluded.completed_count""")
+
+    for table in ('work_orders', 'archived_work_orders'):
+        op.execute(f"""UPDATE {table} SET completed_date = {completed_on}
+            WHERE status = 'Completed' AND completed_date IS NULL""")
+
+
+def downgrade():
+    # The estimated dates can't be told apart from real ones, so they stay
+    pass
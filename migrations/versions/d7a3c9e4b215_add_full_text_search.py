@@ -0,0 +1,66 @@
+"""add full-text search over descriptions and notes
+
+Revision ID: d7a3c9e4b215
+Revises: c4f2a8d1e6b7
+Create Date: 2026-10-18 12:26:51.207344
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a3c9e4b215'
+down_revision = 'c4f2a8d1e6b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("""ALTER TABLE maintenance_logs ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(description, '')), 'A')) STORED""")
+        op.execute("ALTER TABLE work_orders ADD COLUMN search_vector tsvector "
+                   "GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(notes, '')), 'B')) STORED")
+        op.create_index('ix_maintenance_logs_search_vector', 'maintenance_logs', ['search_vector'],
+                        postgresql_using='gin')
+        op.create_index('ix_work_orders_search_vector', 'work_orders', ['search_vector'],
+                        postgresql_using='gin')
+    elif dialect == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE maintenance_log_fts USING fts5(description, notes, tokenize='porter unicode61')")
+        op.execute("""INSERT INTO maintenance_log_fts(rowid, description, notes)
+            SELECT l.id, l.description, coalesce(w.notes, '')
+            FROM maintenance_logs l LEFT JOIN work_orders w ON w.maintenance_log_id = l.id""")
+        op.execute("""CREATE TRIGGER maintenance_logs_fts_insert AFTER INSERT ON maintenance_logs BEGIN
+            INSERT INTO maintenance_log_fts(rowid, description, notes) VALUES (new.id, new.description, '');
+        END""")
+        op.execute("""CREATE TRIGGER maintenance_logs_fts_update AFTER UPDATE OF description ON maintenance_logs BEGIN
+            UPDATE maintenance_log_fts SET description = new.description WHERE rowid = new.id;
+        END""")
+        op.execute("""CREATE TRIGGER maintenance_logs_fts_delete AFTER DELETE ON maintenance_logs BEGIN
+            DELETE FROM maintenance_log_fts WHERE rowid = old.id;
+        END""")
+        op.execute("""CREATE TRIGGER work_orders_fts_insert AFTER INSERT ON work_orders BEGIN
+            UPDATE maintenance_log_fts SET notes = coalesce(new.notes, '') WHERE rowid = new.maintenance_log_id;
+        END""")
+        op.execute("""CREATE TRIGGER work_orders_fts_update AFTER UPDATE OF notes ON work_orders BEGIN
+            UPDATE maintenance_log_fts SET notes = coalesce(new.notes, '') WHERE rowid = new.maintenance_log_id;
+        END""")
+        op.execute("""CREATE TRIGGER work_orders_fts_delete AFTER DELETE ON work_orders BEGIN
+            UPDATE maintenance_log_fts SET notes = '' WHERE rowid = old.maintenance_log_id;
+        END""")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_work_orders_search_vector', table_name='work_orders')
+        op.drop_index('ix_maintenance_logs_search_vector', table_name='maintenance_logs')
+        op.drop_column('work_orders', 'search_vector')
+        op.drop_column('maintenance_logs', 'search_vector')
+    elif dialect == 'sqlite':
+        for trigger in ('work_orders_fts_delete', 'work_orders_fts_update', 'work_orders_fts_insert',
+                        'maintenance_logs_fts_delete', 'maintenance_logs_fts_update', 'maintenance_logs_fts_insert'):
+            op.execute(f'DROP TRIGGER {trigger}')
+        op.execute('DROP TABLE maintenance_log_fts')
@@ -0,0 +1,26 @@
+"""add version column to work_orders
+
+Revision ID: e2b8f5a1c347
+Revises: d7a3c9e4b215
+Create Date: 2026-10-18 13:40:09.851622
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b8f5a1c347'
+down_revision = 'd7a3c9e4b215'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('work_orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    with op.batch_alter_table('work_orders', schema=None) as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,29 @@
+"""add write_generations for HTTP cache validators
+
+Revision ID: f5c1d8e2a963
+Revises: e2b8f5a1c347
+Create Date: 2026-10-18 15:41:08.204117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5c1d8e2a963'
+down_revision = 'e2b8f5a1c347'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rows are created on the first write to each table
+    op.create_table('write_generations',
+    sa.Column('table_name', sa.String(length=64), nullable=False),
+    sa.Column('generation', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+
+
+def downgrade():
+    op.drop_table('write_generations')
@@ -1,7 +1,20 @@
 from app import db
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
+from sqlalchemy.orm import declared_attr
+from auth import hash_password, verify_password, register_user_cache_events
+
+class TenantScoped:
+    """Marks models whose rows belong to one company.
+
+    tenancy limits every ORM query on them to the signed-in user's company
+    and fills in company_id on new rows. Models redeclare the column so their
+    indexes can lead with it.
+    """
+
+    @declared_attr
+    def company_id(cls):
+        return db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False)
 
 class Company(db.Model):
     __tablename__ = 'companies'
@@ -10,9 +23,10 @@ class Company(db.Model):
     logo_url = db.Column(db.String(255))
     contact_info = db.Column(db.Text)
 
-class MaintenanceLog(db.Model):
+class MaintenanceLog(db.Model, TenantScoped):
     __tablename__ = 'maintenance_logs'
     id = db.Column(db.Integer, primary_key=True)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False)
     date = db.Column(db.Date, nullable=False)
     lot_number = db.Column(db.String(50), nullable=False)
     contact_details = db.Column(db.String(255), nullable=False)
@@ -22,9 +36,19 @@ class MaintenanceLog(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     work_order = db.relationship('WorkOrder', backref='maintenance_log', uselist=False, cascade='all, delete-orphan')
 
-class WorkOrder(db.Model):
+    # Every query is scoped to one company, so the indexes lead with it
+    __table_args__ = (
+        db.Index('ix_maintenance_logs_company_date_id', company_id, date, id),
+        db.Index('ix_maintenance_logs_company_class_date', company_id, maintenance_class, date),
+        db.Index('ix_maintenance_logs_company_lot_number_lower', company_id,
+                 db.func.lower(lot_number).label('lot_number_lower'),
+                 postgresql_ops={'lot_number_lower': 'varchar_pattern_ops'}),
+    )
+
+class WorkOrder(db.Model, TenantScoped):
     __tablename__ = 'work_orders'
     id = db.Column(db.Integer, primary_key=True)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False)
     maintenance_log_id = db.Column(db.Integer, db.ForeignKey('maintenance_logs.id'), nullable=False, unique=True)
     status = db.Column(db.String(20), nullable=False)
     assigned_to = db.Column(db.String(100), nullable=False)
@@ -34,25 +58,119 @@ class WorkOrder(db.Model):
     priority = db.Column(db.String(20), nullable=False)
     is_critical = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Bumped on every update so concurrent edits can't silently overwrite each other
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version}
+
+    __table_args__ = (
+        db.Index('ix_work_orders_company_scheduled_date_id', company_id, scheduled_date, id),
+        db.Index('ix_work_orders_company_status_scheduled_date', company_id, status, scheduled_date, id),
+        db.Index('ix_work_orders_company_status_completed_date', company_id, status, completed_date),
+        db.Index('ix_work_orders_company_assigned_to_scheduled_date', company_id, assigned_to, scheduled_date, id),
+        db.Index('ix_work_orders_company_critical_scheduled_date', company_id, scheduled_date, id,
+                 postgresql_where=is_critical.is_(True), sqlite_where=is_critical.is_(True)),
+    )
+
+class ArchivedMaintenanceLog(db.Model, TenantScoped):
+    """A closed maintenance log moved out of maintenance_logs by archive.py.
+
+    Ids are kept, so archived rows can be listed alongside live ones.
+    """
+    __tablename__ = 'archived_maintenance_logs'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    lot_number = db.Column(db.String(50), nullable=False)
+    contact_details = db.Column(db.String(255), nullable=False)
+    maintenance_class = db.Column(db.String(20), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    allocation = db.Column(db.String(100), nullable=False)
+    created_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_archived_maintenance_logs_company_date_id', company_id, date, id),
+    )
 
-class Notification(db.Model):
+class ArchivedWorkOrder(db.Model, TenantScoped):
+    __tablename__ = 'archived_work_orders'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False)
+    maintenance_log_id = db.Column(db.Integer, db.ForeignKey('archived_maintenance_logs.id'), nullable=False,
+                                   unique=True)
+    status = db.Column(db.String(20), nullable=False)
+    assigned_to = db.Column(db.String(100), nullable=False)
+    scheduled_date = db.Column(db.Date, nullable=False)
+    completed_date = db.Column(db.Date)
+    notes = db.Column(db.Text)
+    priority = db.Column(db.String(20), nullable=False)
+    is_critical = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime)
+    version = db.Column(db.Integer, nullable=False)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_archived_work_orders_company_scheduled_date_id', company_id, scheduled_date, id),
+    )
+
+class WorkOrderDailyStat(db.Model, TenantScoped):
+    """Per-day counts of work orders created and completed, by company and slice.
+
+    Maintained incrementally by daily_stats; each event is counted under the
+    order's priority, assignee and class at the time it happened.
+    """
+    __tablename__ = 'work_order_daily_stats'
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    priority = db.Column(db.String(20), primary_key=True)
+    assigned_to = db.Column(db.String(100), primary_key=True)
+    maintenance_class = db.Column(db.String(20), primary_key=True)
+    created_count = db.Column(db.Integer, nullable=False, default=0)
+    completed_count = db.Column(db.Integer, nullable=False, default=0)
+
+class WriteGeneration(db.Model):
+    """A counter per table and company, bumped in every transaction that
+    writes to it; company 0 counts writes made outside any company.
+
+    http_cache builds ETags from these so a conditional GET costs one primary
+    key lookup instead of the view's queries.
+    """
+    __tablename__ = 'write_generations'
+    table_name = db.Column(db.String(64), primary_key=True)
+    company_id = db.Column(db.Integer, primary_key=True, default=0)
+    generation = db.Column(db.BigInteger, nullable=False, default=0)
+
+class Notification(db.Model, TenantScoped):
     __tablename__ = 'notifications'
     id = db.Column(db.Integer, primary_key=True)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False)
     work_order_id = db.Column(db.Integer, db.ForeignKey('work_orders.id'), nullable=False)
     message = db.Column(db.String(255), nullable=False)
     is_read = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    work_order = db.relationship('WorkOrder', backref=db.backref('notifications', cascade='all, delete-orphan'))
+
+    __table_args__ = (
+        db.Index('ix_notifications_work_order_id', work_order_id),
+        db.Index('ix_notifications_company_unread_created_at', company_id, created_at, id,
+                 postgresql_where=is_read == False, sqlite_where=is_read == False),
+    )
 
-class User(db.Model, UserMixin):
+class User(db.Model, UserMixin, TenantScoped):
     __tablename__ = 'users'
     id = db.Column(db.Integer, primary_key=True)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False, index=True)
     username = db.Column(db.String(64), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(256))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    company = db.relationship('Company')
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = hash_password(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return verify_password(self.password_hash, password)
+
+register_user_cache_events(User)
@@ -0,0 +1,110 @@
+import json
+import logging
+import queue
+import select
+import threading
+import time
+from contextlib import contextmanager
+from flask import current_app
+from app import db
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'bmm_notifications'
+SUBSCRIBER_QUEUE_SIZE = 100
+
+class LocalBroker:
+    """Fan out notification events to the SSE streams of this process."""
+
+    def __init__(self):
+        self.subscribers = set()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def subscribe(self):
+        events = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self.lock:
+            self.subscribers.add(events)
+        try:
+            yield events
+        finally:
+            with self.lock:
+                self.subscribers.discard(events)
+
+    def dispatch(self, payload):
+        with self.lock:
+            subscribers = list(self.subscribers)
+        logger.debug("Dispatching notification %s to %d subscribers", payload.get('id'), len(subscribers))
+        for events in subscribers:
+            try:
+                events.put_nowait(payload)
+            except queue.Full:
+                # A stalled client misses events rather than blocking writers;
+                # it catches up from Last-Event-ID when it reconnects.
+                pass
+
+    def publish(self, payload):
+        self.dispatch(payload)
+
+class PostgresBroker(LocalBroker):
+    """Relay events through LISTEN/NOTIFY so every gunicorn worker sees them."""
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+        self.listener = threading.Thread(target=self.listen, name='notification-listener', daemon=True)
+        self.listener.start()
+
+    def publish(self, payload):
+        with self.engine.begin() as connection:
+            connection.execute(db.text('SELECT pg_notify(:channel, :payload)'),
+                               {'channel': CHANNEL, 'payload': json.dumps(payload)})
+
+    def listen(self):
+        while True:
+            raw = None
+            try:
+                raw = self.engine.raw_connection()
+                # Keep the LISTEN connection out of the request pool
+                raw.detach()
+                connection = raw.driver_connection
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN {CHANNEL}')
+                while True:
+                    if select.select([connection], [], [], 30) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        self.dispatch(json.loads(connection.notifies.pop(0).payload))
+            except Exception as e:
+                logger.error("Notification listener error: %s", e, exc_info=True)
+                time.sleep(5)
+            finally:
+                if raw is not None:
+                    raw.close()
+
+_broker = None
+_broker_lock = threading.Lock()
+
+def get_broker():
+    # Created on first use so each gunicorn worker gets its own listener after fork
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            if current_app.config['NOTIFICATION_BACKEND'] == 'postgres':
+                _broker = PostgresBroker(db.engine)
+            else:
+                _broker = LocalBroker()
+    return _broker
+
+def publish_notifications(payloads):
+    broker = get_broker()
+    for payload in payloads:
+        try:
+            broker.publish(payload)
+        except Exception as e:
+            logger.error("Error publishing notification %s: %s", payload.get('id'), e)
+
+def format_sse(payload):
+    return f"id: {payload['id']}\nevent: notification\ndata: {json.dumps(payload)}\n\n"
@@ -0,0 +1,242 @@
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+BATCH_CHUNK_SIZE = 16
+
+# Bump when the PDF layout changes so cached documents are re-rendered
+PDF_LAYOUT_VERSION = 1
+JOB_ID_PATTERN = re.compile(r'^\d+-[0-9a-f]{16}$')
+
+def pdf_job_id(data):
+    payload = json.dumps([PDF_LAYOUT_VERSION, data], sort_keys=True, default=str)
+    return f"{data['id']}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]}"
+
+class PDFCache:
+    """On-disk store of rendered PDFs, evicted least recently used first.
+
+    Pending and failed markers live next to the documents so every gunicorn
+    worker sharing the directory sees the same job status.
+    """
+
+    def __init__(self, directory, max_bytes, pending_timeout=300):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.pending_timeout = pending_timeout
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, job_id, suffix='.pdf'):
+        return os.path.join(self.directory, job_id + suffix)
+
+    def get(self, job_id):
+        path = self.path(job_id)
+        try:
+            # Refresh the mtime so eviction sees this document as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, job_id, content):
+        tmp_path = self.path(job_id, f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, self.path(job_id))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pdf'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+
+    def mark_pending(self, job_id):
+        with open(self.path(job_id, '.pending'), 'w'):
+            pass
+
+    def is_pending(self, job_id):
+        try:
+            return time.time() - os.path.getmtime(self.path(job_id, '.pending')) < self.pending_timeout
+        except FileNotFoundError:
+            return False
+
+    def mark_failed(self, job_id, message):
+        with open(self.path(job_id, '.error'), 'w') as f:
+            f.write(message)
+
+    def error(self, job_id):
+        try:
+            with open(self.path(job_id, '.error')) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def clear_markers(self, job_id):
+        for suffix in ('.pending', '.error'):
+            try:
+                os.remove(self.path(job_id, suffix))
+            except FileNotFoundError:
+                pass
+
+class PDFJobQueue:
+    """Renders work order PDFs into the cache in the background.
+
+    Each job's thread only waits on the render process, so the CPU-bound FPDF
+    work never competes with request threads for this worker's GIL.
+    """
+
+    def __init__(self, cache, workers, process_pool):
+        self.cache = cache
+        self.process_pool = process_pool
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pdf')
+        self.futures = {}
+        self.lock = threading.Lock()
+
+    def submit(self, data):
+        job_id = pdf_job_id(data)
+        if self.cache.get(job_id) or self.cache.is_pending(job_id):
+            logger.debug("PDF job %s already cached or pending", job_id)
+            return job_id
+
+        with self.lock:
+            future = self.futures.get(job_id)
+            if future is None or future.done():
+                self.cache.clear_markers(job_id)
+                self.cache.mark_pending(job_id)
+                self.futures[job_id] = self.executor.submit(self._render, job_id, data)
+        return job_id
+
+    def _render(self, job_id, data):
+        from pdf_render import render_work_order_pdf
+
+        try:
+            self.cache.put(job_id, self.process_pool.submit(render_work_order_pdf, data).result())
+            self.cache.clear_markers(job_id)
+        except Exception as e:
+            logger.error("Error rendering PDF job %s: %s", job_id, e, exc_info=True)
+            self.cache.mark_failed(job_id, str(e))
+            try:
+                os.remove(self.cache.path(job_id, '.pending'))
+            except FileNotFoundError:
+                pass
+        finally:
+            with self.lock:
+                self.futures.pop(job_id, None)
+
+    def status(self, job_id):
+        if self.cache.get(job_id):
+            return 'completed'
+        if self.cache.is_pending(job_id):
+            return 'pending'
+        if self.cache.error(job_id) is not None:
+            return 'failed'
+        return None
+
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_pdf_queue():
+    # Created on first use so each gunicorn worker gets its own threads after fork
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            config = current_app.config
+            cache = PDFCache(config['PDF_CACHE_DIR'], config['PDF_CACHE_MAX_BYTES'])
+            _queue = PDFJobQueue(cache, config['PDF_WORKERS'], get_pdf_process_pool())
+    return _queue
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+def get_pdf_process_pool():
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Forking this multithreaded worker could copy a lock another
+            # thread holds; the fork server starts children from a clean,
+            # single-threaded process that has only imported pdf_render
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(['pdf_render'])
+            _process_pool = ProcessPoolExecutor(max_workers=current_app.config['PDF_BATCH_PROCESSES'],
+                                                mp_context=context)
+    return _process_pool
+
+def render_pdf_batch(data_list):
+    # A single document cannot be split across processes, but rendering it in
+    # the pool keeps the request worker's interpreter free.
+    from pdf_render import render_work_order_batch
+
+    return get_pdf_process_pool().submit(render_work_order_batch, data_list).result()
+
+class ZipStream:
+    """Write-only file object that hands zipfile output back in chunks."""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+def iter_pdf_zip(data_list):
+    from pdf_render import render_work_order_pdf
+
+    cache = get_pdf_queue().cache
+    pending = []
+    stream = ZipStream()
+
+    with zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_STORED) as archive:
+        # Reuse documents already in the PDF cache and render the rest in parallel
+        for data in data_list:
+            path = cache.get(pdf_job_id(data))
+            if path:
+                with open(path, 'rb') as f:
+                    archive.writestr(f"work_order_{data['id']}.pdf", f.read())
+                yield stream.drain()
+            else:
+                pending.append(data)
+
+        rendered = get_pdf_process_pool().map(render_work_order_pdf, pending, chunksize=BATCH_CHUNK_SIZE)
+        for data, content in zip(pending, rendered):
+            archive.writestr(f"work_order_{data['id']}.pdf", content)
+            yield stream.drain()
+
+    yield stream.drain()
+
+def is_valid_job_id(job_id):
+    return bool(JOB_ID_PATTERN.match(job_id))
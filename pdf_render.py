@@ -0,0 +1,58 @@
+from fpdf import FPDF
+
+# Rendering only works on plain dicts built by utils.work_order_pdf_data so it
+# can run in worker threads and processes without a database session.
+
+def latin1(text):
+    # The core fonts only cover latin-1; anything else is printed as '?'
+    return text.encode('latin-1', 'replace').decode('latin-1')
+
+def add_work_order_page(pdf, data):
+    data = {key: latin1(value) if isinstance(value, str) else value for key, value in data.items()}
+    pdf.add_page()
+
+    # Set up fonts
+    pdf.set_font("Arial", "B", 16)
+    pdf.cell(0, 10, "Work Order", ln=True, align="C")
+    pdf.set_font("Arial", "", 12)
+
+    # Work Order Details
+    pdf.cell(0, 10, f"Work Order ID: {data['id']}", ln=True)
+    pdf.cell(0, 10, f"Status: {data['status']}", ln=True)
+    pdf.cell(0, 10, f"Assigned To: {data['assigned_to']}", ln=True)
+    pdf.cell(0, 10, f"Scheduled Date: {data['scheduled_date']}", ln=True)
+    pdf.cell(0, 10, f"Priority: {data['priority']}", ln=True)
+    pdf.cell(0, 10, f"Critical: {'Yes' if data['is_critical'] else 'No'}", ln=True)
+
+    # Maintenance Log Details
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 10, "Maintenance Log Details", ln=True)
+    pdf.set_font("Arial", "", 12)
+    pdf.cell(0, 10, f"Log ID: {data['log_id']}", ln=True)
+    pdf.cell(0, 10, f"Date: {data['log_date']}", ln=True)
+    pdf.cell(0, 10, f"Lot Number: {data['lot_number']}", ln=True)
+    pdf.cell(0, 10, f"Maintenance Class: {data['maintenance_class']}", ln=True)
+
+    # Description
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 10, "Description", ln=True)
+    pdf.set_font("Arial", "", 12)
+    pdf.multi_cell(0, 10, data['description'])
+
+    # Notes
+    if data['notes']:
+        pdf.set_font("Arial", "B", 14)
+        pdf.cell(0, 10, "Notes", ln=True)
+        pdf.set_font("Arial", "", 12)
+        pdf.multi_cell(0, 10, data['notes'])
+
+def render_work_order_pdf(data):
+    pdf = FPDF()
+    add_work_order_page(pdf, data)
+    return pdf.output(dest='S').encode('latin-1')
+
+def render_work_order_batch(data_list):
+    pdf = FPDF()
+    for data in data_list:
+        add_work_order_page(pdf, data)
+    return pdf.output(dest='S').encode('latin-1')
@@ -0,0 +1,50 @@
+import cProfile
+import logging
+import os
+import time
+from flask import g, request
+from flask_login import current_user
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+
+def is_profiling_allowed(app):
+    if not app.config['PROFILING_ENABLED'] or request.headers.get(PROFILE_HEADER) != '1':
+        return False
+    return current_user.is_authenticated and current_user.username in app.config['ADMIN_USERNAMES']
+
+def init_profiler(app):
+    """Profile single requests on demand.
+
+    An admin sends ``X-Profile: 1``; the cProfile stats for that request are
+    written to PROFILE_DIR and the file name comes back in ``X-Profile-File``.
+    """
+    if not app.config['PROFILING_ENABLED']:
+        return
+
+    @app.before_request
+    def start_profiler():
+        if not is_profiling_allowed(app):
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active on this interpreter
+            return
+        g.profiler = profiler
+
+    @app.after_request
+    def dump_profile(response):
+        profiler = g.pop('profiler', None)
+        if profiler is None:
+            return response
+        profiler.disable()
+        directory = app.config['PROFILE_DIR']
+        os.makedirs(directory, exist_ok=True)
+        filename = f"{request.endpoint or 'unmatched'}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}.prof"
+        profiler.dump_stats(os.path.join(directory, filename))
+        logger.info("Wrote request profile %s", filename, extra={'user': current_user.username})
+        response.headers['X-Profile-File'] = filename
+        return response
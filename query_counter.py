@@ -0,0 +1,44 @@
+import logging
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+def query_budget(limit):
+    """Declare the maximum number of SQL statements a view may issue."""
+    def decorator(view):
+        view.query_budget = limit
+        return view
+    return decorator
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and 'query_count' in g:
+        g.query_count += 1
+
+def init_query_counter(app):
+    if not app.config.get('SQL_QUERY_COUNTER'):
+        return
+
+    event.listen(Engine, 'before_cursor_execute', _count_query)
+
+    @app.before_request
+    def reset_query_count():
+        g.query_count = 0
+
+    @app.after_request
+    def check_query_budget(response):
+        count = g.get('query_count', 0)
+        response.headers['X-Query-Count'] = str(count)
+
+        view = app.view_functions.get(request.endpoint)
+        limit = getattr(view, 'query_budget', None)
+        if limit is not None and count > limit:
+            message = f"{request.endpoint} issued {count} SQL queries, budget is {limit}"
+            if app.testing:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
@@ -1,22 +1,51 @@
 import logging
-from flask import render_template, redirect, url_for, flash, request, jsonify, send_file
+from flask import (Blueprint, abort, current_app, g, render_template, redirect, url_for, flash, request, jsonify, send_file,
+                   Response, stream_with_context)
 from flask_login import login_user, login_required, logout_user, current_user
-from app import app, db
-from models import MaintenanceLog, WorkOrder, Notification, User
-from forms import MaintenanceLogForm, WorkOrderForm, CompanySetupForm, LoginForm, RegistrationForm
-from datetime import datetime, timedelta
-from sqlalchemy import func, and_
-import csv
+from flask_wtf.csrf import CSRFError
+from app import db
+from models import Company, MaintenanceLog, WorkOrder, Notification, User
+from forms import (MaintenanceLogWorkOrderForm, WorkOrderForm, LoginForm, RegistrationForm,
+                   MAINTENANCE_CLASS_CHOICES, PRIORITY_CHOICES)
+from datetime import datetime
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
 import io
-from fpdf import FPDF
-from utils import generate_work_order_pdf
+import queue
+import time
+from query_counter import query_budget
+from http_cache import conditional
+from tenancy import current_company_id, ALL_COMPANIES_OPTION
+from fragment_cache import cached_fragment, invalidate_fragments, RECENT_LOGS, UPCOMING_WORK_ORDERS
+from search import search_records, SEARCH_LIMIT, SEARCH_MAX_LIMIT
+from daily_stats import (completed_date_for, get_work_order_trend, parse_trend_window, record_work_order_created)
+from auth import PasswordHasherBusy, csrf_required
+from notifier import get_broker, publish_notifications, format_sse
+from pdf_jobs import get_pdf_queue, is_valid_job_id, iter_pdf_zip, render_pdf_batch
+from utils import (get_work_order_pdf_data, get_work_order_batch_pdf_data, get_work_order_page, get_cached_work_order_stats,
+                   invalidate_work_order_stats, search_maintenance_logs, format_maintenance_log_label,
+                   get_report_page, get_unread_notifications_page, mark_notifications_read,
+                   notification_payload, get_page_size, work_order_row, parse_status_transitions,
+                   apply_status_transitions, NOTIFICATION_PAGE_SIZE, STATUS_TRANSITION_MAX_BATCH)
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
-@app.route('/maintenance_log', methods=['GET', 'POST'])
+bp = Blueprint('main', __name__, cli_group=None)
+
+@bp.route('/')
+def root():
+    if current_user.is_authenticated:
+        return redirect(url_for('main.dashboard'))
+    return redirect(url_for('main.login'))
+
+@bp.app_errorhandler(CSRFError)
+def csrf_error(e):
+    return jsonify({'error': e.description}), 400
+
+@bp.route('/maintenance_log', methods=['GET', 'POST'])
 @login_required
 def maintenance_log():
-    form = MaintenanceLogForm()
+    form = MaintenanceLogWorkOrderForm()
     if form.validate_on_submit():
         new_log = MaintenanceLog(
             date=form.date.data,
@@ -34,12 +63,16 @@ def maintenance_log():
             status=form.status.data,
             assigned_to=form.assigned_to.data,
             scheduled_date=form.scheduled_date.data,
+            completed_date=completed_date_for(form.status.data),
             priority=form.priority.data,
             notes=form.notes.data,
             is_critical=form.is_critical.data
         )
         db.session.add(new_order)
+        db.session.flush()
+        record_work_order_created(new_order, new_log.maintenance_class)
 
+        notification = None
         if new_order.is_critical:
             notification = Notification(
                 work_order_id=new_order.id,
@@ -48,40 +81,57 @@ def maintenance_log():
             db.session.add(notification)
 
         db.session.commit()
+        invalidate_work_order_stats()
+        invalidate_fragments()
+        if notification:
+            publish_notifications([notification_payload(notification, new_log.lot_number)])
         flash('Maintenance log and work order created successfully', 'success')
-        return redirect(url_for('dashboard'))
+        return redirect(url_for('main.dashboard'))
 
     return render_template('maintenance_log.html', form=form)
 
-@app.route('/work_order', methods=['GET', 'POST'])
+@bp.route('/import/maintenance_logs', methods=['POST'])
+@login_required
+@csrf_required
+def import_maintenance_logs():
+    upload = request.files.get('file')
+    if upload is None or not upload.filename:
+        return jsonify({'error': 'A CSV file is required'}), 400
+
+    from importer import import_upload
+    imported, errors = import_upload(upload)
+    if imported:
+        invalidate_work_order_stats()
+        invalidate_fragments()
+    return jsonify({
+        'imported': imported,
+        'rejected': len(errors),
+        'errors': [{'row': row_number, 'errors': row_errors} for row_number, row_errors in errors]
+    })
+
+@bp.route('/work_order', methods=['GET', 'POST'])
 @login_required
 def work_order():
     try:
         form = WorkOrderForm()
-        logging.info(f"WorkOrderForm initialized with {len(form.maintenance_log_id.choices)} choices")
-        
-        # Log all available maintenance logs
-        all_logs = MaintenanceLog.query.all()
-        logging.info(f"Total maintenance logs in database: {len(all_logs)}")
-        for log in all_logs:
-            logging.info(f"Log ID: {log.id}, Date: {log.date}, Lot Number: {log.lot_number}")
-        
-        # Debug logging for form.maintenance_log_id.choices
-        logging.info(f"Maintenance log choices before rendering template: {form.maintenance_log_id.choices}")
-        
+
         if form.validate_on_submit():
-            logging.info(f"Form validated successfully. Maintenance log ID: {form.maintenance_log_id.data}")
+            logger.debug("Work order form valid for maintenance log %s", form.maintenance_log_id.data)
             new_order = WorkOrder(
                 maintenance_log_id=form.maintenance_log_id.data,
                 status=form.status.data,
                 assigned_to=form.assigned_to.data,
                 scheduled_date=form.scheduled_date.data,
+                completed_date=completed_date_for(form.status.data),
                 priority=form.priority.data,
                 notes=form.notes.data,
                 is_critical=form.is_critical.data
             )
             db.session.add(new_order)
+            db.session.flush()
+            record_work_order_created(new_order, form.maintenance_log.maintenance_class)
 
+            notification = None
             if new_order.is_critical:
                 notification = Notification(
                     work_order_id=new_order.id,
@@ -90,113 +140,421 @@ def work_order():
                 db.session.add(notification)
 
             db.session.commit()
+            invalidate_work_order_stats()
+            invalidate_fragments()
+            if notification:
+                publish_notifications([notification_payload(notification, form.maintenance_log.lot_number)])
             flash('Work order created successfully', 'success')
-            return redirect(url_for('dashboard'))
+            return redirect(url_for('main.dashboard'))
 
-        if request.method == 'POST' and not form.validate():
-            logging.error(f"Form validation errors: {form.errors}")
-            for field, errors in form.errors.items():
-                for error in errors:
-                    logging.error(f"Error in {field}: {error}")
+        if request.method == 'POST':
+            logger.warning("Work order form rejected", extra={'form_errors': form.errors})
             flash('There was an error creating the work order. Please check the form and try again.', 'danger')
 
-        logging.info(f"Rendering work_order template with {len(form.maintenance_log_id.choices)} maintenance log choices")
-        return render_template('work_order.html', form=form)
+        selected_log = getattr(form, 'maintenance_log', None)
+        selected_log_label = format_maintenance_log_label(selected_log) if selected_log else ''
+        return render_template('work_order.html', form=form, selected_log_label=selected_log_label)
     except Exception as e:
-        logging.error(f"Error in work_order route: {str(e)}")
+        logger.error("Error in work_order route: %s", e, exc_info=True)
         flash('An unexpected error occurred. Please try again later.', 'danger')
-        return redirect(url_for('dashboard'))
+        return redirect(url_for('main.dashboard'))
 
-@app.route('/login', methods=['GET', 'POST'])
+@bp.route('/login', methods=['GET', 'POST'])
 def login():
     if current_user.is_authenticated:
-        return redirect(url_for('dashboard'))
+        return redirect(url_for('main.dashboard'))
     form = LoginForm()
     if form.validate_on_submit():
         user = User.query.filter_by(username=form.username.data).first()
-        if user and user.check_password(form.password.data):
+        try:
+            password_ok = user is not None and user.check_password(form.password.data)
+        except PasswordHasherBusy:
+            flash('The server is busy signing other users in. Please try again in a moment.', 'warning')
+            return render_template('login.html', form=form), 503
+        if password_ok:
             login_user(user)
-            logging.info(f"User {user.username} logged in successfully")
+            logger.info("User %s logged in", user.username, extra={'user_id': user.id})
             next_page = request.args.get('next')
-            return redirect(next_page or url_for('dashboard'))
+            return redirect(next_page or url_for('main.dashboard'))
         else:
             flash('Invalid username or password', 'danger')
     return render_template('login.html', form=form)
 
-@app.route('/logout')
+@bp.route('/logout')
 @login_required
 def logout():
     logout_user()
-    return redirect(url_for('login'))
+    return redirect(url_for('main.login'))
 
-@app.route('/signup', methods=['GET', 'POST'])
+@bp.route('/signup', methods=['GET', 'POST'])
 def signup():
     if current_user.is_authenticated:
-        return redirect(url_for('dashboard'))
+        return redirect(url_for('main.dashboard'))
     form = RegistrationForm()
     if form.validate_on_submit():
         user = User(username=form.username.data, email=form.email.data)
-        user.set_password(form.password.data)
+        try:
+            user.set_password(form.password.data)
+        except PasswordHasherBusy:
+            flash('The server is busy right now. Please try again in a moment.', 'warning')
+            return render_template('signup.html', form=form), 503
+        # Each sign-up starts a new company; its data is only visible to its users
+        user.company = Company(name=form.company_name.data)
         db.session.add(user)
         db.session.commit()
         flash('Your account has been created! You are now able to log in', 'success')
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
     return render_template('signup.html', form=form)
 
-@app.route('/dashboard')
+@bp.route('/dashboard')
 @login_required
+@query_budget(5)
+@conditional('maintenance_logs', 'work_orders', 'notifications', csrf=True)
 def dashboard():
-    maintenance_logs = MaintenanceLog.query.order_by(MaintenanceLog.date.desc()).limit(5).all()
-    work_orders = WorkOrder.query.order_by(WorkOrder.scheduled_date).limit(5).all()
-    notifications = Notification.query.filter_by(is_read=False).all()
+    # The panels are the same for every user of a company, so they are
+    # cached per company and version of their tables and shared
+    def render_recent_logs():
+        maintenance_logs = MaintenanceLog.query.order_by(MaintenanceLog.date.desc()).limit(5).all()
+        return render_template('_recent_logs.html', maintenance_logs=maintenance_logs)
+
+    def render_upcoming_work_orders():
+        work_orders = WorkOrder.query.options(
+            joinedload(WorkOrder.maintenance_log)
+        ).order_by(WorkOrder.scheduled_date).limit(5).all()
+        return render_template('_upcoming_work_orders.html', work_orders=work_orders)
+
+    notifications, next_notifications_cursor = get_unread_notifications_page(request.args)
+
+    return render_template('dashboard.html',
+                           recent_logs_panel=cached_fragment(
+                               RECENT_LOGS, ('maintenance_logs',), render_recent_logs),
+                           upcoming_work_orders_panel=cached_fragment(
+                               UPCOMING_WORK_ORDERS, ('work_orders', 'maintenance_logs'), render_upcoming_work_orders),
+                           notifications=notifications,
+                           next_notifications_cursor=next_notifications_cursor)
+
+@bp.route('/api/notifications')
+@login_required
+@query_budget(3)
+@conditional('notifications', 'work_orders', 'maintenance_logs')
+def unread_notifications():
+    notifications, next_cursor = get_unread_notifications_page(request.args)
+    return jsonify({
+        'notifications': [
+            notification_payload(notification, notification.work_order.maintenance_log.lot_number)
+            for notification in notifications
+        ],
+        'next_cursor': next_cursor
+    })
+
+@bp.route('/mark_notification_as_read/<int:notification_id>', methods=['POST'])
+@login_required
+@csrf_required
+@query_budget(3)
+def mark_notification_as_read(notification_id):
+    updated = mark_notifications_read([notification_id])
+    return jsonify({'success': True, 'updated': updated})
+
+@bp.route('/notifications/mark_read', methods=['POST'])
+@login_required
+@csrf_required
+@query_budget(3)
+def mark_notifications_as_read():
+    data = request.get_json(silent=True) or {}
+    if data.get('all'):
+        updated = mark_notifications_read()
+    else:
+        ids = [i for i in data.get('ids', []) if isinstance(i, int)]
+        updated = mark_notifications_read(ids) if ids else 0
+    return jsonify({'success': True, 'updated': updated})
+
+@bp.route('/notifications/stream')
+@login_required
+def notification_stream():
+    if current_app.config['NOTIFICATION_TRANSPORT'] != 'stream':
+        abort(404)
+    last_event_id = request.headers.get('Last-Event-ID', type=int)
+    timeout = current_app.config['NOTIFICATION_STREAM_TIMEOUT']
+    company_id = current_company_id()
+    broker = get_broker()
+
+    def stream():
+        with broker.subscribe() as events:
+            # Replay what a reconnecting client missed, then release the DB
+            # connection for the rest of the stream.
+            if last_event_id is not None:
+                missed = Notification.query.filter(
+                    Notification.id > last_event_id,
+                    Notification.is_read == False
+                ).order_by(Notification.id).limit(NOTIFICATION_PAGE_SIZE).all()
+                for notification in missed:
+                    yield format_sse(notification_payload(notification))
+            db.session.remove()
 
-    return render_template('dashboard.html', 
-                           maintenance_logs=maintenance_logs, 
-                           work_orders=work_orders,
-                           notifications=notifications)
+            yield 'retry: 3000\n\n'
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                try:
+                    payload = events.get(timeout=min(15, max(deadline - time.monotonic(), 0.1)))
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                # The broker carries every company's events
+                if payload.get('company_id') == company_id:
+                    yield format_sse(payload)
 
-@app.route('/filtered_work_orders')
+    return Response(
+        stream_with_context(stream()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@bp.route('/filtered_work_orders')
 @login_required
+@query_budget(3)
+@conditional('work_orders')
 def filtered_work_orders():
-    work_orders = WorkOrder.query.all()
+    work_orders, next_cursor = get_work_order_page(request.args)
+    return jsonify({
+        'work_orders': [work_order_row(order) for order in work_orders],
+        'next_cursor': next_cursor
+    })
+
+@bp.route('/api/work_orders/status', methods=['POST'])
+@login_required
+@csrf_required
+@query_budget(5)
+def update_work_order_statuses():
+    data = request.get_json(silent=True) or {}
+    items = data.get('transitions')
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'Expected a non-empty "transitions" list.'}), 400
+    if len(items) > STATUS_TRANSITION_MAX_BATCH:
+        return jsonify({'error': f'At most {STATUS_TRANSITION_MAX_BATCH} transitions per request.'}), 400
+
+    transitions, errors = parse_status_transitions(items)
+    try:
+        updated, conflicts = apply_status_transitions(transitions)
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        logger.error("Error applying status transitions: %s", e, exc_info=True)
+        return jsonify({'error': 'An internal error has occurred. Please try again later.'}), 500
+
+    if updated:
+        invalidate_work_order_stats()
+        invalidate_fragments()
+    return jsonify({
+        'updated': [work_order_row(row) for row in updated],
+        'conflicts': conflicts,
+        'errors': errors,
+    })
+
+@bp.route('/api/work_order_stats')
+@login_required
+@query_budget(3)
+@conditional('work_orders')
+def work_order_stats():
+    return jsonify(get_cached_work_order_stats(g.get('resource_versions', {}).get('work_orders')))
+
+@bp.route('/api/work_order_trend')
+@login_required
+@query_budget(3)
+@conditional('work_order_daily_stats', daily=True)
+def work_order_trend():
+    return jsonify(get_work_order_trend(
+        parse_trend_window(request.args.get('days')),
+        group_by=request.args.get('group_by'),
+        filters=request.args
+    ))
+
+@bp.route('/api/maintenance_logs/search')
+@login_required
+@query_budget(3)
+@conditional('maintenance_logs')
+def maintenance_log_search():
+    logs = search_maintenance_logs(request.args.get('q'))
     return jsonify([{
-        'id': order.id,
-        'maintenance_log_id': order.maintenance_log_id,
-        'status': order.status,
-        'assigned_to': order.assigned_to,
-        'scheduled_date': order.scheduled_date.strftime('%Y-%m-%d'),
-        'priority': order.priority,
-        'is_critical': order.is_critical
-    } for order in work_orders])
-
-@app.route('/create_test_user')
+        'id': log.id,
+        'label': format_maintenance_log_label(log)
+    } for log in logs])
+
+@bp.route('/search')
+@login_required
+def search():
+    maintenance_classes = [value for value, _ in MAINTENANCE_CLASS_CHOICES]
+    return render_template('search.html', maintenance_classes=maintenance_classes)
+
+@bp.route('/api/search')
+@login_required
+@query_budget(3)
+@conditional('maintenance_logs', 'work_orders')
+def search_api():
+    limit = get_page_size(request.args, SEARCH_LIMIT, SEARCH_MAX_LIMIT)
+    return jsonify(search_records(
+        request.args.get('q'),
+        lot_number=request.args.get('lot_number'),
+        maintenance_classes=[c for c in request.args.getlist('maintenance_class') if c],
+        limit=limit
+    ))
+
+@bp.route('/reports')
+@login_required
+def reports():
+    maintenance_classes = [value for value, _ in MAINTENANCE_CLASS_CHOICES]
+    priorities = [value for value, _ in PRIORITY_CHOICES]
+    return render_template('reports.html',
+                           maintenance_classes=maintenance_classes,
+                           priorities=priorities)
+
+@bp.route('/filtered_reports')
+@login_required
+@query_budget(3)
+@conditional('maintenance_logs', 'work_orders')
+def filtered_reports():
+    return jsonify(get_report_page(request.args))
+
+@bp.route('/export_report/<report_type>')
+@login_required
+def export_report(report_type):
+    from exports import REPORT_COLUMNS, generate_csv, generate_pdf
+
+    export_format = request.args.get('format', 'csv')
+    if report_type not in REPORT_COLUMNS or export_format not in ('csv', 'pdf'):
+        flash('Unknown report export requested', 'error')
+        return redirect(url_for('main.reports'))
+
+    filename = f"{report_type}_{datetime.utcnow().strftime('%Y%m%d')}.{export_format}"
+    if export_format == 'pdf':
+        return send_file(
+            io.BytesIO(generate_pdf(report_type, request.args)),
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=filename
+        )
+
+    return Response(
+        stream_with_context(generate_csv(report_type, request.args)),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+@bp.route('/create_test_user')
 def create_test_user():
     try:
-        existing_user = User.query.filter_by(username='testuser').first()
+        # Usernames are unique across companies
+        existing_user = User.query.filter_by(username='testuser').execution_options(
+            **{ALL_COMPANIES_OPTION: True}).first()
         if existing_user:
             return jsonify({'message': 'Test user already exists'}), 200
         
-        test_user = User(username='testuser', email='testuser@example.com')
+        company = Company.query.filter_by(name='Test Company').first() or Company(name='Test Company')
+        test_user = User(username='testuser', email='testuser@example.com', company=company)
         test_user.set_password('testpassword')
         db.session.add(test_user)
         db.session.commit()
         return jsonify({'message': 'Test user created successfully'}), 200
     except Exception as e:
         db.session.rollback()
-        logging.error(f"Error creating test user: {e}", exc_info=True)
+        logger.error("Error creating test user: %s", e, exc_info=True)
         return jsonify({'error': 'An internal error has occurred. Please try again later.'}), 500
 
-@app.route('/work_order_pdf/<int:work_order_id>')
+@bp.route('/work_order_pdf/<int:work_order_id>')
 @login_required
+@query_budget(3)
+@conditional('work_orders', 'maintenance_logs')
 def work_order_pdf(work_order_id):
-    pdf_content = generate_work_order_pdf(work_order_id)
-    if pdf_content:
+    data = get_work_order_pdf_data(work_order_id)
+    if not data:
+        flash('Work order not found', 'error')
+        return redirect(url_for('main.dashboard'))
+
+    # A miss answers with the job straight away rather than holding this
+    # request thread until the render finishes
+    queue = get_pdf_queue()
+    job_id = queue.submit(data)
+    path = queue.cache.get(job_id)
+    if path:
         return send_file(
-            io.BytesIO(pdf_content),
+            path,
             mimetype='application/pdf',
             as_attachment=True,
             download_name=f'work_order_{work_order_id}.pdf'
         )
-    else:
-        flash('Work order not found', 'error')
-        return redirect(url_for('dashboard'))
\ No newline at end of file
+    return jsonify(pdf_job_response(job_id, queue.status(job_id))), 202
+
+@bp.route('/work_orders/batch_pdf', methods=['GET', 'POST'])
+@login_required
+@query_budget(2)
+def work_order_batch_pdf():
+    data_list = get_work_order_batch_pdf_data(request.values, current_app.config['PDF_BATCH_MAX_ORDERS'])
+    if not data_list:
+        flash('No work orders matched the selection', 'error')
+        return redirect(url_for('main.work_order'))
+
+    filename = f"work_orders_{datetime.utcnow().strftime('%Y%m%d')}"
+    if request.values.get('layout') == 'zip':
+        return Response(
+            stream_with_context(iter_pdf_zip(data_list)),
+            mimetype='application/zip',
+            headers={'Content-Disposition': f'attachment; filename={filename}.zip'}
+        )
+
+    return send_file(
+        io.BytesIO(render_pdf_batch(data_list)),
+        mimetype='application/pdf',
+        as_attachment=True,
+        download_name=f'{filename}.pdf'
+    )
+
+def pdf_job_response(job_id, status):
+    response = {
+        'job_id': job_id,
+        'status': status,
+        'status_url': url_for('main.pdf_job_status', job_id=job_id)
+    }
+    if status == 'completed':
+        response['download_url'] = url_for('main.pdf_job_download', job_id=job_id)
+    return response
+
+@bp.route('/api/work_order_pdf/<int:work_order_id>/jobs', methods=['POST'])
+@login_required
+@query_budget(2)
+def create_pdf_job(work_order_id):
+    data = get_work_order_pdf_data(work_order_id)
+    if not data:
+        return jsonify({'error': 'Work order not found'}), 404
+
+    queue = get_pdf_queue()
+    job_id = queue.submit(data)
+    return jsonify(pdf_job_response(job_id, queue.status(job_id))), 202
+
+@bp.route('/api/pdf_jobs/<job_id>')
+@login_required
+@query_budget(1)
+def pdf_job_status(job_id):
+    queue = get_pdf_queue()
+    status = queue.status(job_id) if is_valid_job_id(job_id) else None
+    if status is None:
+        return jsonify({'error': 'Unknown PDF job'}), 404
+
+    response = pdf_job_response(job_id, status)
+    if status == 'failed':
+        response['error'] = queue.cache.error(job_id)
+    return jsonify(response)
+
+@bp.route('/pdf_jobs/<job_id>/download')
+@login_required
+@query_budget(1)
+def pdf_job_download(job_id):
+    path = get_pdf_queue().cache.get(job_id) if is_valid_job_id(job_id) else None
+    if not path:
+        flash('PDF is not available yet', 'error')
+        return redirect(url_for('main.work_order'))
+
+    work_order_id = job_id.split('-', 1)[0]
+    return send_file(
+        path,
+        mimetype='application/pdf',
+        as_attachment=True,
+        download_name=f'work_order_{work_order_id}.pdf'
+    )
@@ -0,0 +1,198 @@
+import re
+from markupsafe import Markup, escape
+from sqlalchemy import column, event, func, literal_column, or_, select, table, text, union
+from app import db
+from models import MaintenanceLog, WorkOrder
+from utils import escape_like
+
+SEARCH_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SEARCH_CONFIG = 'english'
+# Control characters mark matches inside snippets; they cannot occur in form
+# input, so the text can be HTML-escaped before they become <mark> tags.
+MATCH_START = '\x02'
+MATCH_END = '\x03'
+
+# PostgreSQL: stored generated tsvector columns with GIN indexes. Descriptions
+# rank above work order notes.
+POSTGRES_DDL = [
+    f"""ALTER TABLE maintenance_logs ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'A')) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_maintenance_logs_search_vector ON maintenance_logs USING gin (search_vector)",
+    f"""ALTER TABLE work_orders ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(notes, '')), 'B')) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_work_orders_search_vector ON work_orders USING gin (search_vector)",
+]
+
+# SQLite: an FTS5 table keyed by maintenance log id, kept in step by triggers.
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS maintenance_log_fts USING fts5(description, notes, tokenize='porter unicode61')",
+    """CREATE TRIGGER IF NOT EXISTS maintenance_logs_fts_insert AFTER INSERT ON maintenance_logs BEGIN
+        INSERT INTO maintenance_log_fts(rowid, description, notes) VALUES (new.id, new.description, '');
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS maintenance_logs_fts_update AFTER UPDATE OF description ON maintenance_logs BEGIN
+        UPDATE maintenance_log_fts SET description = new.description WHERE rowid = new.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS maintenance_logs_fts_delete AFTER DELETE ON maintenance_logs BEGIN
+        DELETE FROM maintenance_log_fts WHERE rowid = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS work_orders_fts_insert AFTER INSERT ON work_orders BEGIN
+        UPDATE maintenance_log_fts SET notes = coalesce(new.notes, '') WHERE rowid = new.maintenance_log_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS work_orders_fts_update AFTER UPDATE OF notes ON work_orders BEGIN
+        UPDATE maintenance_log_fts SET notes = coalesce(new.notes, '') WHERE rowid = new.maintenance_log_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS work_orders_fts_delete AFTER DELETE ON work_orders BEGIN
+        UPDATE maintenance_log_fts SET notes = '' WHERE rowid = old.maintenance_log_id;
+    END""",
+]
+
+def install_search_schema(target, connection, **kw):
+    ddl = {'postgresql': POSTGRES_DDL, 'sqlite': SQLITE_DDL}.get(connection.dialect.name, [])
+    for statement in ddl:
+        connection.execute(text(statement))
+
+def drop_search_schema(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        connection.execute(text('DROP TABLE IF EXISTS maintenance_log_fts'))
+
+# create_all/drop_all (flask init-db, seeding, benchmarks) set up the search
+# objects too; existing databases get them from the migration.
+event.listen(db.metadata, 'after_create', install_search_schema)
+event.listen(db.metadata, 'before_drop', drop_search_schema)
+
+def highlight(snippet):
+    """Escape a snippet and turn the match markers into <mark> tags."""
+    if not snippet:
+        return Markup('')
+    return Markup(
+        str(escape(snippet)).replace(MATCH_START, '<mark>').replace(MATCH_END, '</mark>')
+    )
+
+def fts5_query(term):
+    # Quote every token so user input can't use FTS5 syntax; the last token
+    # matches as a prefix for search-as-you-type.
+    tokens = re.findall(r'\w+', term)
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"' for token in tokens) + '*'
+
+def _apply_filters(query, lot_number, maintenance_classes):
+    if lot_number:
+        query = query.where(
+            func.lower(MaintenanceLog.lot_number).like(f'{escape_like(lot_number.lower())}%', escape='\\')
+        )
+    if maintenance_classes:
+        query = query.where(MaintenanceLog.maintenance_class.in_(maintenance_classes))
+    return query
+
+def _result_columns():
+    return [
+        MaintenanceLog.id,
+        MaintenanceLog.date,
+        MaintenanceLog.lot_number,
+        MaintenanceLog.maintenance_class,
+        WorkOrder.id.label('work_order_id'),
+        WorkOrder.status,
+    ]
+
+def _search_postgres(term, lot_number, maintenance_classes, limit):
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, term)
+    log_vector = literal_column('maintenance_logs.search_vector')
+    notes_vector = literal_column('work_orders.search_vector')
+
+    # Each side of the UNION can use its own GIN index
+    matches = union(
+        select(MaintenanceLog.id.label('id')).where(log_vector.op('@@')(query)),
+        select(WorkOrder.maintenance_log_id.label('id')).where(notes_vector.op('@@')(query)),
+    ).subquery()
+
+    rank = func.ts_rank_cd(log_vector.op('||')(func.coalesce(notes_vector, text("''::tsvector"))), query)
+    ranked = _apply_filters(
+        select(MaintenanceLog.id.label('id'), rank.label('rank'))
+        .join(matches, matches.c.id == MaintenanceLog.id)
+        .outerjoin(WorkOrder, WorkOrder.maintenance_log_id == MaintenanceLog.id),
+        lot_number, maintenance_classes
+    ).order_by(rank.desc(), MaintenanceLog.date.desc()).limit(limit).subquery()
+
+    # Headlines are only built for the page being returned
+    options = f'StartSel={MATCH_START}, StopSel={MATCH_END}, MaxFragments=2, MaxWords=20, MinWords=5'
+    rows = db.session.execute(
+        select(
+            *_result_columns(),
+            ranked.c.rank,
+            func.ts_headline(SEARCH_CONFIG, MaintenanceLog.description, query, options).label('description_snippet'),
+            func.ts_headline(SEARCH_CONFIG, func.coalesce(WorkOrder.notes, ''), query, options).label('notes_snippet'),
+        )
+        .select_from(ranked)
+        .join(MaintenanceLog, MaintenanceLog.id == ranked.c.id)
+        .outerjoin(WorkOrder, WorkOrder.maintenance_log_id == MaintenanceLog.id)
+        .order_by(ranked.c.rank.desc(), MaintenanceLog.date.desc())
+    ).all()
+    return rows
+
+def _search_sqlite(term, lot_number, maintenance_classes, limit):
+    match = fts5_query(term)
+    if match is None:
+        return []
+    fts = table('maintenance_log_fts', column('rowid'))
+    fts_table = literal_column('maintenance_log_fts')
+    # bm25 is lower for better matches; descriptions weigh twice as much as notes
+    rank = func.bm25(fts_table, 2.0, 1.0)
+
+    def snippet(index):
+        return func.snippet(fts_table, index, MATCH_START, MATCH_END, '…', 16)
+
+    query = _apply_filters(
+        select(
+            *_result_columns(),
+            (-rank).label('rank'),
+            snippet(0).label('description_snippet'),
+            snippet(1).label('notes_snippet'),
+        )
+        .select_from(fts)
+        .join(MaintenanceLog, MaintenanceLog.id == fts.c.rowid)
+        .outerjoin(WorkOrder, WorkOrder.maintenance_log_id == MaintenanceLog.id)
+        .where(fts_table.op('MATCH')(match)),
+        lot_number, maintenance_classes
+    ).order_by(rank, MaintenanceLog.date.desc()).limit(limit)
+    return db.session.execute(query).all()
+
+def _search_like(term, lot_number, maintenance_classes, limit):
+    pattern = f'%{escape_like(term)}%'
+    query = _apply_filters(
+        select(
+            *_result_columns(),
+            literal_column('0').label('rank'),
+            MaintenanceLog.description.label('description_snippet'),
+            WorkOrder.notes.label('notes_snippet'),
+        )
+        .select_from(MaintenanceLog)
+        .outerjoin(WorkOrder, WorkOrder.maintenance_log_id == MaintenanceLog.id)
+        .where(or_(MaintenanceLog.description.ilike(pattern, escape='\\'),
+                   WorkOrder.notes.ilike(pattern, escape='\\'))),
+        lot_number, maintenance_classes
+    ).order_by(MaintenanceLog.date.desc(), MaintenanceLog.id.desc()).limit(limit)
+    return db.session.execute(query).all()
+
+def search_records(term, lot_number=None, maintenance_classes=None, limit=SEARCH_LIMIT):
+    """Ranked full-text search over maintenance descriptions and work order notes."""
+    term = (term or '').strip()
+    if not term:
+        return []
+
+    dialect = db.session.get_bind().dialect.name
+    search = {'postgresql': _search_postgres, 'sqlite': _search_sqlite}.get(dialect, _search_like)
+    rows = search(term, (lot_number or '').strip(), maintenance_classes, limit)
+
+    return [{
+        'id': row.id,
+        'date': row.date.strftime('%Y-%m-%d'),
+        'lot_number': row.lot_number,
+        'maintenance_class': row.maintenance_class,
+        'work_order_id': row.work_order_id,
+        'status': row.status,
+        'rank': round(float(row.rank or 0), 4),
+        'description': highlight(row.description_snippet),
+        'notes': highlight(row.notes_snippet),
+    } for row in rows]
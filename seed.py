@@ -0,0 +1,165 @@
+import math
+import random
+from datetime import date, datetime, timedelta
+from sqlalchemy import insert
+from app import db
+from models import Company, MaintenanceLog, WorkOrder, Notification
+from daily_stats import record_work_orders_created
+
+SEED_BATCH_SIZE = 5000
+
+CLASSES = ['3MTR', 'IAS', 'Supplier']
+CLASS_WEIGHTS = [6, 3, 1]
+PRIORITIES = ['Low', 'Medium', 'High']
+PRIORITY_WEIGHTS = [5, 3, 2]
+ALLOCATIONS = ['General', 'Warranty', 'Builder', 'Supplier']
+DESCRIPTION_WORDS = [
+    'leaking', 'tap', 'cracked', 'tile', 'door', 'sticking', 'window', 'seal', 'roof', 'gutter',
+    'paint', 'peeling', 'plaster', 'crack', 'hot', 'water', 'system', 'fault', 'electrical',
+    'switch', 'garage', 'motor', 'fence', 'paving', 'drain', 'blocked', 'cabinet', 'hinge',
+]
+HISTORY_DAYS = 730
+
+def parse_scale(value):
+    """Accept plain counts or shorthand such as ``10k`` and ``1M``."""
+    value = str(value).strip().lower()
+    multiplier = 1
+    if value.endswith('k'):
+        multiplier, value = 1000, value[:-1]
+    elif value.endswith('m'):
+        multiplier, value = 1000000, value[:-1]
+    return int(float(value) * multiplier)
+
+def zipf_weights(n, s=1.1):
+    return [1 / (rank ** s) for rank in range(1, n + 1)]
+
+class SeedData:
+    """Draws skewed but repeatable rows: recent dates, a few busy lots and
+    crews, and older work more likely to be completed."""
+
+    def __init__(self, random_seed, lots, crews):
+        self.rng = random.Random(random_seed)
+        self.today = date.today()
+        self.lots = [f'LOT-{n:05d}' for n in range(1, lots + 1)]
+        self.lot_weights = list(self._cumulative(zipf_weights(lots)))
+        self.crews = [f'Crew {n}' for n in range(1, crews + 1)]
+        self.crew_weights = list(self._cumulative(zipf_weights(crews, 0.8)))
+
+    @staticmethod
+    def _cumulative(weights):
+        total = 0
+        for weight in weights:
+            total += weight
+            yield total
+
+    def log_date(self):
+        # Exponential decay: most activity is in the last few months
+        age = min(int(self.rng.expovariate(1 / 120)), HISTORY_DAYS)
+        return self.today - timedelta(days=age)
+
+    def status(self, age_days):
+        completed = 1 - math.exp(-age_days / 45)
+        roll = self.rng.random()
+        if roll < completed:
+            return 'Completed'
+        return 'In Progress' if roll < completed + (1 - completed) * 0.4 else 'Pending'
+
+    def description(self):
+        return ' '.join(self.rng.choices(DESCRIPTION_WORDS, k=self.rng.randint(4, 14)))
+
+    def timestamp(self, day):
+        return datetime.combine(day, datetime.min.time()) + timedelta(seconds=self.rng.randint(7 * 3600, 18 * 3600))
+
+    def log(self, company_id):
+        log_date = self.log_date()
+        return {
+            'company_id': company_id,
+            'date': log_date,
+            'lot_number': self.rng.choices(self.lots, cum_weights=self.lot_weights)[0],
+            'contact_details': f'04{self.rng.randint(10000000, 99999999)}',
+            'maintenance_class': self.rng.choices(CLASSES, weights=CLASS_WEIGHTS)[0],
+            'description': self.description(),
+            'allocation': self.rng.choice(ALLOCATIONS),
+            'created_at': self.timestamp(log_date),
+        }
+
+    def work_order(self, log_id, log):
+        age_days = (self.today - log['date']).days
+        status = self.status(age_days)
+        priority = self.rng.choices(PRIORITIES, weights=PRIORITY_WEIGHTS)[0]
+        scheduled_date = log['date'] + timedelta(days=self.rng.randint(0, 21))
+        completed_date = None
+        if status == 'Completed':
+            completed_date = scheduled_date + timedelta(days=self.rng.randint(0, 14))
+            if completed_date > self.today:
+                status, completed_date = 'In Progress', None
+        return {
+            'company_id': log['company_id'],
+            'maintenance_log_id': log_id,
+            'status': status,
+            'assigned_to': self.rng.choices(self.crews, cum_weights=self.crew_weights)[0],
+            'scheduled_date': scheduled_date,
+            'completed_date': completed_date,
+            'notes': None,
+            'priority': priority,
+            'is_critical': priority == 'High' and self.rng.random() < 0.15,
+            'created_at': self.timestamp(log['date']),
+        }
+
+def seed_database(logs, batch_size=SEED_BATCH_SIZE, random_seed=42, lots=5000, crews=25, work_order_rate=0.9,
+                  companies=1):
+    """Insert ``logs`` maintenance logs with related work orders and notifications.
+
+    The logs are dealt round-robin to ``companies`` new companies. Rows go in
+    with one multi-row INSERT per table and batch; generated ids come back
+    through RETURNING so sequences stay consistent.
+    """
+    data = SeedData(random_seed, lots, crews)
+    counts = {'companies': companies, 'maintenance_logs': 0, 'work_orders': 0, 'notifications': 0}
+    first_company = db.session.query(db.func.count(Company.id)).scalar() + 1
+    company_ids = db.session.scalars(
+        insert(Company).returning(Company.id, sort_by_parameter_order=True),
+        [{'name': f'Builder {n}'} for n in range(first_company, first_company + companies)]
+    ).all()
+
+    for start in range(0, logs, batch_size):
+        log_rows = [data.log(company_ids[(start + i) % companies]) for i in range(min(batch_size, logs - start))]
+        log_ids = db.session.scalars(
+            insert(MaintenanceLog).returning(MaintenanceLog.id, sort_by_parameter_order=True),
+            log_rows
+        ).all()
+
+        ordered_logs = [
+            (log_id, log) for log_id, log in zip(log_ids, log_rows)
+            if data.rng.random() < work_order_rate
+        ]
+        order_rows = [data.work_order(log_id, log) for log_id, log in ordered_logs]
+        if order_rows:
+            record_work_orders_created(
+                dict(order, maintenance_class=log['maintenance_class'])
+                for order, (_, log) in zip(order_rows, ordered_logs)
+            )
+            order_ids = db.session.scalars(
+                insert(WorkOrder).returning(WorkOrder.id, sort_by_parameter_order=True),
+                order_rows
+            ).all()
+            notification_rows = [
+                {
+                    'company_id': order['company_id'],
+                    'work_order_id': order_id,
+                    'message': f"Critical work order created for maintenance log {order['maintenance_log_id']}",
+                    'is_read': order['status'] == 'Completed' or data.rng.random() < 0.5,
+                    'created_at': datetime.utcnow(),
+                }
+                for order_id, order in zip(order_ids, order_rows)
+                if order['is_critical']
+            ]
+            if notification_rows:
+                db.session.execute(insert(Notification), notification_rows)
+            counts['notifications'] += len(notification_rows)
+
+        db.session.commit()
+        counts['maintenance_logs'] += len(log_rows)
+        counts['work_orders'] += len(order_rows)
+
+    return counts
@@ -0,0 +1,53 @@
+import multiprocessing
+import os
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+def env_bool(name, default):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+def on_starting(server):
+    # Worker metric snapshots from a previous run would otherwise be summed in
+    from main import app
+    from metrics import MetricsStore
+    if app.config['METRICS_ENABLED']:
+        MetricsStore(app.config['METRICS_DIR'], 0).clear()
+
+def post_fork(server, worker):
+    # With preload_app the master imported the app; drop any pooled
+    # connections it opened so workers never share a socket.
+    from app import db
+    from main import app
+    from log_config import restart_log_listener
+    restart_log_listener()
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+def default_workers(worker_class):
+    cpus = multiprocessing.cpu_count()
+    # Threaded workers overlap I/O inside each process, so fewer are needed
+    if worker_class == 'gthread':
+        return cpus + 1
+    return cpus * 2 + 1
+
+def gunicorn_options(port=None):
+    worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+    return {
+        'bind': f"0.0.0.0:{port or os.environ.get('PORT', 5000)}",
+        'workers': env_int('WEB_CONCURRENCY', default_workers(worker_class)),
+        'worker_class': worker_class,
+        'threads': env_int('GUNICORN_THREADS', 4),
+        'preload_app': env_bool('GUNICORN_PRELOAD', True),
+        'keepalive': env_int('GUNICORN_KEEPALIVE', 5),
+        'timeout': env_int('GUNICORN_TIMEOUT', 60),
+        'graceful_timeout': env_int('GUNICORN_GRACEFUL_TIMEOUT', 30),
+        'max_requests': env_int('GUNICORN_MAX_REQUESTS', 0),
+        'max_requests_jitter': env_int('GUNICORN_MAX_REQUESTS_JITTER', 0),
+        'on_starting': on_starting,
+        'post_fork': post_fork,
+    }
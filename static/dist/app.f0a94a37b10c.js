@@ -0,0 +1,2 @@
+function validateForm(form){let isValid=true;const requiredFields=(form||document).querySelectorAll('[required]');requiredFields.forEach(field=>{if(!field.value){isValid=false;field.classList.add('is-invalid');}else{field.classList.remove('is-invalid');}});return isValid;}
+function csrfToken(){const meta=document.querySelector('meta[name="csrf-token"]');return meta?meta.content:'';}
\ No newline at end of file
@@ -0,0 +1 @@
+document.addEventListener('DOMContentLoaded',function(){const form=document.getElementById('company-setup-form');const logoUrlInput=document.getElementById('logo_url');const logoPreview=document.getElementById('logo-preview');form.addEventListener('submit',function(event){event.preventDefault();if(validateForm(this)){this.submit();}});logoUrlInput.addEventListener('input',function(){updateLogoPreview(this.value);});});function updateLogoPreview(url){const logoPreview=document.getElementById('logo-preview');if(url){logoPreview.src=url;logoPreview.style.display='block';}else{logoPreview.src='';logoPreview.style.display='none';}}
\ No newline at end of file
@@ -0,0 +1,9 @@
+document.addEventListener('DOMContentLoaded',function(){fetch('/api/work_order_stats').then(response=>response.json()).then(data=>{updateWorkOrderStats(data);});initNotifications();});function updateWorkOrderStats(data){document.getElementById('total-work-orders').textContent=data.total;document.getElementById('pending-work-orders').textContent=data.pending;document.getElementById('in-progress-work-orders').textContent=data.in_progress;document.getElementById('completed-work-orders').textContent=data.completed;}
+function initNotifications(){const card=document.getElementById('notifications-card');const list=document.getElementById('notifications-list');if(!card||!list){return;}
+list.addEventListener('click',function(event){const button=event.target.closest('.mark-as-read');if(!button){return;}
+fetch(`/mark_notification_as_read/${button.dataset.notificationId}`,{method:'POST',headers:{'X-CSRFToken':csrfToken()}}).then(response=>response.json()).then(data=>{if(data.success){button.closest('li').remove();updateNotificationsCard();}});});document.getElementById('mark-all-as-read').addEventListener('click',function(){fetch('/notifications/mark_read',{method:'POST',headers:{'Content-Type':'application/json','X-CSRFToken':csrfToken()},body:JSON.stringify({all:true})}).then(response=>response.json()).then(data=>{if(data.success){list.innerHTML='';document.getElementById('notifications-more').style.display='none';updateNotificationsCard();}});});const loadMoreBtn=document.getElementById('load-more-notifications');loadMoreBtn.addEventListener('click',function(){fetch(`/api/notifications?cursor=${encodeURIComponent(this.dataset.cursor)}`).then(response=>response.json()).then(data=>{data.notifications.forEach(notification=>addNotification(notification,false));loadMoreBtn.dataset.cursor=data.next_cursor||'';document.getElementById('notifications-more').style.display=data.next_cursor?'':'none';});});if(card.dataset.transport==='stream'&&window.EventSource){const source=new EventSource('/notifications/stream');source.addEventListener('notification',function(event){addNotification(JSON.parse(event.data),true);});}else{const interval=(parseInt(card.dataset.pollInterval,10)||15)*1000;setInterval(function(){if(document.hidden){return;}
+fetch('/api/notifications').then(response=>response.json()).then(data=>{data.notifications.slice().reverse().forEach(notification=>addNotification(notification,true));});},interval);}}
+function addNotification(notification,prepend){const list=document.getElementById('notifications-list');if(list.querySelector(`li[data-notification-id="${notification.id}"]`)){return;}
+const item=document.createElement('li');item.className='list-group-item d-flex justify-content-between align-items-center py-1';item.dataset.notificationId=notification.id;const text=document.createElement('small');text.textContent=notification.lot_number?`Lot ${notification.lot_number}: ${notification.message}`:notification.message;const button=document.createElement('button');button.className='btn btn-sm btn-outline-secondary mark-as-read';button.dataset.notificationId=notification.id;button.textContent='Mark as Read';item.appendChild(text);item.appendChild(button);if(prepend){list.prepend(item);}else{list.appendChild(item);}
+updateNotificationsCard();}
+function updateNotificationsCard(){const list=document.getElementById('notifications-list');document.getElementById('notifications-card').style.display=list.children.length?'':'none';}
\ No newline at end of file
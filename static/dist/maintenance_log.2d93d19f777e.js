@@ -0,0 +1,3 @@
+document.addEventListener('DOMContentLoaded',function(){const form=document.getElementById('maintenance-log-form');form.addEventListener('submit',function(event){event.preventDefault();if(validateForm(this)){this.submit();}});const importForm=document.getElementById('import-form');const importResult=document.getElementById('import-result');importForm.addEventListener('submit',function(event){event.preventDefault();if(!validateForm(this)){return;}
+fetch(this.action,{method:'POST',body:new FormData(this)}).then(response=>response.json()).then(data=>{if(data.error){importResult.className='mt-3 alert alert-danger';importResult.textContent=data.error;return;}
+importResult.className=`mt-3 alert ${data.rejected ? 'alert-warning' : 'alert-success'}`;importResult.textContent=`Imported ${data.imported} rows, rejected ${data.rejected}.`;if(data.errors.length){const list=document.createElement('ul');data.errors.forEach(error=>{const item=document.createElement('li');item.textContent=`Row ${error.row}: ${JSON.stringify(error.errors)}`;list.appendChild(item);});importResult.appendChild(list);}}).catch(()=>{importResult.className='mt-3 alert alert-danger';importResult.textContent='The import failed. Please try again.';});});});
\ No newline at end of file
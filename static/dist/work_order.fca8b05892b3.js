@@ -0,0 +1,38 @@
+document.addEventListener('DOMContentLoaded',function(){const form=document.getElementById('work-order-form');if(form){form.addEventListener('submit',function(event){event.preventDefault();if(validateForm(this)){this.submit();}});}
+const filterForm=document.getElementById('filter-form');if(filterForm){filterForm.addEventListener('submit',function(event){event.preventDefault();fetchFilteredWorkOrders();});}
+const loadMoreBtn=document.getElementById('load-more-work-orders');if(loadMoreBtn&&filterForm){loadMoreBtn.addEventListener('click',function(){fetchFilteredWorkOrders(nextWorkOrdersCursor);});}
+initMaintenanceLogSearch();fetchFilteredWorkOrders();});function initMaintenanceLogSearch(){const searchInput=document.getElementById('maintenance-log-search');const hiddenInput=document.getElementById('maintenance_log_id');const results=document.getElementById('maintenance-log-results');if(!searchInput||!hiddenInput||!results){return;}
+let debounceTimer=null;searchInput.addEventListener('input',function(){hiddenInput.value='';clearTimeout(debounceTimer);const term=this.value.trim();if(!term){results.innerHTML='';return;}
+debounceTimer=setTimeout(function(){fetch(`/api/maintenance_logs/search?q=${encodeURIComponent(term)}`).then(response=>response.json()).then(logs=>{results.innerHTML='';logs.forEach(log=>{const item=document.createElement('button');item.type='button';item.className='list-group-item list-group-item-action';item.textContent=log.label;item.addEventListener('click',function(){hiddenInput.value=log.id;searchInput.value=log.label;results.innerHTML='';});results.appendChild(item);});}).catch(error=>{console.error('Error:',error);});},250);});}
+let nextWorkOrdersCursor=null;function fetchFilteredWorkOrders(cursor){const filterForm=document.getElementById('filter-form');if(filterForm){const formData=new FormData(filterForm);const params=new URLSearchParams(formData);if(cursor){params.set('cursor',cursor);}
+fetch(`/filtered_work_orders?${params.toString()}`).then(response=>response.json()).then(data=>{updateWorkOrdersTable(data.work_orders,Boolean(cursor));nextWorkOrdersCursor=data.next_cursor;updateLoadMoreButton();}).catch(error=>{console.error('Error:',error);});}}
+function updateLoadMoreButton(){const loadMoreBtn=document.getElementById('load-more-work-orders');if(loadMoreBtn){loadMoreBtn.style.display=nextWorkOrdersCursor?'':'none';}}
+function renderWorkOrderRow(row,order){row.dataset.workOrderId=order.id;row.dataset.version=order.version;row.innerHTML=`
+        <td>${order.id}</td>
+        <td>${order.maintenance_log_id}</td>
+        <td>${order.status}</td>
+        <td>${order.assigned_to}</td>
+        <td>${order.scheduled_date}</td>
+        <td>${order.priority}</td>
+        <td>${order.is_critical ? 'Yes' : 'No'}</td>
+        <td>
+            <button class="btn btn-sm btn-primary status-update-btn" data-status="In Progress">
+                Start
+            </button>
+            <button class="btn btn-sm btn-success status-update-btn" data-status="Completed">
+                Complete
+            </button>
+        </td>
+    `;return row;}
+function updateWorkOrdersTable(workOrders,append){const tableBody=document.querySelector('#work-orders-table tbody');if(tableBody){if(!append){tableBody.innerHTML='';}
+workOrders.forEach(order=>{tableBody.appendChild(renderWorkOrderRow(document.createElement('tr'),order));});attachStatusUpdateListener(tableBody);}}
+function attachStatusUpdateListener(tableBody){if(tableBody.dataset.statusListener){return;}
+tableBody.dataset.statusListener='true';tableBody.addEventListener('click',function(event){const button=event.target.closest('.status-update-btn');if(!button){return;}
+const row=button.closest('tr');button.disabled=true;queueStatusTransition(row.dataset.workOrderId,button.dataset.status,row.dataset.version);});}
+const STATUS_BATCH_DELAY=200;let pendingTransitions=new Map();let statusBatchTimer=null;function queueStatusTransition(workOrderId,status,version){pendingTransitions.set(workOrderId,{id:Number(workOrderId),status:status,expected_version:Number(version)});clearTimeout(statusBatchTimer);statusBatchTimer=setTimeout(flushStatusTransitions,STATUS_BATCH_DELAY);}
+function findWorkOrderRow(workOrderId){return document.querySelector(`#work-orders-table tbody tr[data-work-order-id="${workOrderId}"]`);}
+function flushStatusTransitions(){const transitions=Array.from(pendingTransitions.values());pendingTransitions=new Map();if(!transitions.length){return;}
+fetch('/api/work_orders/status',{method:'POST',headers:{'Content-Type':'application/json','X-CSRFToken':csrfToken(),},body:JSON.stringify({transitions:transitions})}).then(response=>{if(!response.ok){throw new Error(`Status update failed with ${response.status}`);}
+return response.json();}).then(data=>{data.updated.forEach(order=>{const row=findWorkOrderRow(order.id);if(row){renderWorkOrderRow(row,order);}});data.conflicts.forEach(conflict=>{const row=findWorkOrderRow(conflict.id);if(!row){return;}
+if(conflict.error==='not_found'){row.remove();return;}
+const statusCell=row.children[2];statusCell.textContent=conflict.status;row.dataset.version=conflict.version;row.querySelectorAll('.status-update-btn').forEach(button=>{button.disabled=false;});});if(data.conflicts.length||data.errors.length){alert('Some work orders were changed by someone else or could not be updated. The table shows their current status.');}}).catch(error=>{console.error('Error:',error);transitions.forEach(transition=>{const row=findWorkOrderRow(transition.id);if(row){row.querySelectorAll('.status-update-btn').forEach(button=>{button.disabled=false;});}});alert('An error occurred while updating the work order status.');});}
\ No newline at end of file
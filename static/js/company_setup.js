@@ -6,7 +6,7 @@ document.addEventListener('DOMContentLoaded', function() {
     form.addEventListener('submit', function(event) {
         event.preventDefault();
         
-        if (validateForm()) {
+        if (validateForm(this)) {
             this.submit();
         }
     });
@@ -16,22 +16,6 @@ document.addEventListener('DOMContentLoaded', function() {
     });
 });
 
-function validateForm() {
-    let isValid = true;
-    const requiredFields = document.querySelectorAll('[required]');
-    
-    requiredFields.forEach(field => {
-        if (!field.value) {
-            isValid = false;
-            field.classList.add('is-invalid');
-        } else {
-            field.classList.remove('is-invalid');
-        }
-    });
-    
-    return isValid;
-}
-
 function updateLogoPreview(url) {
     const logoPreview = document.getElementById('logo-preview');
     
@@ -0,0 +1,23 @@
+// Shared by the page scripts: marks empty required fields in the form as
+// invalid and reports whether it can be submitted.
+function validateForm(form) {
+    let isValid = true;
+    const requiredFields = (form || document).querySelectorAll('[required]');
+
+    requiredFields.forEach(field => {
+        if (!field.value) {
+            isValid = false;
+            field.classList.add('is-invalid');
+        } else {
+            field.classList.remove('is-invalid');
+        }
+    });
+
+    return isValid;
+}
+
+// For requests that aren't a submitted form, sent as the X-CSRFToken header.
+function csrfToken() {
+    const meta = document.querySelector('meta[name="csrf-token"]');
+    return meta ? meta.content : '';
+}
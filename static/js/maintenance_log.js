@@ -4,24 +4,44 @@ document.addEventListener('DOMContentLoaded', function() {
     form.addEventListener('submit', function(event) {
         event.preventDefault();
         
-        if (validateForm()) {
+        if (validateForm(this)) {
             this.submit();
         }
     });
-});
 
-function validateForm() {
-    let isValid = true;
-    const requiredFields = document.querySelectorAll('[required]');
-    
-    requiredFields.forEach(field => {
-        if (!field.value) {
-            isValid = false;
-            field.classList.add('is-invalid');
-        } else {
-            field.classList.remove('is-invalid');
+    const importForm = document.getElementById('import-form');
+    const importResult = document.getElementById('import-result');
+
+    importForm.addEventListener('submit', function(event) {
+        event.preventDefault();
+        if (!validateForm(this)) {
+            return;
         }
+
+        // The form carries its csrf_token field
+        fetch(this.action, { method: 'POST', body: new FormData(this) })
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                importResult.className = 'mt-3 alert alert-danger';
+                importResult.textContent = data.error;
+                return;
+            }
+            importResult.className = `mt-3 alert ${data.rejected ? 'alert-warning' : 'alert-success'}`;
+            importResult.textContent = `Imported ${data.imported} rows, rejected ${data.rejected}.`;
+            if (data.errors.length) {
+                const list = document.createElement('ul');
+                data.errors.forEach(error => {
+                    const item = document.createElement('li');
+                    item.textContent = `Row ${error.row}: ${JSON.stringify(error.errors)}`;
+                    list.appendChild(item);
+                });
+                importResult.appendChild(list);
+            }
+        })
+        .catch(() => {
+            importResult.className = 'mt-3 alert alert-danger';
+            importResult.textContent = 'The import failed. Please try again.';
+        });
     });
-    
-    return isValid;
-}
+});
@@ -0,0 +1,50 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const searchForm = document.getElementById('search-form');
+    let debounceTimer = null;
+
+    searchForm.addEventListener('submit', function(event) {
+        event.preventDefault();
+        runSearch();
+    });
+
+    document.getElementById('q').addEventListener('input', function() {
+        clearTimeout(debounceTimer);
+        debounceTimer = setTimeout(runSearch, 250);
+    });
+});
+
+function escapeHtml(value) {
+    const div = document.createElement('div');
+    div.textContent = value == null ? '' : value;
+    return div.innerHTML;
+}
+
+function runSearch() {
+    const formData = new FormData(document.getElementById('search-form'));
+    const summary = document.getElementById('search-summary');
+    const results = document.getElementById('search-results');
+    if (!formData.get('q').trim()) {
+        summary.textContent = '';
+        results.innerHTML = '';
+        return;
+    }
+
+    const params = new URLSearchParams(formData);
+    fetch(`/api/search?${params.toString()}`)
+        .then(response => response.json())
+        .then(rows => {
+            summary.textContent = rows.length ? `${rows.length} best matches` : 'No matches found';
+            // Snippets arrive HTML-escaped with <mark> around the matched terms
+            results.innerHTML = rows.map(row => `<tr>
+                <td>${escapeHtml(row.date)}</td>
+                <td>${escapeHtml(row.lot_number)}</td>
+                <td>${escapeHtml(row.maintenance_class)}</td>
+                <td>${row.work_order_id ? `#${row.work_order_id} (${escapeHtml(row.status)})` : '-'}</td>
+                <td>${row.description}${row.notes ? `<br><small class="text-muted">Notes: ${row.notes}</small>` : ''}</td>
+            </tr>`).join('');
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            summary.textContent = 'Search failed. Please try again.';
+        });
+}
@@ -4,7 +4,7 @@ document.addEventListener('DOMContentLoaded', function() {
         form.addEventListener('submit', function(event) {
             event.preventDefault();
             
-            if (validateForm()) {
+            if (validateForm(this)) {
                 this.submit();
             }
         });
@@ -18,36 +18,78 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
+    const loadMoreBtn = document.getElementById('load-more-work-orders');
+    if (loadMoreBtn && filterForm) {
+        loadMoreBtn.addEventListener('click', function() {
+            fetchFilteredWorkOrders(nextWorkOrdersCursor);
+        });
+    }
+
+    initMaintenanceLogSearch();
+
     // Initial load of work orders
     fetchFilteredWorkOrders();
 });
 
-function validateForm() {
-    let isValid = true;
-    const requiredFields = document.querySelectorAll('[required]');
-    
-    requiredFields.forEach(field => {
-        if (!field.value) {
-            isValid = false;
-            field.classList.add('is-invalid');
-        } else {
-            field.classList.remove('is-invalid');
+function initMaintenanceLogSearch() {
+    const searchInput = document.getElementById('maintenance-log-search');
+    const hiddenInput = document.getElementById('maintenance_log_id');
+    const results = document.getElementById('maintenance-log-results');
+    if (!searchInput || !hiddenInput || !results) {
+        return;
+    }
+
+    let debounceTimer = null;
+    searchInput.addEventListener('input', function() {
+        hiddenInput.value = '';
+        clearTimeout(debounceTimer);
+        const term = this.value.trim();
+        if (!term) {
+            results.innerHTML = '';
+            return;
         }
+        debounceTimer = setTimeout(function() {
+            fetch(`/api/maintenance_logs/search?q=${encodeURIComponent(term)}`)
+                .then(response => response.json())
+                .then(logs => {
+                    results.innerHTML = '';
+                    logs.forEach(log => {
+                        const item = document.createElement('button');
+                        item.type = 'button';
+                        item.className = 'list-group-item list-group-item-action';
+                        item.textContent = log.label;
+                        item.addEventListener('click', function() {
+                            hiddenInput.value = log.id;
+                            searchInput.value = log.label;
+                            results.innerHTML = '';
+                        });
+                        results.appendChild(item);
+                    });
+                })
+                .catch(error => {
+                    console.error('Error:', error);
+                });
+        }, 250);
     });
-    
-    return isValid;
 }
 
-function fetchFilteredWorkOrders() {
+let nextWorkOrdersCursor = null;
+
+function fetchFilteredWorkOrders(cursor) {
     const filterForm = document.getElementById('filter-form');
     if (filterForm) {
         const formData = new FormData(filterForm);
-        const queryString = new URLSearchParams(formData).toString();
+        const params = new URLSearchParams(formData);
+        if (cursor) {
+            params.set('cursor', cursor);
+        }
 
-        fetch(`/filtered_work_orders?${queryString}`)
+        fetch(`/filtered_work_orders?${params.toString()}`)
             .then(response => response.json())
             .then(data => {
-                updateWorkOrdersTable(data);
+                updateWorkOrdersTable(data.work_orders, Boolean(cursor));
+                nextWorkOrdersCursor = data.next_cursor;
+                updateLoadMoreButton();
             })
             .catch(error => {
                 console.error('Error:', error);
@@ -55,68 +97,142 @@ function fetchFilteredWorkOrders() {
     }
 }
 
-function updateWorkOrdersTable(workOrders) {
+function updateLoadMoreButton() {
+    const loadMoreBtn = document.getElementById('load-more-work-orders');
+    if (loadMoreBtn) {
+        loadMoreBtn.style.display = nextWorkOrdersCursor ? '' : 'none';
+    }
+}
+
+function renderWorkOrderRow(row, order) {
+    row.dataset.workOrderId = order.id;
+    row.dataset.version = order.version;
+    row.innerHTML = `
+        <td>${order.id}</td>
+        <td>${order.maintenance_log_id}</td>
+        <td>${order.status}</td>
+        <td>${order.assigned_to}</td>
+        <td>${order.scheduled_date}</td>
+        <td>${order.priority}</td>
+        <td>${order.is_critical ? 'Yes' : 'No'}</td>
+        <td>
+            <button class="btn btn-sm btn-primary status-update-btn" data-status="In Progress">
+                Start
+            </button>
+            <button class="btn btn-sm btn-success status-update-btn" data-status="Completed">
+                Complete
+            </button>
+        </td>
+    `;
+    return row;
+}
+
+function updateWorkOrdersTable(workOrders, append) {
     const tableBody = document.querySelector('#work-orders-table tbody');
     if (tableBody) {
-        tableBody.innerHTML = '';
+        if (!append) {
+            tableBody.innerHTML = '';
+        }
 
         workOrders.forEach(order => {
-            const row = document.createElement('tr');
-            row.innerHTML = `
-                <td>${order.id}</td>
-                <td>${order.maintenance_log_id}</td>
-                <td>${order.status}</td>
-                <td>${order.assigned_to}</td>
-                <td>${order.scheduled_date}</td>
-                <td>${order.priority}</td>
-                <td>${order.is_critical ? 'Yes' : 'No'}</td>
-                <td>
-                    <button class="btn btn-sm btn-primary status-update-btn" data-work-order-id="${order.id}" data-status="In Progress">
-                        Start
-                    </button>
-                    <button class="btn btn-sm btn-success status-update-btn" data-work-order-id="${order.id}" data-status="Completed">
-                        Complete
-                    </button>
-                </td>
-            `;
-            tableBody.appendChild(row);
+            tableBody.appendChild(renderWorkOrderRow(document.createElement('tr'), order));
         });
 
-        // Re-attach event listeners for status update buttons
-        attachStatusUpdateListeners();
+        attachStatusUpdateListener(tableBody);
     }
 }
 
-function attachStatusUpdateListeners() {
-    const statusButtons = document.querySelectorAll('.status-update-btn');
-    
-    statusButtons.forEach(button => {
-        button.addEventListener('click', function() {
-            const workOrderId = this.dataset.workOrderId;
-            const newStatus = this.dataset.status;
-            updateWorkOrderStatus(workOrderId, newStatus);
-        });
+function attachStatusUpdateListener(tableBody) {
+    // One delegated listener survives re-renders of individual rows
+    if (tableBody.dataset.statusListener) {
+        return;
+    }
+    tableBody.dataset.statusListener = 'true';
+    tableBody.addEventListener('click', function(event) {
+        const button = event.target.closest('.status-update-btn');
+        if (!button) {
+            return;
+        }
+        const row = button.closest('tr');
+        button.disabled = true;
+        queueStatusTransition(row.dataset.workOrderId, button.dataset.status, row.dataset.version);
     });
 }
 
-function updateWorkOrderStatus(workOrderId, newStatus) {
-    fetch('/update_work_order_status', {
+// Clicks made in quick succession go to the server as one batch
+const STATUS_BATCH_DELAY = 200;
+let pendingTransitions = new Map();
+let statusBatchTimer = null;
+
+function queueStatusTransition(workOrderId, status, version) {
+    pendingTransitions.set(workOrderId, {
+        id: Number(workOrderId),
+        status: status,
+        expected_version: Number(version)
+    });
+    clearTimeout(statusBatchTimer);
+    statusBatchTimer = setTimeout(flushStatusTransitions, STATUS_BATCH_DELAY);
+}
+
+function findWorkOrderRow(workOrderId) {
+    return document.querySelector(`#work-orders-table tbody tr[data-work-order-id="${workOrderId}"]`);
+}
+
+function flushStatusTransitions() {
+    const transitions = Array.from(pendingTransitions.values());
+    pendingTransitions = new Map();
+    if (!transitions.length) {
+        return;
+    }
+
+    fetch('/api/work_orders/status', {
         method: 'POST',
         headers: {
-            'Content-Type': 'application/x-www-form-urlencoded',
+            'Content-Type': 'application/json',
+            'X-CSRFToken': csrfToken(),
         },
-        body: `work_order_id=${workOrderId}&new_status=${newStatus}`
+        body: JSON.stringify({ transitions: transitions })
+    })
+    .then(response => {
+        if (!response.ok) {
+            throw new Error(`Status update failed with ${response.status}`);
+        }
+        return response.json();
     })
-    .then(response => response.json())
     .then(data => {
-        if (data.success) {
-            fetchFilteredWorkOrders();
-        } else {
-            alert('Failed to update work order status. Please try again.');
+        data.updated.forEach(order => {
+            const row = findWorkOrderRow(order.id);
+            if (row) {
+                renderWorkOrderRow(row, order);
+            }
+        });
+        data.conflicts.forEach(conflict => {
+            const row = findWorkOrderRow(conflict.id);
+            if (!row) {
+                return;
+            }
+            if (conflict.error === 'not_found') {
+                row.remove();
+                return;
+            }
+            // Someone else changed the order; show their status and version
+            const statusCell = row.children[2];
+            statusCell.textContent = conflict.status;
+            row.dataset.version = conflict.version;
+            row.querySelectorAll('.status-update-btn').forEach(button => { button.disabled = false; });
+        });
+        if (data.conflicts.length || data.errors.length) {
+            alert('Some work orders were changed by someone else or could not be updated. The table shows their current status.');
         }
     })
     .catch(error => {
         console.error('Error:', error);
+        transitions.forEach(transition => {
+            const row = findWorkOrderRow(transition.id);
+            if (row) {
+                row.querySelectorAll('.status-update-btn').forEach(button => { button.disabled = false; });
+            }
+        });
         alert('An error occurred while updating the work order status.');
     });
 }
@@ -0,0 +1,46 @@
+from flask import g, has_app_context
+from flask_login import user_logged_in
+from sqlalchemy import event
+from sqlalchemy.orm import Session, with_loader_criteria
+from models import TenantScoped
+
+# Statements run with .execution_options(all_companies=True) skip the filter,
+# e.g. for maintenance jobs that work across tenants.
+ALL_COMPANIES_OPTION = 'all_companies'
+
+def current_company_id():
+    """The company the current request acts for, or None outside a signed-in request."""
+    return g.get('company_id') if has_app_context() else None
+
+def set_current_company(company_id):
+    g.company_id = company_id
+
+def scope_to_company(statement, company_id):
+    return statement.options(with_loader_criteria(
+        TenantScoped, lambda cls: cls.company_id == company_id, include_aliases=True
+    ))
+
+def _scope_to_company(execute_state):
+    company_id = current_company_id()
+    if company_id is None or execute_state.execution_options.get(ALL_COMPANIES_OPTION):
+        return
+    # Lazy loads follow foreign keys from rows that were already scoped
+    if execute_state.is_column_load or execute_state.is_relationship_load:
+        return
+    if execute_state.is_select or execute_state.is_update or execute_state.is_delete:
+        execute_state.statement = scope_to_company(execute_state.statement, company_id)
+
+def _assign_company(session, flush_context, instances):
+    company_id = current_company_id()
+    if company_id is None:
+        return
+    for obj in session.new:
+        if isinstance(obj, TenantScoped) and obj.company_id is None:
+            obj.company_id = company_id
+
+def _company_from_login(sender, user, **extra):
+    set_current_company(user.company_id)
+
+event.listen(Session, 'do_orm_execute', _scope_to_company)
+event.listen(Session, 'before_flush', _assign_company)
+user_logged_in.connect(_company_from_login)
@@ -0,0 +1,41 @@
+import pytest
+from app import create_app, db
+from models import Company, User
+from seed import seed_database
+
+USERNAME = 'budget'
+PASSWORD = 'budget-password'
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp('app')
+    app = create_app({
+        'TESTING': True,
+        'SQL_QUERY_COUNTER': True,
+        'WTF_CSRF_ENABLED': False,
+        'SECRET_KEY': 'test',
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp / 'test.db'}",
+        'PDF_CACHE_DIR': str(tmp / 'pdf'),
+        'PDF_BATCH_PROCESSES': 1,
+        'FRAGMENT_CACHE_BACKEND': 'memory',
+        'METRICS_ENABLED': False,
+        'LOG_LEVEL': 'WARNING',
+    })
+    with app.app_context():
+        db.create_all()
+        seed_database(200, companies=2)
+        user = User(username=USERNAME, email='budget@example.com',
+                    company=Company.query.order_by(Company.id).first())
+        user.set_password(PASSWORD)
+        db.session.add(user)
+        db.session.commit()
+    return app
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    response = client.post('/login', data={'username': USERNAME, 'password': PASSWORD})
+    assert response.status_code == 302
+    return client
@@ -0,0 +1,33 @@
+"""State-changing JSON and upload routes refuse requests without a CSRF token."""
+import re
+import pytest
+
+PROTECTED = [
+    ('/mark_notification_as_read/0', {}),
+    ('/notifications/mark_read', {'json': {'ids': []}}),
+    ('/api/work_orders/status', {'json': {'transitions': [{'id': 0, 'status': 'Pending', 'expected_version': 1}]}}),
+]
+
+
+@pytest.fixture
+def csrf_client(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, 'WTF_CSRF_ENABLED', True)
+    return client
+
+
+def page_token(client):
+    html = client.get('/dashboard').get_data(as_text=True)
+    return re.search(r'<meta name="csrf-token" content="([^"]+)">', html).group(1)
+
+
+@pytest.mark.parametrize('path, kwargs', PROTECTED)
+def test_missing_token_is_refused(csrf_client, path, kwargs):
+    response = csrf_client.post(path, **kwargs)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+@pytest.mark.parametrize('path, kwargs', PROTECTED)
+def test_header_token_is_accepted(csrf_client, path, kwargs):
+    response = csrf_client.post(path, headers={'X-CSRFToken': page_token(csrf_client)}, **kwargs)
+    assert response.status_code == 200
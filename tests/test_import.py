@@ -0,0 +1,43 @@
+import io
+from app import db
+from models import MaintenanceLog, User, WorkOrder
+from tests.conftest import USERNAME
+
+HEADER = 'date,lot_number,contact_details,maintenance_class,description,allocation,status,assigned_to,scheduled_date,priority,notes,is_critical'
+ROWS = [
+    '2026-01-02,IMP-001,0400000001,IAS,Leaking tap,Warranty,Pending,Crew A,2026-01-09,Low,,no',
+    '2026-01-02,IMP-002,0400000002,Unknown,Cracked tile,Warranty,Pending,Crew A,2026-01-09,Low,,no',
+    '2026-01-03,IMP-003,0400000003,3MTR,Door sticking,Warranty,Completed,Crew B,2026-01-10,High,Done,yes',
+    'not a date,,0400000004,IAS,Window seal,Warranty,Pending,Crew A,2026-01-09,Low,,no',
+]
+
+
+def upload(client, lines):
+    data = {'file': (io.BytesIO('\n'.join([HEADER] + lines).encode('utf-8')), 'logs.csv')}
+    return client.post('/import/maintenance_logs', data=data, content_type='multipart/form-data')
+
+
+def test_invalid_rows_are_reported_and_valid_rows_imported(app, client):
+    response = upload(client, ROWS)
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert (data['imported'], data['rejected']) == (2, 2)
+    # Row 1 is the header
+    assert [error['row'] for error in data['errors']] == [3, 5]
+    assert set(data['errors'][0]['errors']) == {'maintenance_class'}
+    assert set(data['errors'][1]['errors']) == {'date', 'lot_number'}
+
+    with app.app_context():
+        company_id = User.query.filter_by(username=USERNAME).one().company_id
+        logs = MaintenanceLog.query.filter(MaintenanceLog.lot_number.like('IMP-%')).order_by(MaintenanceLog.lot_number).all()
+        assert [log.lot_number for log in logs] == ['IMP-001', 'IMP-003']
+        assert {log.company_id for log in logs} == {company_id}
+        orders = WorkOrder.query.filter(WorkOrder.maintenance_log_id.in_([log.id for log in logs])).all()
+        assert sorted((order.status, order.is_critical) for order in orders) == [('Completed', True), ('Pending', False)]
+        db.session.remove()
+
+
+def test_missing_file_is_rejected(client):
+    response = client.post('/import/maintenance_logs', data={}, content_type='multipart/form-data')
+    assert response.status_code == 400
@@ -0,0 +1,21 @@
+from pdf_render import render_work_order_batch, render_work_order_pdf
+
+WORK_ORDER = {
+    'id': 1,
+    'status': 'Pending',
+    'assigned_to': 'Zoë Łukasz',
+    'scheduled_date': '2026-01-05',
+    'priority': 'High',
+    'is_critical': True,
+    'notes': 'Parts on order — ETA “Friday”',
+    'log_id': 2,
+    'log_date': '2026-01-02',
+    'lot_number': 'LOT-0002',
+    'maintenance_class': 'IAS',
+    'description': 'Replace seal – leaking €',
+}
+
+
+def test_text_outside_latin1_renders():
+    assert render_work_order_pdf(WORK_ORDER).startswith(b'%PDF')
+    assert render_work_order_batch([WORK_ORDER, dict(WORK_ORDER, notes=None)]).startswith(b'%PDF')
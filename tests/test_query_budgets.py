@@ -0,0 +1,93 @@
+"""Every view declaring a ``query_budget`` stays within it.
+
+The app runs with TESTING and SQL_QUERY_COUNTER, so a view issuing more
+statements than its budget raises ``QueryBudgetExceeded`` out of the request.
+Requests go out with a cold user cache, the most a request can cost.
+"""
+import pytest
+from app import db
+from auth import invalidate_user
+from models import Notification, User, WorkOrder
+from query_counter import QueryBudgetExceeded
+from tests.conftest import USERNAME
+
+
+def budgeted_endpoints(app):
+    return {endpoint for endpoint, view in app.view_functions.items() if hasattr(view, 'query_budget')}
+
+
+@pytest.fixture
+def records(app):
+    with app.app_context():
+        user = User.query.filter_by(username=USERNAME).one()
+        work_order = WorkOrder.query.filter_by(company_id=user.company_id).order_by(WorkOrder.id).first()
+        notification = Notification.query.filter_by(company_id=user.company_id, is_read=False).first()
+        return {'work_order': work_order.id, 'version': work_order.version,
+                'notification': notification.id if notification else 0}
+
+
+def requests_for(records):
+    work_order_id = records['work_order']
+    return {
+        'main.dashboard': ('GET', '/dashboard', {}),
+        'main.unread_notifications': ('GET', '/api/notifications', {}),
+        'main.mark_notification_as_read': ('POST', f"/mark_notification_as_read/{records['notification']}", {}),
+        'main.mark_notifications_as_read': ('POST', '/notifications/mark_read', {'json': {'ids': [records['notification']]}}),
+        'main.filtered_work_orders': ('GET', '/filtered_work_orders?status=Pending', {}),
+        'main.update_work_order_statuses': ('POST', '/api/work_orders/status', {'json': {'transitions': [
+            {'id': work_order_id, 'status': 'In Progress', 'expected_version': records['version']}
+        ]}}),
+        'main.work_order_stats': ('GET', '/api/work_order_stats', {}),
+        'main.work_order_trend': ('GET', '/api/work_order_trend', {}),
+        'main.maintenance_log_search': ('GET', '/api/maintenance_logs/search?q=LOT-00', {}),
+        'main.search_api': ('GET', '/api/search?q=repair', {}),
+        'main.filtered_reports': ('GET', '/filtered_reports?maintenance_class=IAS', {}),
+        'main.work_order_pdf': ('GET', f'/work_order_pdf/{work_order_id}', {}),
+        'main.work_order_batch_pdf': ('GET', f'/work_orders/batch_pdf?id={work_order_id}', {}),
+        'main.create_pdf_job': ('POST', f'/api/work_order_pdf/{work_order_id}/jobs', {}),
+    }
+
+
+def request_within_budget(client, method, path, **kwargs):
+    invalidate_user()
+    response = client.open(path, method=method, **kwargs)
+    assert response.status_code < 400, f"{method} {path} returned {response.status_code}"
+    return response
+
+
+def test_every_budgeted_endpoint_is_covered(app, records):
+    covered = set(requests_for(records)) | {'main.pdf_job_status', 'main.pdf_job_download'}
+    assert budgeted_endpoints(app) <= covered
+
+
+@pytest.mark.parametrize('endpoint', sorted(requests_for({'work_order': 0, 'version': 0, 'notification': 0})))
+def test_endpoint_within_budget(client, records, endpoint):
+    method, path, kwargs = requests_for(records)[endpoint]
+    request_within_budget(client, method, path, **kwargs)
+
+
+def test_pdf_job_endpoints_within_budget(client, records):
+    response = request_within_budget(client, 'POST', f"/api/work_order_pdf/{records['work_order']}/jobs")
+    job = response.get_json()
+    request_within_budget(client, 'GET', job['status_url'])
+    request_within_budget(client, 'GET', f"/pdf_jobs/{job['job_id']}/download")
+
+
+def test_dashboard_within_budget_with_pending_flash(client):
+    # Flashed messages make the response non-conditional
+    with client.session_transaction() as session:
+        session['_flashes'] = [('success', 'Saved')]
+    request_within_budget(client, 'GET', '/dashboard')
+
+
+def test_budget_overrun_fails_the_request(app, client):
+    view = app.view_functions['main.work_order_stats']
+    limit = view.query_budget
+    view.query_budget = 0
+    try:
+        with pytest.raises(QueryBudgetExceeded):
+            client.get('/api/work_order_stats')
+    finally:
+        view.query_budget = limit
+        with app.app_context():
+            db.session.remove()
@@ -0,0 +1,173 @@
+"""A signed-in user only ever sees and changes their own company's data.
+
+The session database holds two seeded companies; the test user belongs to the
+first, so every route is checked against the second company's rows.
+"""
+import csv
+import io
+import pytest
+from app import db
+from models import MaintenanceLog, Notification, User, WorkOrder
+from tenancy import ALL_COMPANIES_OPTION
+from tests.conftest import USERNAME
+
+
+def ids_by_company(model, company_id):
+    return set(db.session.scalars(
+        db.select(model.id).where(model.company_id == company_id).execution_options(**{ALL_COMPANIES_OPTION: True})
+    ))
+
+
+@pytest.fixture(scope='module')
+def tenants(app):
+    with app.app_context():
+        own = User.query.filter_by(username=USERNAME).one().company_id
+        other = db.session.scalar(
+            db.select(MaintenanceLog.company_id).where(MaintenanceLog.company_id != own)
+            .execution_options(**{ALL_COMPANIES_OPTION: True}).limit(1)
+        )
+        # An unread notification on each side, so the feed checks see both
+        for company_id in (own, other):
+            work_order = db.session.scalars(
+                db.select(WorkOrder).where(WorkOrder.company_id == company_id)
+                .execution_options(**{ALL_COMPANIES_OPTION: True}).order_by(WorkOrder.id).limit(1)
+            ).one()
+            db.session.add(Notification(company_id=company_id, work_order_id=work_order.id,
+                                        message='Tenancy check'))
+        db.session.commit()
+
+        tenants = {}
+        for name, company_id in (('own', own), ('other', other)):
+            tenants[name] = {
+                'maintenance_logs': ids_by_company(MaintenanceLog, company_id),
+                'work_orders': ids_by_company(WorkOrder, company_id),
+                'notifications': ids_by_company(Notification, company_id),
+            }
+        db.session.remove()
+        return tenants
+
+
+def assert_only_own(ids, tenants, table):
+    ids = set(ids)
+    assert ids, f"expected some {table}"
+    assert ids <= tenants['own'][table]
+    assert not ids & tenants['other'][table]
+
+
+def all_pages(client, path):
+    pages = []
+    cursor = None
+    while True:
+        separator = '&' if '?' in path else '?'
+        page = client.get(path + (f'{separator}cursor={cursor}' if cursor else '')).get_json()
+        pages.append(page)
+        cursor = page['next_cursor']
+        if not cursor:
+            return pages
+
+
+def test_work_order_list(client, tenants):
+    pages = all_pages(client, '/filtered_work_orders?limit=200')
+    ids = [row['id'] for page in pages for row in page['work_orders']]
+    assert set(ids) == tenants['own']['work_orders']
+
+
+def test_reports(client, tenants):
+    pages = all_pages(client, '/filtered_reports?limit=500')
+    assert_only_own([row['id'] for page in pages for row in page['maintenance_logs']], tenants, 'maintenance_logs')
+    assert_only_own([row['id'] for page in pages for row in page['work_orders']], tenants, 'work_orders')
+    assert pages[0]['total_logs'] == len(tenants['own']['maintenance_logs'])
+
+
+def test_notifications(client, tenants):
+    feed = client.get('/api/notifications?limit=100').get_json()
+    assert_only_own([row['id'] for row in feed['notifications']], tenants, 'notifications')
+
+
+def test_work_order_stats(client, tenants):
+    assert client.get('/api/work_order_stats').get_json()['total'] == len(tenants['own']['work_orders'])
+
+
+def test_search(client, tenants):
+    results = client.get('/api/search?q=leaking&limit=100').get_json()
+    assert_only_own([row['id'] for row in results], tenants, 'maintenance_logs')
+    assert_only_own([row['work_order_id'] for row in results if row['work_order_id']], tenants, 'work_orders')
+
+
+def test_maintenance_log_picker(client, tenants):
+    results = client.get('/api/maintenance_logs/search?q=LOT').get_json()
+    assert_only_own([row['id'] for row in results], tenants, 'maintenance_logs')
+
+
+@pytest.mark.parametrize('report_type', ['maintenance_logs', 'work_orders'])
+def test_csv_export(client, tenants, report_type):
+    response = client.get(f'/export_report/{report_type}?format=csv')
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert {int(row['ID']) for row in rows} == tenants['own'][report_type]
+
+
+def test_pdf_routes(client, tenants):
+    work_order_id = min(tenants['other']['work_orders'])
+    assert client.get(f'/work_order_pdf/{work_order_id}').status_code == 302
+    assert client.post(f'/api/work_order_pdf/{work_order_id}/jobs').status_code == 404
+    assert client.get(f'/work_orders/batch_pdf?id={work_order_id}').status_code == 302
+
+
+def test_status_update_of_another_company_is_refused(app, client, tenants):
+    work_order_id = min(tenants['other']['work_orders'])
+    with app.app_context():
+        before = db.session.get(WorkOrder, work_order_id)
+        status, version = before.status, before.version
+        db.session.remove()
+
+    response = client.post('/api/work_orders/status', json={'transitions': [
+        {'id': work_order_id, 'status': 'Pending' if status != 'Pending' else 'Completed',
+         'expected_version': version}
+    ]})
+    assert response.get_json()['updated'] == []
+    assert response.get_json()['conflicts'][0]['error'] == 'not_found'
+
+    with app.app_context():
+        after = db.session.get(WorkOrder, work_order_id)
+        assert (after.status, after.version) == (status, version)
+        db.session.remove()
+
+
+def unread_notifications(company_ids):
+    return set(db.session.scalars(
+        db.select(Notification.id).where(Notification.id.in_(company_ids), Notification.is_read == False)
+        .execution_options(**{ALL_COMPANIES_OPTION: True})
+    ))
+
+
+def test_mark_read_of_another_company_is_refused(app, client, tenants):
+    with app.app_context():
+        unread = unread_notifications(tenants['other']['notifications'])
+        db.session.remove()
+    assert unread
+
+    assert client.post(f'/mark_notification_as_read/{min(unread)}').get_json()['updated'] == 0
+    assert client.post('/notifications/mark_read', json={'ids': sorted(unread)}).get_json()['updated'] == 0
+
+    with app.app_context():
+        assert unread_notifications(tenants['other']['notifications']) == unread
+        db.session.remove()
+
+
+def test_work_order_for_another_company_log_is_refused(app, client, tenants):
+    log_id = min(tenants['other']['maintenance_logs'])
+    response = client.post('/work_order', data={
+        'maintenance_log_id': log_id,
+        'status': 'Pending',
+        'assigned_to': 'Tenancy Check',
+        'scheduled_date': '2026-01-05',
+        'priority': 'Low',
+    })
+    assert response.status_code == 200
+
+    with app.app_context():
+        assert not db.session.scalars(
+            db.select(WorkOrder.id).where(WorkOrder.maintenance_log_id == log_id, WorkOrder.assigned_to == 'Tenancy Check')
+            .execution_options(**{ALL_COMPANIES_OPTION: True})
+        ).all()
+        db.session.remove()
@@ -0,0 +1,99 @@
+import pytest
+from app import db
+from models import User, WorkOrder
+from tests.conftest import USERNAME
+
+
+@pytest.fixture
+def work_order(app):
+    with app.app_context():
+        company_id = User.query.filter_by(username=USERNAME).one().company_id
+        order = WorkOrder.query.filter_by(company_id=company_id, status='Pending').order_by(WorkOrder.id).first()
+        state = {'id': order.id, 'status': order.status, 'version': order.version}
+        db.session.remove()
+        return state
+
+
+def stored(app, work_order_id):
+    with app.app_context():
+        order = db.session.get(WorkOrder, work_order_id)
+        state = (order.status, order.version)
+        db.session.remove()
+        return state
+
+
+def test_stale_version_is_reported_as_a_conflict(app, client, work_order):
+    response = client.post('/api/work_orders/status', json={'transitions': [
+        {'id': work_order['id'], 'status': 'In Progress', 'expected_version': work_order['version'] - 1}
+    ]})
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['updated'] == []
+    assert data['conflicts'] == [{'id': work_order['id'], 'error': 'version_conflict',
+                                  'status': work_order['status'], 'version': work_order['version']}]
+    assert stored(app, work_order['id']) == (work_order['status'], work_order['version'])
+
+
+def test_matching_version_updates_once(app, client, work_order):
+    transition = {'id': work_order['id'], 'status': 'In Progress', 'expected_version': work_order['version']}
+
+    first = client.post('/api/work_orders/status', json={'transitions': [transition]}).get_json()
+    assert [(row['id'], row['status'], row['version']) for row in first['updated']] == [
+        (work_order['id'], 'In Progress', work_order['version'] + 1)
+    ]
+
+    # Replaying the same request now loses to the version it just wrote
+    second = client.post('/api/work_orders/status', json={'transitions': [transition]}).get_json()
+    assert second['updated'] == []
+    assert second['conflicts'][0]['error'] == 'version_conflict'
+    assert stored(app, work_order['id']) == ('In Progress', work_order['version'] + 1)
+
+
+def test_invalid_transitions_are_reported_per_item(client, work_order):
+    data = client.post('/api/work_orders/status', json={'transitions': [
+        {'id': work_order['id'], 'status': 'Shelved', 'expected_version': work_order['version']},
+        {'id': 'x', 'status': 'Pending', 'expected_version': 1},
+    ]}).get_json()
+    assert [error['index'] for error in data['errors']] == [0, 1]
+    assert data['updated'] == [] and data['conflicts'] == []
+
+
+def walk_pages(client, query):
+    rows, pages, cursor = [], 0, None
+    while True:
+        page = client.get(f'/filtered_work_orders?{query}' + (f'&cursor={cursor}' if cursor else '')).get_json()
+        rows.extend(page['work_orders'])
+        pages += 1
+        cursor = page['next_cursor']
+        if not cursor:
+            return rows, pages
+
+
+def expected_order(app, **filters):
+    with app.app_context():
+        company_id = User.query.filter_by(username=USERNAME).one().company_id
+        ids = [order.id for order in WorkOrder.query.filter_by(company_id=company_id, **filters)
+               .order_by(WorkOrder.scheduled_date, WorkOrder.id)]
+        db.session.remove()
+        return ids
+
+
+def test_cursor_pages_cover_every_order_once_in_order(app, client):
+    rows, pages = walk_pages(client, 'limit=7')
+    expected = expected_order(app)
+
+    assert [row['id'] for row in rows] == expected
+    assert pages == -(-len(expected) // 7)
+
+
+def test_cursor_pages_keep_the_filters(app, client):
+    rows, pages = walk_pages(client, 'limit=5&status=Completed&priority=High')
+    assert pages > 1
+    assert [row['id'] for row in rows] == expected_order(app, status='Completed', priority='High')
+    assert {(row['status'], row['priority']) for row in rows} == {('Completed', 'High')}
+
+
+def test_bad_cursor_starts_from_the_first_page(client):
+    first = client.get('/filtered_work_orders?limit=3').get_json()
+    assert client.get('/filtered_work_orders?limit=3&cursor=garbage').get_json() == first
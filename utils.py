@@ -1,83 +1,455 @@
-from models import WorkOrder
-from sqlalchemy import func
-from datetime import datetime, timedelta
-from fpdf import FPDF
+from flask import current_app
+from app import db
+from models import ArchivedMaintenanceLog, ArchivedWorkOrder, MaintenanceLog, WorkOrder, Notification
+from sqlalchemy import case, func, or_, select, tuple_, union_all, update
+from sqlalchemy.orm import joinedload
+from datetime import datetime
+from cache import TTLCache
+from forms import STATUS_CHOICES
+from daily_stats import record_status_changes
+from tenancy import current_company_id
+
+stats_cache = TTLCache(max_entries=1024)
+
+WORK_ORDER_PAGE_SIZE = 50
+WORK_ORDER_MAX_PAGE_SIZE = 200
+REPORT_PAGE_SIZE = 100
+REPORT_MAX_PAGE_SIZE = 500
+REPORT_DESCRIPTION_CHARS = 200
+LOG_SEARCH_LIMIT = 20
+NOTIFICATION_PAGE_SIZE = 20
+NOTIFICATION_MAX_PAGE_SIZE = 100
+STATUS_TRANSITION_MAX_BATCH = 500
+WORK_ORDER_STATUSES = [value for value, _ in STATUS_CHOICES]
+LOG_SEARCH_MIN_DESCRIPTION_CHARS = 3
+
+def parse_date_arg(value):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+def filter_work_orders(query, args, date_column=None, order=WorkOrder):
+    # ``order`` may be ArchivedWorkOrder, which has the same columns
+    if date_column is None:
+        date_column = order.scheduled_date
+
+    statuses = [s for s in args.getlist('status') if s]
+    if statuses:
+        query = query.filter(order.status.in_(statuses))
+
+    priorities = [p for p in args.getlist('priority') if p]
+    if priorities:
+        query = query.filter(order.priority.in_(priorities))
+
+    assigned_to = args.get('assigned_to', '').strip()
+    if assigned_to:
+        query = query.filter(order.assigned_to == assigned_to)
+
+    start_date = parse_date_arg(args.get('start_date'))
+    if start_date:
+        query = query.filter(date_column >= start_date)
+    end_date = parse_date_arg(args.get('end_date'))
+    if end_date:
+        query = query.filter(date_column <= end_date)
+
+    critical_only = args.get('critical_only', '')
+    if critical_only == 'true':
+        query = query.filter(order.is_critical.is_(True))
+    elif critical_only == 'false':
+        query = query.filter(order.is_critical.isnot(True))
+
+    return query
+
+def filter_reports(query, args, log=MaintenanceLog, order=WorkOrder):
+    # Report filters span both tables; the date range applies to the log date
+    query = filter_work_orders(query, args, date_column=log.date, order=order)
+
+    classes = [c for c in args.getlist('maintenance_class') if c]
+    if classes:
+        query = query.filter(log.maintenance_class.in_(classes))
+
+    return query
+
+def include_archived(args):
+    return args.get('include_archived') == 'true'
+
+def encode_cursor(date_value, row_id):
+    return f"{date_value.isoformat()}_{row_id}"
+
+def decode_cursor(cursor):
+    try:
+        date_value, row_id = cursor.rsplit('_', 1)
+        value = datetime.fromisoformat(date_value)
+        # Plain dates round-trip as dates so they compare against Date columns
+        return (value if 'T' in date_value else value.date()), int(row_id)
+    except (AttributeError, ValueError):
+        return None
+
+def get_page_size(args, default, maximum):
+    try:
+        limit = int(args.get('limit', default))
+    except ValueError:
+        limit = default
+    return max(1, min(limit, maximum))
+
+def get_work_order_page(args):
+    limit = get_page_size(args, WORK_ORDER_PAGE_SIZE, WORK_ORDER_MAX_PAGE_SIZE)
+
+    query = filter_work_orders(WorkOrder.query, args)
+
+    cursor = decode_cursor(args.get('cursor'))
+    if cursor:
+        query = query.filter(tuple_(WorkOrder.scheduled_date, WorkOrder.id) > tuple_(*cursor))
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.order_by(WorkOrder.scheduled_date, WorkOrder.id).limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1].scheduled_date, rows[limit - 1].id) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+def work_order_row(order):
+    return {
+        'id': order.id,
+        'maintenance_log_id': order.maintenance_log_id,
+        'status': order.status,
+        'assigned_to': order.assigned_to,
+        'scheduled_date': order.scheduled_date.strftime('%Y-%m-%d'),
+        'completed_date': order.completed_date.strftime('%Y-%m-%d') if order.completed_date else None,
+        'priority': order.priority,
+        'is_critical': order.is_critical,
+        'version': order.version,
+    }
+
+def parse_status_transitions(items):
+    """Validate ``{'id', 'status', 'expected_version'}`` items.
+
+    Returns ``({id: (status, expected_version)}, errors)``; a later item for
+    the same id replaces an earlier one.
+    """
+    transitions = {}
+    errors = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append({'index': index, 'error': 'Each transition must be an object.'})
+            continue
+        work_order_id = item.get('id')
+        status = item.get('status')
+        expected_version = item.get('expected_version')
+        if not isinstance(work_order_id, int) or not isinstance(expected_version, int):
+            errors.append({'index': index, 'id': work_order_id, 'error': 'id and expected_version must be integers.'})
+        elif status not in WORK_ORDER_STATUSES:
+            errors.append({'index': index, 'id': work_order_id, 'error': f'Unknown status {status!r}.'})
+        else:
+            transitions[work_order_id] = (status, expected_version)
+    return transitions, errors
+
+def apply_status_transitions(transitions):
+    """Apply ``{id: (new_status, expected_version)}`` in one UPDATE.
+
+    Rows whose version no longer matches are left alone and reported as
+    conflicts with their current state. Returns ``(updated_rows, conflicts)``.
+    """
+    if not transitions:
+        return [], []
+
+    # The current rows give the completion dates the rollup has to move and
+    # the state to report for conflicts
+    current = {
+        row.id: row for row in db.session.query(
+            WorkOrder.id, WorkOrder.company_id, WorkOrder.status, WorkOrder.completed_date, WorkOrder.version,
+            WorkOrder.priority, WorkOrder.assigned_to, MaintenanceLog.maintenance_class
+        ).join(MaintenanceLog).filter(WorkOrder.id.in_(list(transitions)))
+    }
+
+    matching = {
+        work_order_id: status for work_order_id, (status, expected_version) in transitions.items()
+        if work_order_id in current and current[work_order_id].version == expected_version
+    }
+    updated = []
+    if matching:
+        # Orders that were already completed keep their date; newly completed
+        # ones are stamped with today (UTC)
+        completing = [work_order_id for work_order_id, status in matching.items() if status == 'Completed']
+        newly_completed = [work_order_id for work_order_id in completing if current[work_order_id].status != 'Completed']
+        updated = db.session.execute(
+            update(WorkOrder)
+            .where(tuple_(WorkOrder.id, WorkOrder.version).in_(
+                [(work_order_id, transitions[work_order_id][1]) for work_order_id in matching]
+            ))
+            .values(
+                status=case(matching, value=WorkOrder.id),
+                completed_date=case(
+                    (WorkOrder.id.in_(newly_completed), datetime.utcnow().date()),
+                    (WorkOrder.id.in_(completing), WorkOrder.completed_date),
+                    else_=None
+                ),
+                version=WorkOrder.version + 1,
+            )
+            .returning(
+                WorkOrder.id, WorkOrder.maintenance_log_id, WorkOrder.status, WorkOrder.assigned_to,
+                WorkOrder.scheduled_date, WorkOrder.completed_date, WorkOrder.priority,
+                WorkOrder.is_critical, WorkOrder.version
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+
+        record_status_changes([
+            (current[row.id].company_id,
+             current[row.id].completed_date if current[row.id].status == 'Completed' else None,
+             row.completed_date,
+             current[row.id].priority, current[row.id].assigned_to, current[row.id].maintenance_class)
+            for row in updated
+        ])
+    db.session.commit()
+
+    updated_ids = {row.id for row in updated}
+    conflicts = []
+    for work_order_id in transitions:
+        if work_order_id in updated_ids:
+            continue
+        row = current.get(work_order_id)
+        conflicts.append({
+            'id': work_order_id,
+            'error': 'not_found' if row is None else 'version_conflict',
+            'status': row.status if row else None,
+            'version': row.version if row else None,
+        })
+    return updated, conflicts
+
+def _report_columns(log, order):
+    return [
+        log.id,
+        log.date,
+        log.lot_number,
+        log.maintenance_class,
+        log.description,
+        order.id.label('work_order_id'),
+        order.status,
+        order.priority,
+        order.scheduled_date,
+        order.assigned_to,
+        order.is_critical,
+    ]
+
+def _live_report_rows(args, cursor, limit):
+    columns = _report_columns(MaintenanceLog, WorkOrder)
+    if not cursor:
+        # Window aggregates are evaluated over the whole filtered set before
+        # LIMIT, so the first page carries the statistics in the same query.
+        columns += [
+            func.count().over().label('total_logs'),
+            func.count(WorkOrder.id).over().label('total_orders'),
+            func.count(WorkOrder.id).filter(WorkOrder.status == 'Completed').over().label('completed_orders'),
+        ]
+
+    query = filter_reports(
+        db.session.query(*columns).select_from(MaintenanceLog).outerjoin(WorkOrder),
+        args
+    )
+    if cursor:
+        query = query.filter(tuple_(MaintenanceLog.date, MaintenanceLog.id) < tuple_(*cursor))
+
+    return query.order_by(MaintenanceLog.date.desc(), MaintenanceLog.id.desc()).limit(limit + 1).all()
+
+def _report_rows_with_archive(args, cursor, limit):
+    # Live and archived rows keep distinct ids, so one (date, id) keyset pages
+    # through both
+    reports = union_all(*[
+        filter_reports(
+            select(*_report_columns(log, order)).select_from(log)
+            .outerjoin(order, order.maintenance_log_id == log.id),
+            args, log, order
+        )
+        for log, order in ((MaintenanceLog, WorkOrder), (ArchivedMaintenanceLog, ArchivedWorkOrder))
+    ]).subquery()
+
+    columns = list(reports.c)
+    if not cursor:
+        columns += [
+            func.count().over().label('total_logs'),
+            func.count(reports.c.work_order_id).over().label('total_orders'),
+            func.count(reports.c.work_order_id).filter(reports.c.status == 'Completed').over()
+            .label('completed_orders'),
+        ]
+    query = select(*columns)
+    if cursor:
+        query = query.where(tuple_(reports.c.date, reports.c.id) < tuple_(*cursor))
+    return db.session.execute(
+        query.order_by(reports.c.date.desc(), reports.c.id.desc()).limit(limit + 1)
+    ).all()
+
+def _report_page(rows, next_cursor, first_page):
+    page = {
+        'maintenance_logs': [{
+            'id': row.id,
+            'date': row.date.strftime('%Y-%m-%d'),
+            'lot_number': row.lot_number,
+            'maintenance_class': row.maintenance_class,
+            'description': row.description[:REPORT_DESCRIPTION_CHARS],
+        } for row in rows],
+        'work_orders': [{
+            'id': row.work_order_id,
+            'status': row.status,
+            'priority': row.priority,
+            'scheduled_date': row.scheduled_date.strftime('%Y-%m-%d'),
+            'assigned_to': row.assigned_to,
+            'is_critical': bool(row.is_critical),
+        } for row in rows if row.work_order_id is not None],
+        'next_cursor': next_cursor,
+    }
+
+    if first_page:
+        total_logs = rows[0].total_logs if rows else 0
+        total_orders = rows[0].total_orders if rows else 0
+        completed_orders = rows[0].completed_orders if rows else 0
+        page.update({
+            'total_logs': total_logs,
+            'total_orders': total_orders,
+            'completed_orders': completed_orders,
+            'completion_rate': (completed_orders / total_orders * 100) if total_orders else 0.0,
+        })
+
+    return page
+
+def get_report_page(args):
+    limit = get_page_size(args, REPORT_PAGE_SIZE, REPORT_MAX_PAGE_SIZE)
+    cursor = decode_cursor(args.get('cursor'))
+    if include_archived(args):
+        rows = _report_rows_with_archive(args, cursor, limit)
+    else:
+        rows = _live_report_rows(args, cursor, limit)
+    next_cursor = encode_cursor(rows[limit - 1].date, rows[limit - 1].id) if len(rows) > limit else None
+    rows = rows[:limit]
+    return _report_page(rows, next_cursor, first_page=not cursor)
+
+def get_unread_notifications_page(args):
+    limit = get_page_size(args, NOTIFICATION_PAGE_SIZE, NOTIFICATION_MAX_PAGE_SIZE)
+
+    query = Notification.query.options(
+        joinedload(Notification.work_order).joinedload(WorkOrder.maintenance_log)
+    ).filter_by(is_read=False)
+
+    cursor = decode_cursor(args.get('cursor'))
+    if cursor:
+        query = query.filter(tuple_(Notification.created_at, Notification.id) < tuple_(*cursor))
+
+    rows = query.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1].created_at, rows[limit - 1].id) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+def mark_notifications_read(ids=None):
+    query = Notification.query.filter_by(is_read=False)
+    if ids is not None:
+        query = query.filter(Notification.id.in_(ids))
+    updated = query.update({Notification.is_read: True}, synchronize_session=False)
+    db.session.commit()
+    return updated
+
+def notification_payload(notification, lot_number=None):
+    return {
+        'id': notification.id,
+        'work_order_id': notification.work_order_id,
+        'lot_number': lot_number,
+        'company_id': notification.company_id,
+        'message': notification.message,
+        'created_at': notification.created_at.isoformat() if notification.created_at else None,
+    }
 
 def get_work_order_stats():
-    total = WorkOrder.query.count()
-    pending = WorkOrder.query.filter_by(status='Pending').count()
-    in_progress = WorkOrder.query.filter_by(status='In Progress').count()
-    completed = WorkOrder.query.filter_by(status='Completed').count()
-    
+    counts = dict(
+        db.session.query(WorkOrder.status, func.count(WorkOrder.id))
+        .group_by(WorkOrder.status)
+        .all()
+    )
+
     return {
-        'total': total,
-        'pending': pending,
-        'in_progress': in_progress,
-        'completed': completed
+        'total': sum(counts.values()),
+        'pending': counts.get('Pending', 0),
+        'in_progress': counts.get('In Progress', 0),
+        'completed': counts.get('Completed', 0)
     }
 
-def get_work_order_completion_trend(days=30):
-    end_date = datetime.utcnow().date()
-    start_date = end_date - timedelta(days=days)
-    
-    completed_orders = WorkOrder.query.filter(
-        WorkOrder.status == 'Completed',
-        WorkOrder.completed_date >= start_date,
-        WorkOrder.completed_date <= end_date
-    ).with_entities(
-        func.date(WorkOrder.completed_date).label('date'),
-        func.count().label('count')
-    ).group_by(func.date(WorkOrder.completed_date)).all()
-    
-    date_range = [start_date + timedelta(days=i) for i in range(days)]
-    trend_data = {date: 0 for date in date_range}
-    
-    for order in completed_orders:
-        trend_data[order.date] = order.count
-    
-    return [{'date': date.strftime('%Y-%m-%d'), 'count': count} for date, count in trend_data.items()]
-
-def generate_work_order_pdf(work_order_id):
-    work_order = WorkOrder.query.get(work_order_id)
+def get_cached_work_order_stats(version=None):
+    # One entry per company, stored with the work_orders write generation the
+    # caller read, so writes made through other workers show up without
+    # waiting for the TTL and replace the entry rather than adding another
+    key = ('work_order_stats', current_company_id())
+    cached = stats_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    stats = get_work_order_stats()
+    stats_cache.set(key, (version, stats), ttl=current_app.config['STATS_CACHE_TTL'])
+    return stats
+
+def invalidate_work_order_stats():
+    company_id = current_company_id()
+    if company_id is None:
+        stats_cache.invalidate()
+    else:
+        stats_cache.invalidate_where(lambda key: key[1] == company_id)
+
+def escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def search_maintenance_logs(term, limit=LOG_SEARCH_LIMIT):
+    term = (term or '').strip()
+    if not term:
+        return []
+
+    # Lot numbers match on a lower() prefix so the lookup can use
+    # ix_maintenance_logs_company_lot_number_lower; descriptions need a few characters
+    # before a substring match is worth running.
+    pattern = escape_like(term)
+    conditions = [func.lower(MaintenanceLog.lot_number).like(f'{pattern.lower()}%', escape='\\')]
+    if len(term) >= LOG_SEARCH_MIN_DESCRIPTION_CHARS:
+        conditions.append(MaintenanceLog.description.ilike(f'%{pattern}%', escape='\\'))
+
+    return db.session.query(
+        MaintenanceLog.id,
+        MaintenanceLog.date,
+        MaintenanceLog.lot_number,
+        MaintenanceLog.description
+    ).filter(or_(*conditions)).order_by(
+        MaintenanceLog.date.desc(), MaintenanceLog.id.desc()
+    ).limit(limit).all()
+
+def format_maintenance_log_label(log):
+    return f"{log.date} - {log.lot_number} - {log.description[:50]}..."
+
+def work_order_pdf_data(work_order):
+    maintenance_log = work_order.maintenance_log
+    return {
+        'id': work_order.id,
+        'status': work_order.status,
+        'assigned_to': work_order.assigned_to,
+        'scheduled_date': str(work_order.scheduled_date),
+        'priority': work_order.priority,
+        'is_critical': bool(work_order.is_critical),
+        'notes': work_order.notes,
+        'log_id': maintenance_log.id,
+        'log_date': str(maintenance_log.date),
+        'lot_number': maintenance_log.lot_number,
+        'maintenance_class': maintenance_log.maintenance_class,
+        'description': maintenance_log.description,
+    }
+
+def get_work_order_pdf_data(work_order_id):
+    work_order = db.session.get(WorkOrder, work_order_id, options=[joinedload(WorkOrder.maintenance_log)])
     if not work_order:
         return None
+    return work_order_pdf_data(work_order)
+
+def get_work_order_batch_pdf_data(args, limit):
+    query = WorkOrder.query.options(joinedload(WorkOrder.maintenance_log))
+
+    ids = [int(i) for i in args.getlist('id') if i.isdigit()]
+    if ids:
+        query = query.filter(WorkOrder.id.in_(ids))
+    else:
+        query = filter_work_orders(query, args)
 
-    pdf = FPDF()
-    pdf.add_page()
-
-    # Set up fonts
-    pdf.set_font("Arial", "B", 16)
-    pdf.cell(0, 10, "Work Order", ln=True, align="C")
-    pdf.set_font("Arial", "", 12)
-
-    # Work Order Details
-    pdf.cell(0, 10, f"Work Order ID: {work_order.id}", ln=True)
-    pdf.cell(0, 10, f"Status: {work_order.status}", ln=True)
-    pdf.cell(0, 10, f"Assigned To: {work_order.assigned_to}", ln=True)
-    pdf.cell(0, 10, f"Scheduled Date: {work_order.scheduled_date}", ln=True)
-    pdf.cell(0, 10, f"Priority: {work_order.priority}", ln=True)
-    pdf.cell(0, 10, f"Critical: {'Yes' if work_order.is_critical else 'No'}", ln=True)
-
-    # Maintenance Log Details
-    pdf.set_font("Arial", "B", 14)
-    pdf.cell(0, 10, "Maintenance Log Details", ln=True)
-    pdf.set_font("Arial", "", 12)
-    pdf.cell(0, 10, f"Log ID: {work_order.maintenance_log.id}", ln=True)
-    pdf.cell(0, 10, f"Date: {work_order.maintenance_log.date}", ln=True)
-    pdf.cell(0, 10, f"Lot Number: {work_order.maintenance_log.lot_number}", ln=True)
-    pdf.cell(0, 10, f"Maintenance Class: {work_order.maintenance_log.maintenance_class}", ln=True)
-
-    # Description
-    pdf.set_font("Arial", "B", 14)
-    pdf.cell(0, 10, "Description", ln=True)
-    pdf.set_font("Arial", "", 12)
-    pdf.multi_cell(0, 10, work_order.maintenance_log.description)
-
-    # Notes
-    if work_order.notes:
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Notes", ln=True)
-        pdf.set_font("Arial", "", 12)
-        pdf.multi_cell(0, 10, work_order.notes)
-
-    return pdf.output(dest='S').encode('latin-1')
+    work_orders = query.order_by(WorkOrder.scheduled_date, WorkOrder.id).limit(limit).all()
+    return [work_order_pdf_data(work_order) for work_order in work_orders]